@@ -0,0 +1,73 @@
+"""
+Benchmark do resolvedor de reações em cadeia: N bombas de raio 8 em
+corredores abertos, uma vencida, detonando todas em uma única passada.
+
+Uso:
+    python -m benchmarks.bench_chain --bombs 60 --size 41
+"""
+import argparse
+import random
+import time
+
+from src.game.bomb import Bomb
+from src.game.detonation import BlastRayTable, resolve_chain
+from src.game.game_map import GameMap, TILE_DESTRUCTIBLE, TILE_FLOOR
+from src.game.spatial_index import SpatialIndex
+from src.utils.constants import GAME_CONFIG
+
+
+def build_field(size: int, bombs: int, radius: int):
+    GAME_CONFIG['MAP_WIDTH'] = GAME_CONFIG['MAP_HEIGHT'] = size
+    game_map = GameMap(random.Random(0))
+    game_map.tiles[game_map.tiles == TILE_DESTRUCTIBLE] = TILE_FLOOR
+
+    # bombas a cada 4 tiles nas linhas ímpares (corredores sem pilares);
+    # a coluna x = 1 também é aberta e liga as linhas entre si
+    index = SpatialIndex(game_map.tile_size)
+    placed = []
+    for y in range(1, size - 1, 2):
+        for x in range(1, size - 1, 4):
+            if len(placed) >= bombs:
+                break
+            bomb = Bomb(x, y, GAME_CONFIG['BOMB_TIMER'], radius=radius)
+            placed.append(bomb)
+            index.add(bomb, (x, y))
+    return game_map, index, placed
+
+
+def run(size: int, bombs: int, radius: int, repeat: int) -> dict:
+    original = dict(GAME_CONFIG)
+    try:
+        game_map, index, placed = build_field(size, bombs, radius)
+        rays = BlastRayTable(game_map)
+
+        start = time.perf_counter()
+        chain = resolve_chain(placed[:1], index, rays)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            resolve_chain(placed[:1], index, rays)
+        warm = (time.perf_counter() - start) / repeat
+    finally:
+        GAME_CONFIG.clear()
+        GAME_CONFIG.update(original)
+
+    return {"bombs": len(placed), "detonated": len(chain), "cold_ms": cold * 1000, "warm_ms": warm * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chain-reaction resolver benchmark")
+    parser.add_argument("--bombs", type=int, default=60)
+    parser.add_argument("--size", type=int, default=41)
+    parser.add_argument("--radius", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    result = run(args.size, args.bombs, args.radius, args.repeat)
+    print(f"{result['detonated']}/{result['bombs']} bombas detonadas: "
+          f"{result['cold_ms']:.3f} ms (raios frios), {result['warm_ms']:.3f} ms (raios em cache)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Memória por entidade (tracemalloc): Player, Enemy, Bomb, Explosion e
+PowerUp avulsos, e inimigos/bombas alocados nos pools SoA do engine
+(src.game.entity_pool), mais o tempo de varrer as posições de N inimigos
+objeto a objeto e pelas colunas do pool.
+
+Uso:
+    python -m benchmarks.bench_entity_memory --count 10000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from src.game.bomb import Bomb
+from src.game.enemy import Enemy
+from src.game.explosion import Explosion
+from src.game.player import Player
+from src.game.powerup import PowerUp, PowerUpType
+from src.game.sim_clock import SimClock
+
+try:
+    from src.game.entity_pool import BombPool, EnemyPool
+except ImportError:  # árvore anterior aos pools: mede só os objetos avulsos
+    BombPool = EnemyPool = None
+
+
+def bytes_per_entity(factory, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    # a lista que segura as entidades não conta
+    return (after - before) / count - 8
+
+
+def scan_us(enemies, pool, count: int) -> tuple:
+    start = time.perf_counter()
+    total = 0.0
+    for enemy in enemies:
+        total += enemy.x + enemy.y
+    by_object = time.perf_counter() - start
+    if pool is None:
+        return by_object * 1e6, float("nan"), float("nan")
+    start = time.perf_counter()
+    xs, ys = pool.x, pool.y
+    total = 0.0
+    for slot in range(len(pool)):
+        total += xs[slot] + ys[slot]
+    by_column = time.perf_counter() - start
+    start = time.perf_counter()
+    total = float((pool.column("x") + pool.column("y")).sum())
+    vectorized = time.perf_counter() - start
+    return by_object * 1e6, by_column * 1e6, vectorized * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entity memory footprint report")
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+    n = args.count
+    clock = SimClock()
+    rng = random.Random(1)
+    tiles = [(1, 1), (1, 2), (1, 3), (2, 1), (3, 1)]
+
+    rows = [
+        ("Player", lambda i: Player(i % 50, i // 50, 3.0, clock)),
+        ("Enemy", lambda i: Enemy(i % 50, i // 50, 2.0, clock, rng)),
+        ("Bomb", lambda i: Bomb(i % 50, i // 50, 3.0, clock, radius=2)),
+        ("Explosion (5 tiles)", lambda i: Explosion(tiles, clock)),
+        ("PowerUp", lambda i: PowerUp(i % 50, i // 50, PowerUpType.FIRE)),
+    ]
+    if EnemyPool is not None:
+        enemy_pool, bomb_pool = EnemyPool(), BombPool()
+        rows += [
+            ("Enemy no EnemyPool", lambda i: Enemy(i % 50, i // 50, 2.0, clock, rng, pool=enemy_pool)),
+            ("Bomb no BombPool", lambda i: Bomb(i % 50, i // 50, 3.0, clock, radius=2, pool=bomb_pool)),
+        ]
+    for name, factory in rows:
+        print(f"{name:22s} {bytes_per_entity(factory, n):8.0f} bytes/entidade")
+
+    pool = EnemyPool() if EnemyPool is not None else None
+    if pool is not None:
+        enemies = [Enemy(i % 50, i // 50, 2.0, clock, rng, pool=pool) for i in range(n)]
+    else:
+        enemies = [Enemy(i % 50, i // 50, 2.0, clock, rng) for i in range(n)]
+    by_object, by_column, vectorized = scan_us(enemies, pool, n)
+    print(f"somar x+y de {n} inimigos: {by_object:.0f} µs por objeto, {by_column:.0f} µs pelas colunas "
+          f"do pool, {vectorized:.0f} µs com column() + NumPy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark da perseguição por flow field: 200 inimigos num mapa grande,
+comparando o tick do engine com ENEMY_AI = "chase" e "wander" e o custo
+de uma BFS compartilhada contra uma BFS por inimigo.
+
+Uso:
+    python -m benchmarks.bench_flow_field --enemies 200 --size 101
+"""
+import argparse
+import random
+import time
+
+from src.game.actions import Action
+from src.game.enemy import Enemy
+from src.game.flow_field import FlowField
+from src.game.game_engine import GameEngine
+from src.utils.constants import GAME_CONFIG
+
+MOVES = (Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN)
+
+
+def build_engine(size: int, enemies: int) -> GameEngine:
+    GAME_CONFIG['MAP_WIDTH'] = GAME_CONFIG['MAP_HEIGHT'] = size
+    ts = GAME_CONFIG['TILE_SIZE']
+    engine = GameEngine(size * ts, size * ts, headless=True, seed=7)
+    engine.player.lives = 10 ** 9  # contato não encerra a partida no meio da medição
+
+    rng = random.Random(8)
+    free = [(int(x), int(y)) for x, y in engine.game_map.free_tiles() if x + y > 6]
+    for gx, gy in rng.sample(free, max(0, enemies - len(engine.enemies))):
+        enemy = Enemy(gx, gy, GAME_CONFIG['ENEMY_SPEED'], engine.sim_clock, engine.rng.enemies,
+                      pool=engine.enemy_pool)
+        engine.enemies.append(enemy)
+        engine.enemy_index.add(enemy, (gx, gy))
+    return engine
+
+
+def run_ticks(size: int, enemies: int, ticks: int, ai: str) -> dict:
+    GAME_CONFIG['ENEMY_AI'] = ai
+    engine = build_engine(size, enemies)
+    policy = random.Random(9)
+    move = Action.NONE
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if tick % 15 == 0:
+            move = policy.choice(MOVES)
+        engine.update(move)
+    elapsed = time.perf_counter() - start
+    return {"ticks_per_s": ticks / elapsed, "recomputes": engine.flow_field.recomputes,
+            "enemies": len(engine.enemies)}
+
+
+def shared_vs_per_enemy(size: int, enemies: int, repeat: int) -> dict:
+    engine = build_engine(size, enemies)
+    field = FlowField(engine.game_map)
+    target = engine.game_map.world_to_grid(*engine.player.get_position())
+    starts = [engine.enemy_index.tile_of(e) for e in engine.enemies]
+
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        field.invalidate()
+        field.update(target)
+        for gx, gy in starts:
+            field.direction_at(gx, gy)
+    shared = (time.perf_counter() - begin) / repeat
+
+    # alternativa ingênua: uma busca completa por inimigo (limite superior de A*)
+    begin = time.perf_counter()
+    for tile in starts:
+        field.invalidate()
+        field.update(tile)
+    per_enemy = time.perf_counter() - begin
+    return {"shared_ms": shared * 1000, "per_enemy_ms": per_enemy * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flow-field enemy pathfinding benchmark")
+    parser.add_argument("--enemies", type=int, default=200)
+    parser.add_argument("--size", type=int, default=101)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    original = dict(GAME_CONFIG)
+    try:
+        for ai in ("wander", "chase"):
+            result = run_ticks(args.size, args.enemies, args.ticks, ai)
+            print(f"{ai:6s}: {result['ticks_per_s']:8.0f} ticks/s "
+                  f"({result['enemies']} inimigos, {result['recomputes']} recálculos do campo)")
+        cost = shared_vs_per_enemy(args.size, args.enemies, args.repeat)
+        print(f"BFS compartilhada + {args.enemies} consultas: {cost['shared_ms']:.2f} ms; "
+              f"uma BFS por inimigo: {cost['per_enemy_ms']:.2f} ms")
+    finally:
+        GAME_CONFIG.clear()
+        GAME_CONFIG.update(original)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark do modo headless: mede ticks/segundo de GameEngine.update
+numa partida com seed fixa e política aleatória (também com seed).
+
+Uso:
+    python -m benchmarks.bench_headless --ticks 20000 --seed 42
+"""
+import argparse
+import random
+import time
+
+from src.game.actions import Action
+from src.game.game_engine import GameEngine
+from src.utils.constants import GAME_CONFIG
+
+MOVES = [Action.NONE, Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN]
+
+
+def run(ticks: int, seed: int) -> dict:
+    policy = random.Random(seed + 1)
+    engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                        headless=True, seed=seed)
+
+    games = 1
+    action = Action.NONE
+    start = time.perf_counter()
+    for tick in range(ticks):
+        # troca de direção de tempos em tempos; bomba ocasional
+        if tick % 15 == 0:
+            action = policy.choice(MOVES)
+        engine.update(action | (Action.BOMB if policy.random() < 0.02 else Action.NONE))
+        if engine.is_game_over() or engine.is_victory():
+            engine.reset()
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "games": games,
+        "seconds": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless GameEngine ticks/sec benchmark")
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    result = run(args.ticks, args.seed)
+    print(f"{result['ticks']} ticks em {result['seconds']:.3f}s "
+          f"({result['ticks_per_sec']:.0f} ticks/s, {result['games']} partidas)")
+
+
+if __name__ == "__main__":
+    main()
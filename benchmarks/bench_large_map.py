@@ -0,0 +1,89 @@
+"""
+Mapas grandes com câmera: custo de update() e render() por frame e
+memória da camada estática para mapas de tamanhos diferentes, com a mesma
+densidade de inimigos. Com culling e chunks, os tempos e a memória devem
+ficar praticamente constantes; a última coluna é quanto uma surface única
+do mapa inteiro ocuparia.
+
+Uso:
+    python -m benchmarks.bench_large_map --sizes 20 100 500 --frames 600
+"""
+import argparse
+import random
+import time
+
+import pygame
+
+from src.game.actions import Action
+from src.game.enemy import Enemy
+from src.game.game_engine import GameEngine
+from src.utils.constants import GAME_CONFIG
+
+ENEMIES_PER_TILE = 5 / (20 * 15)   # a densidade do mapa padrão
+
+
+def build_engine(size: int, seed: int) -> GameEngine:
+    GAME_CONFIG['MAP_WIDTH'] = GAME_CONFIG['MAP_HEIGHT'] = size
+    engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=seed)
+    engine.player.lives = 10 ** 9
+
+    rng = random.Random(seed)
+    free = [(int(x), int(y)) for x, y in engine.game_map.free_tiles() if x + y > 6]
+    wanted = int(size * size * ENEMIES_PER_TILE)
+    for gx, gy in rng.sample(free, max(0, min(len(free), wanted) - len(engine.enemies))):
+        enemy = Enemy(gx, gy, GAME_CONFIG['ENEMY_SPEED'], engine.sim_clock, engine.rng.enemies,
+                      pool=engine.enemy_pool)
+        engine.enemies.append(enemy)
+        engine.enemy_index.add(enemy, (gx, gy))
+    return engine
+
+
+def run(size: int, frames: int, seed: int) -> dict:
+    engine = build_engine(size, seed)
+    ts = engine.game_map.tile_size
+    policy = random.Random(seed)
+    update_seconds = render_seconds = 0.0
+    for frame in range(frames):
+        # passeio na diagonal (teleporte a cada 8 frames): a câmera rola pelo mapa
+        if frame % 8 == 0:
+            step = 1 + frame // 8 % (size - 2)
+            engine.player.x = engine.player.y = step * ts
+            engine.player.invincible_until = float("inf")
+        action = Action.BOMB if policy.random() < 0.05 else Action.NONE
+
+        start = time.perf_counter()
+        engine.update(action)
+        update_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        engine.render()
+        render_seconds += time.perf_counter() - start
+        if engine.victory or engine.game_over:
+            break
+    chunks = engine.game_map._chunks.values()
+    map_w, map_h = engine.game_map.pixel_size()
+    return {
+        "enemies": len(engine.enemies),
+        "update_us": update_seconds / (frame + 1) * 1e6,
+        "render_us": render_seconds / (frame + 1) * 1e6,
+        "chunk_mb": sum(chunk.get_width() * chunk.get_height() * chunk.get_bytesize() for chunk in chunks) / 2 ** 20,
+        "full_mb": map_w * map_h * engine.screen.get_bytesize() / 2 ** 20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Large map camera/culling/chunk benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 500])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.font.init()
+    for size in args.sizes:
+        result = run(size, args.frames, args.seed)
+        print(f"{size:4d}x{size:<4d} {result['enemies']:5d} inimigos: update {result['update_us']:6.0f} µs, "
+              f"render {result['render_us']:6.0f} µs, chunks {result['chunk_mb']:5.1f} MB "
+              f"(mapa inteiro: {result['full_mb']:7.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
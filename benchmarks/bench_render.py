@@ -0,0 +1,100 @@
+"""
+Render completo (fill/flip da tela inteira) x dirty rects: tempo de
+render() e pixels enviados ao display por frame numa partida scriptada,
+com HUD e chamas. Headless: mede o desenho e a área que iria ao display.
+Depois, só as chamas: explosões de raio 8 sobrepostas desenhadas tile a
+tile (alpha por pixel), uma surface por explosão e a camada combinada.
+
+Uso:
+    python -m benchmarks.bench_render --frames 600 --explosions 6
+"""
+import argparse
+import random
+import time
+
+import pygame
+
+from src.game.actions import Action
+from src.game.explosion import Explosion
+from src.game.game_engine import RENDER_MODES, GameEngine
+from src.utils.constants import COLORS, GAME_CONFIG
+from src.utils.sprite_atlas import atlas
+
+MOVES = (Action.NONE, Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN)
+
+
+def run(render_mode: str, frames: int, seed: int) -> dict:
+    engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True,
+                        seed=seed, render_mode=render_mode)
+    engine.player.lives = 10 ** 9
+    policy = random.Random(seed)
+    move = Action.NONE
+    render_seconds = 0.0
+    pixels = 0
+    for frame in range(frames):
+        if frame % 20 == 0:
+            move = policy.choice(MOVES)
+        engine.update(move | (Action.BOMB if policy.random() < 0.05 else 0))
+        if engine.victory:
+            engine.reset(seed)
+        start = time.perf_counter()
+        engine.render()
+        render_seconds += time.perf_counter() - start
+        pixels += engine.pixels_pushed
+    return {"render_us": render_seconds / frames * 1e6, "pixels": pixels / frames}
+
+
+def run_flames(count: int, frames: int, seed: int) -> dict:
+    """µs/frame para desenhar `count` explosões sobrepostas de três jeitos."""
+    rng = random.Random(seed)
+    width, height = GAME_CONFIG['MAP_WIDTH'], GAME_CONFIG['MAP_HEIGHT']
+    ts = GAME_CONFIG['TILE_SIZE']
+    explosions = []
+    for _ in range(count):
+        cx, cy = rng.randrange(1, width - 1), rng.randrange(1, height - 1)
+        tiles = {(cx, cy)}
+        tiles.update((x, cy) for x in range(max(1, cx - 8), min(width - 1, cx + 9)))
+        tiles.update((cx, y) for y in range(max(1, cy - 8), min(height - 1, cy + 9)))
+        explosions.append(Explosion(sorted(tiles)))
+    screen = pygame.Surface((width * ts, height * ts))
+
+    alpha_tile = pygame.Surface((ts, ts), pygame.SRCALPHA)
+    alpha_tile.fill((*COLORS['ORANGE'], 180))
+    merged = atlas.flame_overlay({tile for expl in explosions for tile in expl.tiles})
+    painters = {
+        "por tile": lambda: [screen.blit(alpha_tile, (gx * ts, gy * ts))
+                             for expl in explosions for gx, gy in expl.tiles],
+        "por explosão": lambda: [expl.render(screen) for expl in explosions],
+        "combinada": lambda: screen.blit(*merged),
+    }
+    results = {}
+    for name, paint in painters.items():
+        paint()
+        start = time.perf_counter()
+        for _ in range(frames):
+            paint()
+        results[name] = (time.perf_counter() - start) / frames * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full redraw vs dirty-rect rendering benchmark")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--explosions", type=int, default=6)
+    args = parser.parse_args()
+
+    pygame.font.init()
+    screen = GAME_CONFIG['SCREEN_WIDTH'] * GAME_CONFIG['SCREEN_HEIGHT']
+    for mode in RENDER_MODES:
+        result = run(mode, args.frames, args.seed)
+        print(f"{mode:5s}: render {result['render_us']:7.0f} µs/frame, "
+              f"{result['pixels']:9.0f} pixels/frame ({result['pixels'] / screen:.1%} da tela)")
+
+    flames = run_flames(args.explosions, args.frames, args.seed)
+    print(f"{args.explosions} explosões de raio 8: " +
+          ", ".join(f"{name} {us:.0f} µs" for name, us in flames.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark de snapshot/restore/clone do GameEngine: tamanho do snapshot
+em bytes e tempo de ida e volta. deepcopy nem é opção (pygame.Surface e
+memoryviews não são copiáveis); a referência é a alternativa via replay:
+recriar o engine pela seed e reexecutar as ações até o mesmo tick.
+
+Uso:
+    python -m benchmarks.bench_snapshot --size 41 --enemies 50
+"""
+import argparse
+import random
+import time
+
+from src.game.actions import Action
+from src.game.enemy import Enemy
+from src.game.game_engine import GameEngine
+from src.utils.constants import GAME_CONFIG
+
+MOVES = (Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN)
+WARMUP_TICKS = 300
+
+
+def build_engine(size: int, enemies: int, ticks: int = WARMUP_TICKS) -> GameEngine:
+    GAME_CONFIG['MAP_WIDTH'] = GAME_CONFIG['MAP_HEIGHT'] = size
+    GAME_CONFIG['ENEMY_AI'] = 'wander'
+    engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=7)
+    engine.player.lives = 10 ** 9
+
+    rng = random.Random(8)
+    free = [(int(x), int(y)) for x, y in engine.game_map.free_tiles() if x + y > 6]
+    for gx, gy in rng.sample(free, max(0, enemies - len(engine.enemies))):
+        enemy = Enemy(gx, gy, GAME_CONFIG['ENEMY_SPEED'], engine.sim_clock, engine.rng.enemies,
+                      pool=engine.enemy_pool)
+        engine.enemies.append(enemy)
+        engine.enemy_index.add(enemy, (gx, gy))
+
+    # meio de partida: bombas pendentes e chamas acesas
+    policy = random.Random(9)
+    move = Action.NONE
+    for tick in range(ticks):
+        if tick % 15 == 0:
+            move = policy.choice(MOVES)
+        engine.update(move | (Action.BOMB if tick % 40 == 0 else 0))
+    return engine
+
+
+def per_call_us(func, min_time: float = 0.3) -> float:
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GameEngine snapshot/restore/clone benchmark")
+    parser.add_argument("--size", type=int, nargs="+", default=[15, 41, 101])
+    parser.add_argument("--enemies", type=int, default=50)
+    args = parser.parse_args()
+
+    original = dict(GAME_CONFIG)
+    try:
+        for size in args.size:
+            engine = build_engine(size, args.enemies)
+            data = engine.snapshot()
+            target = engine.clone()
+            snapshot_us = per_call_us(engine.snapshot)
+            restore_us = per_call_us(lambda: target.restore(data))
+            clone_us = per_call_us(engine.clone)
+            replay_us = per_call_us(lambda: build_engine(size, args.enemies))
+            print(f"{size}x{size}, {len(engine.enemies)} inimigos, {len(engine.bombs)} bombas, "
+                  f"{len(engine.explosions)} explosões: snapshot {len(data)} bytes | "
+                  f"snapshot {snapshot_us:.0f} µs + restore {restore_us:.0f} µs | "
+                  f"clone {clone_us:.0f} µs vs reexecutar {WARMUP_TICKS} ticks {replay_us:.0f} µs")
+    finally:
+        GAME_CONFIG.clear()
+        GAME_CONFIG.update(original)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""
+Suíte de microbenchmarks dos caminhos quentes do engine, com baseline
+versionado e modo de comparação que falha em regressões.
+
+Uso:
+    python -m benchmarks.run_benchmarks                      # só mede
+    python -m benchmarks.run_benchmarks --save-baseline      # grava benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --compare            # falha (exit 1) se regredir
+    python -m benchmarks.run_benchmarks --compare --threshold 15 --filter map
+
+Todo commit que mexe em desempenho (ou acrescenta casos) regrava o baseline
+no mesmo commit; --compare falha em casos que não estão no baseline.
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from src.database.score_manager import ScoreManager
+from src.game.actions import Action
+from src.game.bomb import Bomb
+from src.game.enemy import Enemy
+from src.game.game_engine import GameEngine
+from src.game.game_map import GameMap
+from src.game.player import Player
+from src.game.spatial_index import SpatialIndex
+from src.utils.constants import GAME_CONFIG
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD_PCT = 25.0
+
+MAP_SIZES = ((20, 15), (41, 31), (101, 101))
+
+# tamanhos de tabela de recordes (max_scores) medidos no ScoreManager
+SCORE_TABLE_SIZES = (10, 100, 1000)
+
+
+@contextlib.contextmanager
+def config_override(**overrides):
+    original = {key: GAME_CONFIG[key] for key in overrides}
+    GAME_CONFIG.update(overrides)
+    try:
+        yield
+    finally:
+        GAME_CONFIG.update(original)
+
+
+def _map_config(size: Tuple[int, int]) -> dict:
+    return {"MAP_WIDTH": size[0], "MAP_HEIGHT": size[1]}
+
+
+def _size_label(size: Tuple[int, int]) -> str:
+    return f"{size[0]}x{size[1]}"
+
+
+# ---------------------------------------------------------------------------
+# Casos
+# ---------------------------------------------------------------------------
+def engine_update(size):
+    def setup():
+        engine = GameEngine(size[0] * GAME_CONFIG['TILE_SIZE'], size[1] * GAME_CONFIG['TILE_SIZE'],
+                            headless=True, seed=1)
+        policy = random.Random(2)
+        moves = [Action.NONE, Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN]
+
+        def step():
+            engine.update(policy.choice(moves) | (Action.BOMB if policy.random() < 0.02 else 0))
+            if engine.game_over or engine.victory:
+                engine.reset(1)
+        return step
+    return setup
+
+
+def engine_render(size, render_mode: str = "full"):
+    def setup():
+        pygame.font.init()
+        engine = GameEngine(size[0] * GAME_CONFIG['TILE_SIZE'], size[1] * GAME_CONFIG['TILE_SIZE'],
+                            headless=True, seed=1, render_mode=render_mode)
+        for _ in range(30):
+            engine.update(Action.BOMB | Action.RIGHT)
+        if render_mode == "full":
+            return engine.render
+
+        # dirty rects: sem movimento não haveria o que redesenhar; cada
+        # chamada inclui um tick (inimigos andando, timer das bombas)
+        engine.player.lives = 10 ** 9
+        engine.render()
+
+        def step():
+            engine.update(Action.NONE)
+            engine.render()
+        return step
+    return setup
+
+
+def player_can_move_to(bombs: int):
+    def setup():
+        game_map = GameMap(random.Random(1))
+        player = Player(1, 1, GAME_CONFIG['PLAYER_SPEED'])
+        index = SpatialIndex(game_map.tile_size)
+        free = [tuple(int(v) for v in t) for t in game_map.free_tiles()]
+        for x, y in random.Random(3).sample(free, min(bombs, len(free))):
+            index.add(Bomb(x, y, 3.0), (x, y))
+        x, y = player.get_position()
+
+        def step():
+            player._can_move_to(x + 3, y, game_map, index, None)
+            player._can_move_to(x, y + 3, game_map, index, None)
+        return step
+    return setup
+
+
+def enemy_can_move_to():
+    # checa só os tiles em volta do inimigo: não depende do tamanho do mapa
+    def setup():
+        game_map = GameMap(random.Random(1))
+        enemy = Enemy(1, 1, GAME_CONFIG['ENEMY_SPEED'], rng=random.Random(1))
+        x, y = enemy.get_position()
+
+        def step():
+            enemy._can_move_to(x + 1.5, y, game_map)
+            enemy._can_move_to(x, y + 1.5, game_map)
+        return step
+    return setup
+
+
+def bomb_explosion_positions(radius: int):
+    def setup():
+        game_map = GameMap(random.Random(1))
+        bomb = Bomb(game_map.width // 2 | 1, game_map.height // 2 | 1, 3.0, radius=radius)
+
+        def step():
+            bomb.get_explosion_positions(game_map)
+        return step
+    return setup
+
+
+def map_render(size):
+    def setup():
+        game_map = GameMap(random.Random(1))
+        screen = pygame.Surface(game_map.pixel_size())
+        game_map.render(screen)  # constrói o cache; mede o caminho por frame
+        destructible = [tuple(int(v) for v in t) for t in game_map.destructible_tiles()]
+        walls = iter(destructible)
+
+        def step():
+            # um bloco destruído a cada frame (até acabarem): inclui o redraw sujo
+            tile = next(walls, None)
+            if tile is not None:
+                game_map.destroy_wall(*tile)
+            game_map.render(screen)
+        return step
+    return setup
+
+
+def map_generate(size):
+    def setup():
+        game_map = GameMap(random.Random(1))
+        return game_map._generate_map
+    return setup
+
+
+def _score_manager(entries: int) -> Tuple[ScoreManager, str]:
+    """ScoreManager em diretório temporário com a tabela já cheia."""
+    directory = tempfile.mkdtemp()
+    manager = ScoreManager(os.path.join(directory, "scores.json"))
+    manager.max_scores = entries
+    for i in range(entries):
+        manager.add_score(f"P{i}", i * 10)
+    return manager, directory
+
+
+def _close_score_manager(manager: ScoreManager, directory: str):
+    manager.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def score_add(entries: int):
+    def setup():
+        manager, directory = _score_manager(entries)
+        scores = random.Random(4)
+
+        def step():
+            manager.add_score("Bench", scores.randrange(entries * 10))
+        step.cleanup = lambda: _close_score_manager(manager, directory)
+        return step
+    return setup
+
+
+def score_get_high_scores(entries: int):
+    def setup():
+        manager, directory = _score_manager(entries)
+
+        def step():
+            manager.get_high_scores()
+        step.cleanup = lambda: _close_score_manager(manager, directory)
+        return step
+    return setup
+
+
+def build_cases() -> List[Tuple[str, dict, Callable]]:
+    """(nome, overrides de GAME_CONFIG, fábrica)."""
+    cases = []
+    for size in MAP_SIZES:
+        label, config = _size_label(size), _map_config(size)
+        cases.append((f"engine.update[{label}]", config, engine_update(size)))
+        cases.append((f"engine.render[{label}]", config, engine_render(size)))
+        cases.append((f"engine.update+render_dirty[{label}]", config, engine_render(size, "dirty")))
+        cases.append((f"map.render[{label}]", config, map_render(size)))
+        cases.append((f"map._generate_map[{label}]", config, map_generate(size)))
+    cases.append(("enemy._can_move_to", {}, enemy_can_move_to()))
+    for bombs in (0, 6, 200):
+        cases.append((f"player._can_move_to[bombs={bombs}]", {}, player_can_move_to(bombs)))
+    for radius in (2, 8):
+        cases.append((f"bomb.get_explosion_positions[r={radius}]", _map_config((41, 31)),
+                      bomb_explosion_positions(radius)))
+    for entries in SCORE_TABLE_SIZES:
+        cases.append((f"scores.add_score[n={entries}]", {}, score_add(entries)))
+        cases.append((f"scores.get_high_scores[n={entries}]", {}, score_get_high_scores(entries)))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+def measure(fn: Callable[[], None], min_time: float = 0.05, repeat: int = 5) -> float:
+    """
+    Microssegundos por chamada: melhor de `repeat` rodadas de ~min_time
+    segundos, com o GC desligado (como o timeit) para reduzir o ruído.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(fn, min_time, repeat)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _measure(fn: Callable[[], None], min_time: float, repeat: int) -> float:
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 5 or number >= 1 << 20:
+            break
+        number *= 2
+    number = max(1, int(number * (min_time / 5) / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def run_suite(name_filter: Optional[str] = None, min_time: float = 0.05,
+              repeat: int = 5) -> Dict[str, float]:
+    results = {}
+    for name, config, factory in build_cases():
+        if name_filter and name_filter not in name:
+            continue
+        with config_override(**config):
+            fn = factory()
+            try:
+                results[name] = measure(fn, min_time, repeat)
+            finally:
+                cleanup = getattr(fn, "cleanup", None)
+                if cleanup:
+                    cleanup()
+        print(f"{name:45s} {results[name]:12.2f} us", flush=True)
+    return results
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, "r") as file:
+        baseline = json.load(file)
+    if baseline.get("schema_version") != SCHEMA_VERSION:
+        raise SystemExit(f"baseline {path} tem schema_version {baseline.get('schema_version')}, "
+                         f"esperado {SCHEMA_VERSION}; regrave com --save-baseline")
+    return baseline
+
+
+def save_baseline(path: str, results: Dict[str, float], threshold_pct: float):
+    baseline = {
+        "schema_version": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "threshold_pct": threshold_pct,
+        "unit": "us_per_call",
+        "results": {name: round(value, 3) for name, value in sorted(results.items())},
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+
+
+def compare(results: Dict[str, float], baseline: dict, threshold_pct: float) -> List[str]:
+    """
+    Lista de falhas (vazia = ok): regressões acima do limite e casos sem
+    valor no baseline, que de outro modo nunca seriam comparados.
+    """
+    regressions = []
+    print(f"\n{'caso':45s} {'baseline':>12s} {'atual':>12s} {'delta':>8s}")
+    for name, current in sorted(results.items()):
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:45s} {'-':>12s} {current:12.2f}     SEM BASELINE")
+            regressions.append(f"{name}: sem baseline (regrave com --save-baseline)")
+            continue
+        delta = (current - reference) / reference * 100.0
+        flag = ""
+        if delta > threshold_pct:
+            flag = "  REGRESSÃO"
+            regressions.append(f"{name}: {reference:.2f} -> {current:.2f} us (+{delta:.1f}%)")
+        print(f"{name:45s} {reference:12.2f} {current:12.2f} {delta:+7.1f}%{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Engine hot-path microbenchmarks")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="regressão máxima em %% (padrão: o do baseline, ou 25)")
+    parser.add_argument("--filter", default=None, help="só casos cujo nome contém o texto")
+    parser.add_argument("--min-time", type=float, default=0.05, help="segundos por rodada")
+    parser.add_argument("--repeat", type=int, default=5, help="rodadas por caso (vale a melhor)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.filter, args.min_time, args.repeat)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, args.threshold or DEFAULT_THRESHOLD_PCT)
+        print(f"\nbaseline gravado em {args.baseline}")
+
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        threshold = args.threshold or baseline.get("threshold_pct", DEFAULT_THRESHOLD_PCT)
+        regressions = compare(results, baseline, threshold)
+        if regressions:
+            print(f"\n{len(regressions)} falha(s) (regressão acima de {threshold:.0f}% ou caso sem baseline):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nsem regressões acima de {threshold:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
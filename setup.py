@@ -9,11 +9,13 @@ setup(
     packages=find_packages(),
     install_requires=[
         "pygame>=2.5.0",
+        "numpy>=1.21",
     ],
     python_requires=">=3.7",
     entry_points={
         "console_scripts": [
             "bomberman=src.main:main",
+            "bomberman-sim=src.sim.batch_runner:main",
         ],
     },
     classifiers=[
@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def write_json_atomic(path: str, data: dict):
+    """
+    Grava num arquivo temporário do mesmo diretório e troca com os.replace:
+    quem lê vê o arquivo antigo inteiro ou o novo inteiro, nunca um pedaço.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(data, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class BackgroundWriter:
+    """
+    Thread que persiste snapshots fora do loop do jogo. Só o snapshot mais
+    recente importa: submits que chegam enquanto uma escrita está em curso
+    são agrupados numa única escrita seguinte.
+    """
+
+    def __init__(self, write: Callable[[dict], None], name: str = "score-writer"):
+        self._write = write
+        self._cond = threading.Condition()
+        self._pending: Optional[dict] = None
+        self._busy = False
+        self._closed = False
+        self.writes = 0
+        self.last_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: dict):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BackgroundWriter já foi fechado")
+            self._pending = snapshot
+            self._cond.notify_all()
+
+    @property
+    def idle(self) -> bool:
+        """Nada pendente nem em escrita."""
+        with self._cond:
+            return self._pending is None and not self._busy
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Espera o último snapshot chegar ao disco; False se estourar o timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return  # fechado e sem pendências
+                snapshot, self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._write(snapshot)
+                self.writes += 1
+            except Exception as error:  # disco cheio etc.: mantém a thread viva
+                self.last_error = error
+                logger.exception("falha ao gravar %s", self._thread.name)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -1,47 +1,158 @@
 import json
 import os
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+from .background_writer import BackgroundWriter, write_json_atomic
+from .sqlite_store import SqliteScoreStore
+
+BACKENDS = ("json", "sqlite")
+DEFAULT_PATHS = {"json": "data/scores.json", "sqlite": "data/scores.db"}
+
 
 class ScoreManager:
-    def __init__(self, database_path: str = "data/scores.json"):
-        self.database_path = database_path
+    def __init__(self, database_path: Optional[str] = None, backend: str = "json",
+                 background_writes: bool = True):
+        """
+        backend="json": top `max_scores` num arquivo JSON (formato original).
+        Com background_writes, as gravações (atômicas) rodam numa thread e
+        o jogo nunca espera o disco; chame close() ao sair.
+        backend="sqlite": histórico completo em SQLite (SqliteScoreStore); na
+        criação, importa o scores.json vizinho (mesmo nome, extensão .json)
+        se ele existir.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend desconhecido: {backend!r} (esperado um de {BACKENDS})")
+        self.backend = backend
+        self.database_path = database_path or DEFAULT_PATHS[backend]
         self.max_scores = 10
-        self._ensure_database_exists()
+        self._sqlite: Optional[SqliteScoreStore] = None
+        self._writer: Optional[BackgroundWriter] = None
+
+        # índice em memória do arquivo: só relê o JSON se (mtime, tamanho)
+        # mudar por fora; nossas próprias escritas atualizam o índice direto
+        # (e, com escrita pendente na thread, a memória é a versão mais nova)
+        self._data: Optional[dict] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._high_scores: List[Tuple[str, int]] = []
+        self._players: Dict[str, List[int]] = {}   # nome em minúsculas -> [jogos, total, maior]
+        self._unique_players = 0
+
+        if backend == "sqlite":
+            self._open_sqlite()
+        else:
+            if background_writes:
+                self._writer = BackgroundWriter(self._write_snapshot)
+            self._ensure_database_exists()
+    
+    def _open_sqlite(self):
+        self._sqlite = SqliteScoreStore(self.database_path)
+        legacy_json = os.path.splitext(self.database_path)[0] + ".json"
+        if os.path.exists(legacy_json):
+            self._sqlite.import_json(legacy_json)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Espera as gravações pendentes chegarem ao disco."""
+        if self._writer is not None:
+            return self._writer.flush(timeout)
+        return True
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._sqlite is not None:
+            self._sqlite.close()
     
     def _ensure_database_exists(self):
         os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
         
         if not os.path.exists(self.database_path):
-            self._create_empty_database()
+            self._create_empty_database(sync=True)
     
-    def _create_empty_database(self):
+    def _create_empty_database(self, sync: bool = False):
         empty_data = {
             "scores": [],
             "last_updated": datetime.now().isoformat()
         }
-        self._save_data(empty_data)
+        self._save_data(empty_data, sync)
+    
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.database_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
     
     def _load_data(self) -> dict:
+        if self._data is not None:
+            if self._writer is not None and not self._writer.idle:
+                return self._data
+            if self._file_signature() == self._signature:
+                return self._data
+        signature = self._file_signature()
         try:
             with open(self.database_path, 'r') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self._create_empty_database()
-            return self._load_data()
+                data = json.load(file)
+        except json.JSONDecodeError:
+            # nunca apaga o ranking: guarda o arquivo ruim para recuperação
+            os.replace(self.database_path, self.database_path + ".corrupt")
+            return self._recover()
+        except FileNotFoundError:
+            return self._recover()
+        self._set_index(data, signature)
+        return data
     
-    def _save_data(self, data: dict):
+    def _recover(self) -> dict:
+        """Arquivo sumiu ou está ilegível: regrava da memória (ou vazio)."""
+        if self._data is not None:
+            self._save_data(self._data, sync=True)
+            return self._data
+        self._create_empty_database(sync=True)
+        return self._data
+    
+    def _save_data(self, data: dict, sync: bool = False):
         data["last_updated"] = datetime.now().isoformat()
-        with open(self.database_path, 'w') as file:
-            json.dump(data, file, indent=2)
+        self._set_index(data, self._signature)
+        # snapshot raso: add_score sempre cria uma lista nova de scores
+        snapshot = dict(data)
+        if self._writer is None:
+            self._write_snapshot(snapshot)
+        elif sync:
+            # não deixa um snapshot antigo da thread sobrescrever este depois
+            self._writer.flush()
+            self._write_snapshot(snapshot)
+        else:
+            self._writer.submit(snapshot)
+    
+    def _write_snapshot(self, snapshot: dict):
+        write_json_atomic(self.database_path, snapshot)
+        self._signature = self._file_signature()
+    
+    def _set_index(self, data: dict, signature: Optional[Tuple[int, int]]):
+        scores = data.get("scores", [])
+        self._data = data
+        self._signature = signature
+        # o arquivo pode ter sido editado fora de ordem; sort estável mantém empates
+        self._high_scores = [(entry["player_name"], entry["score"])
+                             for entry in sorted(scores, key=lambda x: x["score"], reverse=True)]
+        players: Dict[str, List[int]] = {}
+        for entry in scores:
+            stats = players.setdefault(entry["player_name"].lower(), [0, 0, entry["score"]])
+            stats[0] += 1
+            stats[1] += entry["score"]
+            stats[2] = max(stats[2], entry["score"])
+        self._players = players
+        self._unique_players = len(set(entry["player_name"] for entry in scores))
     
     def add_score(self, player_name: str, score: int) -> bool:
         if not player_name.strip():
             return False
+        if self._sqlite is not None:
+            self._sqlite.add_score(player_name.strip(), score)
+            return True
         
         data = self._load_data()
-        scores = data.get("scores", [])
+        scores = list(data.get("scores", []))
         
         new_score_entry = {
             "player_name": player_name.strip(),
@@ -61,24 +172,34 @@ class ScoreManager:
         return True
     
     def get_high_scores(self) -> List[Tuple[str, int]]:
-        data = self._load_data()
-        scores = data.get("scores", [])
-        
-        return [(entry["player_name"], entry["score"]) for entry in scores]
+        if self._sqlite is not None:
+            return self._sqlite.get_high_scores(self.max_scores)
+        self._load_data()
+        return list(self._high_scores)
     
     def is_high_score(self, score: int) -> bool:
-        high_scores = self.get_high_scores()
+        if self._sqlite is not None:
+            return self._sqlite.is_high_score(score, self.max_scores)
+        self._load_data()
+        high_scores = self._high_scores
         
         if len(high_scores) < self.max_scores:
             return True
         
         return score > high_scores[-1][1]
     
+    def get_rank(self, score: int) -> int:
+        """Posição (1 = melhor) que o score ocuparia entre os scores guardados."""
+        if self._sqlite is not None:
+            return self._sqlite.get_rank(score)
+        self._load_data()
+        return sum(1 for _, value in self._high_scores if value > score) + 1
+    
     def get_player_stats(self, player_name: str) -> dict:
-        data = self._load_data()
-        scores = data.get("scores", [])
-        
-        player_scores = [entry for entry in scores if entry["player_name"].lower() == player_name.lower()]
+        if self._sqlite is not None:
+            return self._sqlite.get_player_stats(player_name)
+        self._load_data()
+        player_scores = self._players.get(player_name.lower())
         
         if not player_scores:
             return {
@@ -88,21 +209,25 @@ class ScoreManager:
                 "total_score": 0
             }
         
-        total_score = sum(entry["score"] for entry in player_scores)
-        highest_score = max(entry["score"] for entry in player_scores)
-        average_score = total_score / len(player_scores)
+        games_played, total_score, highest_score = player_scores
+        average_score = total_score / games_played
         
         return {
-            "games_played": len(player_scores),
+            "games_played": games_played,
             "highest_score": highest_score,
             "average_score": round(average_score, 2),
             "total_score": total_score
         }
     
     def clear_all_scores(self):
+        if self._sqlite is not None:
+            self._sqlite.clear_all_scores()
+            return
         self._create_empty_database()
     
     def get_database_stats(self) -> dict:
+        if self._sqlite is not None:
+            return self._sqlite.get_database_stats()
         data = self._load_data()
         scores = data.get("scores", [])
         
@@ -114,12 +239,9 @@ class ScoreManager:
                 "last_updated": data.get("last_updated", "Never")
             }
         
-        unique_players = len(set(entry["player_name"] for entry in scores))
-        highest_score = max(entry["score"] for entry in scores)
-        
         return {
             "total_games": len(scores),
-            "unique_players": unique_players,
-            "highest_score": highest_score,
+            "unique_players": self._unique_players,
+            "highest_score": self._high_scores[0][1],
             "last_updated": data.get("last_updated", "Unknown")
         }
@@ -0,0 +1,153 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    name_key TEXT NOT NULL,          -- player_name.lower() (mesma regra do JSON)
+    score INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS idx_scores_name_key ON scores (name_key, score);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SqliteScoreStore:
+    """
+    Histórico completo de partidas em SQLite. Top-N, estatísticas por
+    jogador e rank usam os índices (score / nome em minúsculas); totais
+    do banco ficam em contadores na tabela meta, atualizados na mesma
+    transação de cada inserção, para não varrer milhões de linhas.
+    """
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(database_path)
+        self.connection.executescript(_SCHEMA)
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                [("schema_version", str(SCHEMA_VERSION)), ("total_games", "0"),
+                 ("unique_players", "0"), ("last_updated", datetime.now().isoformat())])
+
+    def close(self):
+        self.connection.close()
+
+    # -----------------------------------------------------------------
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _insert(self, entries: Iterable[Tuple[str, int, str]]):
+        """Insere (nome, score, data) atualizando os contadores; sem commit."""
+        cursor = self.connection.cursor()
+        games = 0
+        new_players = 0
+        for player_name, score, date in entries:
+            name_key = player_name.lower()
+            seen = cursor.execute("SELECT 1 FROM scores WHERE name_key = ? AND player_name = ? LIMIT 1",
+                                  (name_key, player_name)).fetchone()
+            if seen is None:
+                new_players += 1
+            cursor.execute("INSERT INTO scores (player_name, name_key, score, date) VALUES (?, ?, ?, ?)",
+                           (player_name, name_key, score, date))
+            games += 1
+        cursor.execute("UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'total_games'", (games,))
+        cursor.execute("UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'unique_players'",
+                       (new_players,))
+        cursor.execute("UPDATE meta SET value = ? WHERE key = 'last_updated'", (datetime.now().isoformat(),))
+        return games
+
+    # -----------------------------------------------------------------
+    def add_score(self, player_name: str, score: int):
+        with self.connection:
+            self._insert([(player_name, score, datetime.now().isoformat())])
+
+    def get_high_scores(self, limit: int) -> List[Tuple[str, int]]:
+        rows = self.connection.execute(
+            "SELECT player_name, score FROM scores ORDER BY score DESC, id LIMIT ?", (limit,))
+        return [(name, score) for name, score in rows]
+
+    def is_high_score(self, score: int, limit: int) -> bool:
+        # o limit-ésimo melhor score; se não existe, ainda há vaga no ranking
+        row = self.connection.execute(
+            "SELECT score FROM scores ORDER BY score DESC, id LIMIT 1 OFFSET ?", (limit - 1,)).fetchone()
+        return row is None or score > row[0]
+
+    def get_rank(self, score: int) -> int:
+        """Posição (1 = melhor) que o score ocuparia no histórico completo."""
+        row = self.connection.execute("SELECT COUNT(*) FROM scores WHERE score > ?", (score,)).fetchone()
+        return row[0] + 1
+
+    def get_player_stats(self, player_name: str) -> dict:
+        games, total, highest = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(score), 0), COALESCE(MAX(score), 0) FROM scores WHERE name_key = ?",
+            (player_name.lower(),)).fetchone()
+        return {
+            "games_played": games,
+            "highest_score": highest,
+            "average_score": round(total / games, 2) if games else 0,
+            "total_score": total
+        }
+
+    def get_database_stats(self) -> dict:
+        total_games = int(self._meta("total_games"))
+        if not total_games:
+            return {
+                "total_games": 0,
+                "unique_players": 0,
+                "highest_score": 0,
+                "last_updated": self._meta("last_updated") or "Never"
+            }
+        highest = self.connection.execute("SELECT MAX(score) FROM scores").fetchone()[0]
+        return {
+            "total_games": total_games,
+            "unique_players": int(self._meta("unique_players")),
+            "highest_score": highest,
+            "last_updated": self._meta("last_updated") or "Unknown"
+        }
+
+    def clear_all_scores(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM scores")
+            self.connection.execute("UPDATE meta SET value = '0' WHERE key IN ('total_games', 'unique_players')")
+            self.connection.execute("UPDATE meta SET value = ? WHERE key = 'last_updated'",
+                                    (datetime.now().isoformat(),))
+
+    # -----------------------------------------------------------------
+    # Migração
+    # -----------------------------------------------------------------
+    def import_json(self, json_path: str) -> int:
+        """
+        Importa as entradas de um scores.json (formato do ScoreManager) numa
+        única transação. Registra o caminho na tabela meta: importar o mesmo
+        arquivo de novo não duplica nada. Retorna quantas entradas entraram.
+        """
+        source = os.path.abspath(json_path)
+        if self._meta(f"imported:{source}") is not None:
+            return 0
+        with open(json_path, "r") as file:
+            data = json.load(file)
+        entries = [(entry["player_name"], int(entry["score"]), entry.get("date") or datetime.now().isoformat())
+                   for entry in data.get("scores", [])]
+        # em ordem decrescente, como no arquivo: empates mantêm a ordem original pelo id
+        entries.sort(key=lambda entry: entry[1], reverse=True)
+        with self.connection:
+            imported = self._insert(entries)
+            self.connection.execute("INSERT INTO meta (key, value) VALUES (?, ?)",
+                                    (f"imported:{source}", datetime.now().isoformat()))
+        return imported
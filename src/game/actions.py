@@ -0,0 +1,30 @@
+import pygame
+
+
+class Action:
+    """
+    Entrada de um tick como bitmask (permite combinar movimento + bomba).
+    Usado tanto pelo modo interativo (teclado) quanto pelo modo headless.
+    """
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+    BOMB = 16
+
+    ALL = (NONE, LEFT, RIGHT, UP, DOWN, BOMB)
+
+
+def action_from_keys(keys) -> int:
+    """Converte o estado do teclado (pygame.key.get_pressed()) em Action."""
+    action = Action.NONE
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        action |= Action.LEFT
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        action |= Action.RIGHT
+    if keys[pygame.K_UP] or keys[pygame.K_w]:
+        action |= Action.UP
+    if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        action |= Action.DOWN
+    return action
@@ -1,28 +1,53 @@
 import pygame
-import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from .entity_pool import BombPool, pooled
+from .sim_clock import WALL_CLOCK
 from ..utils.constants import GAME_CONFIG, COLORS
+from ..utils.sprite_atlas import atlas
+from ..utils.text_cache import text_cache
 
 class Bomb:
-    def __init__(self, x: int, y: int, timer: float):
-        self.grid_x = x
-        self.grid_y = y
-        self.timer = timer
-        self.plant_time = time.time()
-        self.explosion_radius = GAME_CONFIG['EXPLOSION_RADIUS']
+    """Handle (pool, slot) de uma bomba; o estado fica num BombPool."""
+    __slots__ = ("_pool", "_slot", "clock")
 
-        self.world_x = x * GAME_CONFIG['TILE_SIZE']
-        self.world_y = y * GAME_CONFIG['TILE_SIZE']
-        self.size = GAME_CONFIG['TILE_SIZE'] - 6
-        self.color = COLORS['RED']
+    color = COLORS['RED']
 
-        self.rect = pygame.Rect(self.world_x + 3, self.world_y + 3, self.size, self.size)
+    grid_x = pooled("grid_x")
+    grid_y = pooled("grid_y")
+    timer = pooled("timer")
+    plant_time = pooled("plant_time")
+    explosion_radius = pooled("explosion_radius")
+
+    @property
+    def size(self) -> int:
+        # como Player.size: acompanha o TILE_SIZE atual
+        return GAME_CONFIG['TILE_SIZE'] - 6
+
+    def __init__(self, x: int, y: int, timer: float, clock=None, radius: int = None,
+                 pool: Optional[BombPool] = None):
+        self.clock = clock or WALL_CLOCK
+        if pool is None:
+            pool = BombPool()
+        pool.alloc(self, x, y, timer, self.clock.time(), radius or GAME_CONFIG['EXPLOSION_RADIUS'])
+
+    @property
+    def world_x(self) -> int:
+        return self._pool.grid_x[self._slot] * GAME_CONFIG['TILE_SIZE']
+
+    @property
+    def world_y(self) -> int:
+        return self._pool.grid_y[self._slot] * GAME_CONFIG['TILE_SIZE']
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.world_x + 3, self.world_y + 3, self.size, self.size)
 
     def update(self):
         pass
 
     def should_explode(self) -> bool:
-        return time.time() - self.plant_time >= self.timer
+        pool, slot = self._pool, self._slot
+        return self.clock.time() - pool.plant_time[slot] >= pool.timer[slot]
 
     def get_explosion_positions(self, game_map) -> List[Tuple[int, int]]:
         """
@@ -48,12 +73,23 @@ class Bomb:
                     break
         return positions
 
+    def label(self) -> int:
+        """Número do timer visual (0 = sem texto: tempo esgotado ou sem fontes)."""
+        time_left = self.timer - (self.clock.time() - self.plant_time)
+        # sem fontes (modo headless) desenha só a bomba
+        if time_left > 0 and pygame.font.get_init():
+            return int(time_left) + 1
+        return 0
+
+    def sprites(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(surface, posição) da bomba e do timer, prontos para Surface.blits."""
+        rect = self.rect
+        items = [(atlas.get("bomb"), rect.topleft)]
+        label = self.label()
+        if label:
+            timer_text = text_cache.render(str(label), 24, COLORS['WHITE'])
+            items.append((timer_text, timer_text.get_rect(center=rect.center).topleft))
+        return items
+
     def render(self, screen: pygame.Surface):
-        pygame.draw.rect(screen, self.color, self.rect)
-        # timer visual
-        time_left = max(0.0, self.timer - (time.time() - self.plant_time))
-        if time_left > 0:
-            font = pygame.font.Font(None, 24)
-            timer_text = font.render(str(int(time_left) + 1), True, COLORS['WHITE'])
-            text_rect = timer_text.get_rect(center=self.rect.center)
-            screen.blit(timer_text, text_rect)
+        screen.blits(self.sprites(), doreturn=False)
@@ -0,0 +1,53 @@
+from typing import Tuple
+
+import pygame
+
+TileBounds = Tuple[int, int, int, int]   # (x0, y0, x1, y1), x1/y1 exclusivos
+
+
+def _clamp(value: int, upper: int) -> int:
+    # upper < 0: mapa menor que a tela => fica no canto
+    return max(0, min(value, upper))
+
+
+class Camera:
+    """
+    Viewport (em pixels de mundo) do tamanho da tela, centrado no jogador e
+    preso às bordas do mapa; mapas que cabem na tela ficam em (0, 0), como
+    antes. Também define a região ativa: tiles visíveis + margem. Fora dela
+    o engine não atualiza inimigos nem desenha nada, então o custo por
+    frame depende da tela, não do tamanho do mapa.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.x = 0
+        self.y = 0
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Subtraia de coordenadas de mundo para obter coordenadas de tela."""
+        return self.x, self.y
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def follow(self, center: Tuple[float, float], map_size: Tuple[int, int]):
+        """Centra em `center` (pixels de mundo) sem mostrar nada além do mapa."""
+        map_w, map_h = map_size
+        self.x = _clamp(int(center[0]) - self.width // 2, map_w - self.width)
+        self.y = _clamp(int(center[1]) - self.height // 2, map_h - self.height)
+
+    def covers(self, map_size: Tuple[int, int]) -> bool:
+        """O mapa inteiro cabe na tela (nada a recortar)."""
+        return map_size[0] <= self.width and map_size[1] <= self.height
+
+    def tile_bounds(self, game_map, margin: int = 0) -> TileBounds:
+        """Tiles visíveis, alargados por `margin` e recortados ao mapa."""
+        ts = game_map.tile_size
+        return (max(0, self.x // ts - margin),
+                max(0, self.y // ts - margin),
+                min(game_map.width, (self.x + self.width - 1) // ts + 1 + margin),
+                min(game_map.height, (self.y + self.height - 1) // ts + 1 + margin))
@@ -0,0 +1,198 @@
+import heapq
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .detonation import BlastRayTable
+from .flame_grid import FlameGrid
+from .game_map import TILE_FLOOR
+
+Tile = Tuple[int, int]
+
+INF = float("inf")
+
+_NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class DangerMap:
+    """
+    Para cada tile, o instante (tempo de simulação) em que a primeira chama
+    de uma bomba pendente vai alcançá-lo; inf onde nenhuma bomba alcança.
+    Guardar o instante absoluto (e não o tempo restante) faz a grade só
+    mudar em eventos, nunca a cada tick:
+
+     - add_bomb: pinta o alcance da bomba e propaga reações em cadeia (uma
+       bomba atingida detona junto com a que a atingiu, como resolve_chain);
+     - remove_bombs: ao detonar, refaz só os tiles que as bombas cobriam;
+     - destroy_wall (listener do mapa): estende os raios das bombas na
+       mesma linha/coluna, o que pode antecipar outras bombas.
+
+    `flame_at` é um ndarray (height, width) vivo; time_until_flame/is_safe
+    também consideram as chamas já acesas (FlameGrid).
+    """
+
+    def __init__(self, game_map, blast_rays: BlastRayTable, flames: Optional[FlameGrid] = None):
+        self.game_map = game_map
+        self.blast_rays = blast_rays
+        self.flames = flames
+        self.width = game_map.width
+        self.height = game_map.height
+        self.flame_at = np.full((self.height, self.width), INF, dtype=np.float64)
+        self._cells = memoryview(self.flame_at.reshape(-1))
+
+        self._detonates_at: Dict[object, float] = {}   # bomba -> instante efetivo (com cadeia)
+        self._tiles: Dict[object, List[Tile]] = {}      # bomba -> tiles do alcance
+        self._bomb_at: Dict[Tile, object] = {}
+        self._covered_by: Dict[Tile, Set[object]] = {}
+        # a BlastRayTable precisa ser invalidada antes: registre-a primeiro no mapa
+        game_map.add_wall_listener(self._on_wall_destroyed)
+
+    # -----------------------------------------------------------------
+    # Eventos
+    # -----------------------------------------------------------------
+    def add_bomb(self, bomb, now: float):
+        tile = (bomb.grid_x, bomb.grid_y)
+        when = bomb.plant_time + bomb.timer
+        # plantada no alcance de outra bomba (ou em chama acesa): detona junto
+        when = min(when, self._cells[bomb.grid_y * self.width + bomb.grid_x])
+        if self.flames is not None and self.flames.is_burning(bomb.grid_x, bomb.grid_y, now):
+            when = now
+        self._detonates_at[bomb] = when
+        self._bomb_at[tile] = bomb
+        self._tiles[bomb] = []
+        self._cover(bomb, self._blast_tiles(bomb))
+        self._relax([bomb])
+
+    def remove_bombs(self, bombs: Iterable):
+        """Bombas detonadas (a cadeia inteira): as restantes não dependiam delas."""
+        touched: Set[Tile] = set()
+        for bomb in bombs:
+            if bomb not in self._detonates_at:
+                continue
+            del self._detonates_at[bomb]
+            self._bomb_at.pop((bomb.grid_x, bomb.grid_y), None)
+            for tile in self._tiles.pop(bomb):
+                coverers = self._covered_by[tile]
+                coverers.discard(bomb)
+                if not coverers:
+                    del self._covered_by[tile]
+                touched.add(tile)
+        cells, width = self._cells, self.width
+        detonates_at = self._detonates_at
+        for tile in touched:
+            coverers = self._covered_by.get(tile, ())
+            cells[tile[1] * width + tile[0]] = min((detonates_at[b] for b in coverers), default=INF)
+
+    def _on_wall_destroyed(self, x: int, y: int):
+        max_radius = self.blast_rays.max_radius
+        affected = [bomb for (bx, by), bomb in self._bomb_at.items()
+                    if (bx == x and abs(by - y) <= max_radius) or (by == y and abs(bx - x) <= max_radius)]
+        for bomb in affected:
+            old = set(self._tiles[bomb])
+            added = [tile for tile in self._blast_tiles(bomb) if tile not in old]
+            if added:
+                self._cover(bomb, added)
+        if affected:
+            self._relax(affected)
+
+    def clear(self):
+        self.flame_at.fill(INF)
+        self._detonates_at.clear()
+        self._tiles.clear()
+        self._bomb_at.clear()
+        self._covered_by.clear()
+
+    # -----------------------------------------------------------------
+    def _blast_tiles(self, bomb) -> List[Tile]:
+        return self.blast_rays.blast_tiles(bomb.grid_x, bomb.grid_y, bomb.explosion_radius)
+
+    def _cover(self, bomb, tiles: List[Tile]):
+        when = self._detonates_at[bomb]
+        cells, width = self._cells, self.width
+        self._tiles[bomb].extend(tiles)
+        for tile in tiles:
+            self._covered_by.setdefault(tile, set()).add(bomb)
+            idx = tile[1] * width + tile[0]
+            if when < cells[idx]:
+                cells[idx] = when
+
+    def _relax(self, sources: List[object]):
+        """Propaga instantes de detonação antecipados pela cadeia (Dijkstra)."""
+        heap = [(self._detonates_at[b], i, b) for i, b in enumerate(sources)]
+        heapq.heapify(heap)
+        counter = len(heap)
+        cells, width = self._cells, self.width
+        while heap:
+            when, _, bomb = heapq.heappop(heap)
+            if when > self._detonates_at[bomb]:
+                continue
+            for tile in self._tiles[bomb]:
+                idx = tile[1] * width + tile[0]
+                if when < cells[idx]:
+                    cells[idx] = when
+                other = self._bomb_at.get(tile)
+                if other is not None and other is not bomb and when < self._detonates_at[other]:
+                    self._detonates_at[other] = when
+                    heapq.heappush(heap, (when, counter, other))
+                    counter += 1
+
+    # -----------------------------------------------------------------
+    # Consultas
+    # -----------------------------------------------------------------
+    def detonation_time(self, bomb) -> float:
+        """Instante em que a bomba vai explodir, já contando reações em cadeia."""
+        return self._detonates_at.get(bomb, INF)
+
+    def time_until_flame(self, grid_x: int, grid_y: int, now: float) -> float:
+        """Segundos até a próxima chama no tile: 0 se já queima, inf se seguro."""
+        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+            return INF
+        if self.flames is not None and self.flames.is_burning(grid_x, grid_y, now):
+            return 0.0
+        return max(0.0, self._cells[grid_y * self.width + grid_x] - now)
+
+    def is_safe(self, grid_x: int, grid_y: int, now: float, horizon: float = INF) -> bool:
+        """Sem chama prevista para os próximos `horizon` segundos (padrão: nenhuma)."""
+        remaining = self.time_until_flame(grid_x, grid_y, now)
+        return remaining == INF or remaining > horizon
+
+    def escape_step(self, grid_x: int, grid_y: int, now: float, horizon: float = INF,
+                    max_steps: int = 8) -> Optional[Tile]:
+        """
+        Primeiro passo (dx, dy) do caminho mais curto até um tile seguro
+        (sem chama nos próximos `horizon` s), andando só por chão sem bomba
+        e sem chama acesa. None se já está seguro ou não há saída por perto.
+        """
+        if self.is_safe(grid_x, grid_y, now, horizon):
+            return None
+        tiles, width, height = self.game_map.tiles, self.width, self.height
+        flames = self.flames
+        first: Dict[Tile, Optional[Tile]] = {(grid_x, grid_y): None}
+        queue = deque([(grid_x, grid_y, 0)])
+        while queue:
+            x, y, steps = queue.popleft()
+            if steps >= max_steps:
+                continue
+            for dx, dy in _NEIGHBORS:
+                nx, ny = x + dx, y + dy
+                if (nx, ny) in first or not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                if tiles[ny, nx] != TILE_FLOOR or (nx, ny) in self._bomb_at:
+                    continue
+                if flames is not None and flames.is_burning(nx, ny, now):
+                    continue
+                step = first[(x, y)] or (dx, dy)
+                if self.is_safe(nx, ny, now, horizon):
+                    return step
+                first[(nx, ny)] = step
+                queue.append((nx, ny, steps + 1))
+        return None
+
+    def time_until_flame_array(self, now: float) -> np.ndarray:
+        """Segundos até a chama por tile (height, width); inf onde é seguro."""
+        remaining = np.maximum(self.flame_at - now, 0.0)
+        if self.flames is not None:
+            burning = np.asarray(self.flames.expires).reshape(self.height, self.width) > now
+            remaining[burning] = 0.0
+        return remaining
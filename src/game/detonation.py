@@ -0,0 +1,84 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+from ..utils.constants import GAME_CONFIG
+
+Tile = Tuple[int, int]
+
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class BlastRayTable:
+    """
+    Raios de explosão pré-computados por tile, até MAX_FLAME_RADIUS, com a
+    mesma regra de Bomb.get_explosion_positions (para antes de parede
+    sólida; inclui o bloco destrutível e para). Um raio de raio r é o
+    prefixo de tamanho r do raio máximo, então uma entrada serve para
+    qualquer raio. Entradas só são invalidadas quando uma parede na mesma
+    linha/coluna (a até MAX_FLAME_RADIUS tiles) é destruída.
+    """
+
+    def __init__(self, game_map, max_radius: int = None):
+        self.game_map = game_map
+        self.max_radius = max_radius or GAME_CONFIG['MAX_FLAME_RADIUS']
+        self._rays: Dict[Tile, Tuple[Tuple[Tile, ...], ...]] = {}
+
+    def rays(self, grid_x: int, grid_y: int) -> Tuple[Tuple[Tile, ...], ...]:
+        key = (grid_x, grid_y)
+        rays = self._rays.get(key)
+        if rays is None:
+            rays = tuple(self._cast(grid_x, grid_y, dx, dy) for dx, dy in DIRECTIONS)
+            self._rays[key] = rays
+        return rays
+
+    def _cast(self, grid_x: int, grid_y: int, dx: int, dy: int) -> Tuple[Tile, ...]:
+        game_map = self.game_map
+        ray = []
+        for i in range(1, self.max_radius + 1):
+            nx = grid_x + dx * i
+            ny = grid_y + dy * i
+            if not game_map.is_valid_position(nx, ny) or game_map.is_wall(nx, ny):
+                break
+            ray.append((nx, ny))
+            if game_map.is_destructible_wall(nx, ny):
+                break
+        return tuple(ray)
+
+    def blast_tiles(self, grid_x: int, grid_y: int, radius: int) -> List[Tile]:
+        tiles = [(grid_x, grid_y)]
+        for ray in self.rays(grid_x, grid_y):
+            tiles.extend(ray[:radius])
+        return tiles
+
+    def invalidate_wall(self, x: int, y: int):
+        """Chamado quando a parede (x, y) some: raios que passavam por ela mudam."""
+        rays = self._rays
+        for i in range(-self.max_radius, self.max_radius + 1):
+            rays.pop((x + i, y), None)
+            rays.pop((x, y + i), None)
+
+    def clear(self):
+        self._rays.clear()
+
+
+def resolve_chain(due_bombs: Iterable, bomb_index, blast_rays: BlastRayTable) -> List[Tuple[object, List[Tile]]]:
+    """
+    Resolve uma cascata inteira de detonações em uma única BFS: parte das
+    bombas vencidas neste tick e detona toda bomba atingida pelas chamas.
+    Todos os raios usam o mapa do início do tick (paredes destruídas pela
+    cascata não deixam outras chamas atravessar), então o resultado não
+    depende da ordem das bombas. Retorna [(bomba, tiles)] em ordem de BFS.
+    """
+    queue = deque(due_bombs)
+    detonated = set(queue)
+    result = []
+    while queue:
+        bomb = queue.popleft()
+        tiles = blast_rays.blast_tiles(bomb.grid_x, bomb.grid_y, bomb.explosion_radius)
+        result.append((bomb, tiles))
+        for gx, gy in tiles:
+            for other in bomb_index.at(gx, gy):
+                if other not in detonated:
+                    detonated.add(other)
+                    queue.append(other)
+    return result
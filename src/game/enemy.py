@@ -1,63 +1,202 @@
 import pygame
 import random
-import time
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
+from .entity_pool import EnemyPool, pooled
+from .sim_clock import WALL_CLOCK
 from ..utils.constants import GAME_CONFIG, COLORS
+from ..utils.sprite_atlas import atlas
+
+_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
 
 class Enemy:
-    def __init__(self, x: int, y: int, speed: float):
-        self.x = x * GAME_CONFIG['TILE_SIZE']
-        self.y = y * GAME_CONFIG['TILE_SIZE']
-        self.speed = speed
-        self.size = GAME_CONFIG['TILE_SIZE'] - 6
-        self.color = COLORS['RED']
-        self.health = 1
-        self.is_alive = True
-
-        self.rect = pygame.Rect(self.x, self.y, self.size, self.size)
-
-        self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-        self.last_direction_change = time.time()
-        self.direction_change_interval = random.uniform(1.0, 2.5)
-
-    def update(self, game_map, player):
-        if not self.is_alive:
+    """
+    Handle (pool, slot) de um inimigo: o estado fica nas colunas de um
+    EnemyPool (o do engine ou, se nenhum for dado, um só deste inimigo).
+    """
+    __slots__ = ("_pool", "_slot", "clock", "rng")
+
+    color = COLORS['RED']
+
+    x = pooled("x")
+    y = pooled("y")
+    speed = pooled("speed")
+    health = pooled("health")
+    last_direction_change = pooled("last_direction_change")
+    direction_change_interval = pooled("direction_change_interval")
+
+    @property
+    def size(self) -> int:
+        # como Player.size: acompanha o TILE_SIZE atual
+        return GAME_CONFIG['TILE_SIZE'] - 6
+
+    def __init__(self, x: int, y: int, speed: float, clock=None, rng: random.Random = None,
+                 pool: Optional[EnemyPool] = None):
+        self.clock = clock or WALL_CLOCK
+        # fluxo do engine (determinístico) ou um gerador próprio
+        self.rng = rng or random.Random()
+        direction = self.rng.choice(_DIRECTIONS)
+        interval = self.rng.uniform(1.0, 2.5)
+        # perseguição: tile para onde está andando (movimento alinhado à grade) = target_x/y
+        if pool is None:
+            pool = EnemyPool()
+        pool.alloc(self, x * GAME_CONFIG['TILE_SIZE'], y * GAME_CONFIG['TILE_SIZE'], speed, 1, True,
+                   direction[0], direction[1], self.clock.time(), interval, -1, -1)
+
+    @classmethod
+    def spawn_many(cls, tiles: Sequence[Tuple[int, int]], speed: float, clock, rng: random.Random,
+                   pool: EnemyPool) -> List["Enemy"]:
+        """
+        Um inimigo por tile (grid_x, grid_y), com as colunas do pool
+        estendidas de uma vez; mesmos sorteios, na mesma ordem, que criar
+        cada um com Enemy(...).
+        """
+        ts = GAME_CONFIG['TILE_SIZE']
+        count = len(tiles)
+        enemies, dir_x, dir_y, intervals = [], [], [], []
+        for _ in range(count):
+            enemy = cls.__new__(cls)
+            enemy.clock = clock
+            enemy.rng = rng
+            enemies.append(enemy)
+            direction = rng.choice(_DIRECTIONS)
+            dir_x.append(direction[0])
+            dir_y.append(direction[1])
+            intervals.append(rng.uniform(1.0, 2.5))
+        pool.alloc_many(enemies, ([gx * ts for gx, _ in tiles], [gy * ts for _, gy in tiles],
+                                  [speed] * count, [1] * count, [True] * count, dir_x, dir_y,
+                                  [clock.time()] * count, intervals, [-1] * count, [-1] * count))
+        return enemies
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self._pool.alive[self._slot])
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        self._pool.alive[self._slot] = bool(value)
+
+    @property
+    def direction(self) -> Tuple[int, int]:
+        pool, slot = self._pool, self._slot
+        return pool.dir_x[slot], pool.dir_y[slot]
+
+    @direction.setter
+    def direction(self, value: Tuple[int, int]):
+        pool, slot = self._pool, self._slot
+        pool.dir_x[slot], pool.dir_y[slot] = value
+
+    @property
+    def target_tile(self) -> Optional[Tuple[int, int]]:
+        pool, slot = self._pool, self._slot
+        target_x = pool.target_x[slot]
+        return None if target_x < 0 else (target_x, pool.target_y[slot])
+
+    @target_tile.setter
+    def target_tile(self, value: Optional[Tuple[int, int]]):
+        pool, slot = self._pool, self._slot
+        pool.target_x[slot], pool.target_y[slot] = value if value is not None else (-1, -1)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(int(self.x), int(self.y), self.size, self.size)
+
+    def update(self, game_map, player, flow_field=None, danger=None):
+        """
+        Sem flow_field: anda em direções aleatórias (comportamento clássico).
+        Com flow_field (ENEMY_AI = "chase"): segue o campo rumo ao jogador
+        e, com danger (DangerMap), foge/espera diante de chamas iminentes.
+        """
+        pool, slot = self._pool, self._slot
+        if not pool.alive[slot]:
+            return
+        if flow_field is not None:
+            self._follow_field(game_map, flow_field, danger)
             return
 
-        current_time = time.time()
-        if current_time - self.last_direction_change >= self.direction_change_interval:
-            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-            self.last_direction_change = current_time
-            self.direction_change_interval = random.uniform(1.0, 2.5)
-
-        dx = self.direction[0] * self.speed
-        dy = self.direction[1] * self.speed
+        rng = self.rng
+        current_time = self.clock.time()
+        if current_time - pool.last_direction_change[slot] >= pool.direction_change_interval[slot]:
+            pool.dir_x[slot], pool.dir_y[slot] = rng.choice(_DIRECTIONS)
+            pool.last_direction_change[slot] = current_time
+            pool.direction_change_interval[slot] = rng.uniform(1.0, 2.5)
 
-        new_x = self.x + dx
-        new_y = self.y + dy
+        speed = pool.speed[slot]
+        x, y = pool.x[slot], pool.y[slot]
+        new_x = x + pool.dir_x[slot] * speed
+        new_y = y + pool.dir_y[slot] * speed
 
-        if self._can_move_to(new_x, self.y, game_map):
-            self.x = new_x
+        if self._can_move_to(new_x, y, game_map):
+            x = pool.x[slot] = new_x
         else:
-            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+            pool.dir_x[slot], pool.dir_y[slot] = rng.choice(_DIRECTIONS)
 
-        if self._can_move_to(self.x, new_y, game_map):
-            self.y = new_y
+        if self._can_move_to(x, new_y, game_map):
+            pool.y[slot] = new_y
         else:
-            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+            pool.dir_x[slot], pool.dir_y[slot] = rng.choice(_DIRECTIONS)
+
+    def _follow_field(self, game_map, flow_field, danger=None):
+        ts = GAME_CONFIG['TILE_SIZE']
+        pool, slot = self._pool, self._slot
+        x, y = pool.x[slot], pool.y[slot]
+        tx, ty = pool.target_x[slot], pool.target_y[slot]
+        if tx < 0:
+            # alinha ao tile mais próximo antes de começar a seguir o campo
+            tx, ty = int((x + ts / 2) // ts), int((y + ts / 2) // ts)
+            pool.target_x[slot], pool.target_y[slot] = tx, ty
+
+        if x == tx * ts and y == ty * ts:
+            step = self._choose_step(game_map, flow_field, danger, tx, ty)
+            if step is None:
+                return
+            pool.dir_x[slot], pool.dir_y[slot] = step
+            tx, ty = tx + step[0], ty + step[1]
+            pool.target_x[slot], pool.target_y[slot] = tx, ty
+
+        speed = pool.speed[slot]
+        pool.x[slot] = x + max(-speed, min(speed, tx * ts - x))
+        pool.y[slot] = y + max(-speed, min(speed, ty * ts - y))
+
+    def _choose_step(self, game_map, flow_field, danger, tx: int, ty: int) -> Optional[Tuple[int, int]]:
+        """Próximo passo a partir de um tile alinhado; None = fica parado."""
+        if danger is not None:
+            now = self.clock.time()
+            horizon = GAME_CONFIG['ENEMY_DANGER_HORIZON']
+            if not danger.is_safe(tx, ty, now, horizon):
+                escape = danger.escape_step(tx, ty, now, horizon)
+                if escape is not None:
+                    return escape
+        step = flow_field.direction_at(tx, ty)
+        if step is None:
+            if flow_field.distance_at(tx, ty) == 0:
+                return None  # já está no tile do jogador
+            # jogador inalcançável: vagueia de tile em tile
+            step = self._random_open_step(game_map, tx, ty)
+        if step is not None and danger is not None:
+            # não entra em tile que vai pegar fogo em breve: espera
+            if not danger.is_safe(tx + step[0], ty + step[1], now, horizon):
+                return None
+        return step
+
+    def _random_open_step(self, game_map, grid_x: int, grid_y: int) -> Optional[Tuple[int, int]]:
+        options = [(dx, dy) for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]
+                   if game_map.is_valid_position(grid_x + dx, grid_y + dy)
+                   and not game_map.is_wall(grid_x + dx, grid_y + dy)
+                   and not game_map.is_destructible_wall(grid_x + dx, grid_y + dy)]
+        return self.rng.choice(options) if options else None
 
     def _can_move_to(self, x: float, y: float, game_map) -> bool:
+        ts = GAME_CONFIG['TILE_SIZE']
+        size = self.size
         # Criar retângulo do enemy na nova posição
-        enemy_rect = pygame.Rect(x, y, self.size, self.size)
+        enemy_rect = pygame.Rect(x, y, size, size)
         
         # Verificar colisão com todos os tiles que o enemy pode tocar
-        start_grid_x = int(x // GAME_CONFIG['TILE_SIZE'])
-        start_grid_y = int(y // GAME_CONFIG['TILE_SIZE'])
-        end_grid_x = int((x + self.size) // GAME_CONFIG['TILE_SIZE'])
-        end_grid_y = int((y + self.size) // GAME_CONFIG['TILE_SIZE'])
+        start_grid_x = int(x // ts)
+        start_grid_y = int(y // ts)
+        end_grid_x = int((x + size) // ts)
+        end_grid_y = int((y + size) // ts)
         
         # Verificar todos os tiles que o enemy pode tocar
         for grid_x in range(start_grid_x, end_grid_x + 1):
@@ -69,34 +208,32 @@ class Enemy:
                 # Se é uma parede (sólida ou destrutível)
                 if game_map.is_wall(grid_x, grid_y) or game_map.is_destructible_wall(grid_x, grid_y):
                     # Verificar se o enemy está realmente colidindo com este tile
-                    tile_rect = pygame.Rect(grid_x * GAME_CONFIG['TILE_SIZE'],
-                                          grid_y * GAME_CONFIG['TILE_SIZE'],
-                                          GAME_CONFIG['TILE_SIZE'], GAME_CONFIG['TILE_SIZE'])
-                    if enemy_rect.colliderect(tile_rect):
+                    if enemy_rect.colliderect((grid_x * ts, grid_y * ts, ts, ts)):
                         return False
         
         return True
 
     def take_damage(self):
-        self.health -= 1
-        if self.health <= 0:
-            self.is_alive = False
+        pool, slot = self._pool, self._slot
+        pool.health[slot] -= 1
+        if pool.health[slot] <= 0:
+            pool.alive[slot] = False
 
     def is_dead(self) -> bool:
-        return not self.is_alive
+        return not self._pool.alive[self._slot]
 
     def is_at_position(self, x: int, y: int) -> bool:
         grid_x, grid_y = self._get_grid_position()
         return grid_x == x and grid_y == y
 
     def _get_grid_position(self) -> Tuple[int, int]:
-        grid_x = int(self.x // GAME_CONFIG['TILE_SIZE'])
-        grid_y = int(self.y // GAME_CONFIG['TILE_SIZE'])
-        return grid_x, grid_y
+        x, y = self.get_position()
+        return int(x // GAME_CONFIG['TILE_SIZE']), int(y // GAME_CONFIG['TILE_SIZE'])
 
     def get_position(self) -> Tuple[float, float]:
-        return self.x, self.y
+        pool, slot = self._pool, self._slot
+        return pool.x[slot], pool.y[slot]
 
     def render(self, screen: pygame.Surface):
-        if self.is_alive:
-            pygame.draw.rect(screen, self.color, self.rect)
+        if self._pool.alive[self._slot]:
+            screen.blit(atlas.get("enemy"), self.rect)
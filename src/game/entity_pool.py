@@ -0,0 +1,99 @@
+"""
+Pools structure-of-arrays para entidades numerosas (inimigos e bombas).
+
+Cada campo é uma coluna array.array (8 bytes ou menos por entidade, sem
+objetos float/tuple por campo); Enemy e Bomb viram handles leves (pool,
+slot) com as mesmas propriedades de antes. Laços em lote podem ler as
+colunas direto (pool.x[slot]) ou pedir cópias NumPy com column().
+
+Remoção é swap-remove: o último slot ocupa o buraco e o handle movido é
+atualizado. O handle removido continua legível (leva uma cópia só dele).
+Entidades criadas sem pool ganham um pool só delas: funciona, mas custa
+mais memória que o objeto antigo; o engine sempre passa o seu.
+"""
+from array import array
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+
+class EntityPool:
+    # (nome do campo, typecode do array.array), na ordem dos valores de alloc()
+    FIELDS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self):
+        for name, typecode in self.FIELDS:
+            setattr(self, name, array(typecode))
+        self.handles: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def alloc(self, handle, *values):
+        """Acrescenta uma linha e aponta o handle para ela."""
+        handle._pool = self
+        handle._slot = len(self.handles)
+        for (name, _), value in zip(self.FIELDS, values):
+            getattr(self, name).append(value)
+        self.handles.append(handle)
+
+    def alloc_many(self, handles: Sequence, columns: Sequence[Sequence]):
+        """alloc() em lote: `columns` traz os valores de cada campo, na ordem de FIELDS."""
+        for slot, handle in enumerate(handles, len(self.handles)):
+            handle._pool = self
+            handle._slot = slot
+        for (name, _), values in zip(self.FIELDS, columns):
+            getattr(self, name).extend(values)
+        self.handles.extend(handles)
+
+    def release(self, handle):
+        """Tira a entidade do pool; no-op se o handle for de outro pool."""
+        if handle._pool is not self:
+            return
+        slot = handle._slot
+        row = self.row(slot)
+        for name, _ in self.FIELDS:
+            column = getattr(self, name)
+            last = column.pop()
+            if slot < len(column):
+                column[slot] = last
+        moved = self.handles.pop()
+        if moved is not handle:
+            self.handles[slot] = moved
+            moved._slot = slot
+        type(self)().alloc(handle, *row)
+
+    def row(self, slot: int) -> tuple:
+        return tuple(getattr(self, name)[slot] for name, _ in self.FIELDS)
+
+    def column(self, name: str) -> np.ndarray:
+        """Cópia NumPy de um campo, em ordem de slot (operações vetorizadas)."""
+        return np.array(getattr(self, name))
+
+    def clear(self):
+        for handle in list(self.handles):
+            self.release(handle)
+
+
+def pooled(name: str, doc: str = None) -> property:
+    """Propriedade de handle que lê/escreve a coluna `name` do pool."""
+
+    def get(self):
+        return getattr(self._pool, name)[self._slot]
+
+    def set(self, value):
+        getattr(self._pool, name)[self._slot] = value
+
+    return property(get, set, doc=doc)
+
+
+class EnemyPool(EntityPool):
+    # target_x/target_y = -1: sem tile alvo
+    FIELDS = (("x", "d"), ("y", "d"), ("speed", "d"), ("health", "i"), ("alive", "b"),
+              ("dir_x", "b"), ("dir_y", "b"), ("last_direction_change", "d"),
+              ("direction_change_interval", "d"), ("target_x", "i"), ("target_y", "i"))
+
+
+class BombPool(EntityPool):
+    FIELDS = (("grid_x", "i"), ("grid_y", "i"), ("timer", "d"), ("plant_time", "d"),
+              ("explosion_radius", "i"))
@@ -1,29 +1,38 @@
-import time
 import pygame
 from typing import List, Tuple
-from ..utils.constants import GAME_CONFIG, COLORS
+from .sim_clock import WALL_CLOCK
+from ..utils.constants import GAME_CONFIG
+from ..utils.sprite_atlas import atlas
 
 class Explosion:
     """
     Representa a "chama" da explosão por um curto período (ms).
     Guarda os tiles atingidos e oferece teste de contenção.
     """
-    def __init__(self, tiles: List[Tuple[int, int]]):
-        self.tiles = tiles[:]  # lista de (grid_x, grid_y)
-        self.started = time.time()
-        self.duration_ms = GAME_CONFIG['EXPLOSION_DURATION_MS']
-        self.tile_size = GAME_CONFIG['TILE_SIZE']
+    __slots__ = ("tiles", "clock", "started", "expires_at", "_overlay")
+
+    def __init__(self, tiles: List[Tuple[int, int]], clock=None):
+        self.tiles = tuple(tiles)  # (grid_x, grid_y), imutável
+        self.clock = clock or WALL_CLOCK
+        self.started = self.clock.time()
+        # mesmo instante usado no FlameGrid do engine
+        self.expires_at = self.started + GAME_CONFIG['EXPLOSION_DURATION_MS'] / 1000.0
+        self._overlay = None
 
     def is_active(self) -> bool:
-        return (time.time() - self.started) * 1000.0 < self.duration_ms
+        return self.clock.time() < self.expires_at
 
     def contains(self, grid_x: int, grid_y: int) -> bool:
+        # poucas dezenas de tiles; o engine consulta o FlameGrid, não isto
         return (grid_x, grid_y) in self.tiles
 
+    def overlay(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """(surface, posição) com a forma inteira da chama, montada uma vez."""
+        # no 1º render, não no construtor: a simulação headless nunca paga por isso
+        if self._overlay is None:
+            self._overlay = atlas.flame_overlay(self.tiles)
+        return self._overlay
+
     def render(self, screen: pygame.Surface):
-        alpha = 180
-        surf = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
-        for gx, gy in self.tiles:
-            # centro mais amarelo; braços alaranjados (mesma cor aqui para simplicidade)
-            surf.fill((*COLORS['ORANGE'], alpha))
-            screen.blit(surf, (gx * self.tile_size, gy * self.tile_size))
+        # centro mais amarelo; braços alaranjados (mesma cor aqui para simplicidade)
+        screen.blit(*self.overlay())
@@ -0,0 +1,32 @@
+from typing import Iterable, Tuple
+
+
+class FlameGrid:
+    """
+    Ocupação de chamas por tile: guarda, para cada tile, o instante (tempo
+    de simulação) em que a chama ali apaga. "Está queimando?" vira uma
+    leitura O(1), sem varrer a lista de explosões; chamas expiradas somem
+    sozinhas, pois a comparação é com o tempo atual.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.expires = [float("-inf")] * (width * height)
+
+    def ignite(self, tiles: Iterable[Tuple[int, int]], until: float):
+        width = self.width
+        expires = self.expires
+        for gx, gy in tiles:
+            if 0 <= gx < width and 0 <= gy < self.height:
+                idx = gy * width + gx
+                if until > expires[idx]:
+                    expires[idx] = until
+
+    def is_burning(self, grid_x: int, grid_y: int, now: float) -> bool:
+        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+            return False
+        return self.expires[grid_y * self.width + grid_x] > now
+
+    def clear(self):
+        self.expires = [float("-inf")] * (self.width * self.height)
@@ -0,0 +1,118 @@
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .game_map import TILE_FLOOR
+
+Tile = Tuple[int, int]
+Bounds = Tuple[int, int, int, int]   # (x0, y0, x1, y1), x1/y1 exclusivos
+
+UNREACHABLE = -1
+
+# ordem fixa de expansão da BFS: desempates determinísticos
+_NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class FlowField:
+    """
+    Campo de distâncias (BFS) até o tile do jogador, compartilhado por
+    todos os inimigos. Bloqueiam: paredes sólidas, blocos destrutíveis e
+    tiles com bomba. Cada tile alcançável guarda também o passo (dx, dy)
+    rumo ao jogador, então um inimigo decide a direção em O(1).
+
+    Só recalcula quando o jogador muda de tile ou quando algo invalida o
+    campo (bomba plantada/detonada, parede destruída via listener do mapa).
+
+    bounds restringe a BFS a uma janela (a região ativa da câmera em mapas
+    grandes): fora dela tudo é UNREACHABLE e o custo depende da janela, não
+    do mapa. Sem bounds, a janela é o mapa inteiro.
+    """
+
+    def __init__(self, game_map):
+        self.game_map = game_map
+        self.width = game_map.width
+        self.height = game_map.height
+        self.bounds: Bounds = (0, 0, 0, 0)
+        self.distance: List[int] = []
+        self._step: List[Optional[Tile]] = []
+        self.target: Optional[Tile] = None
+        self._dirty = True
+        self.recomputes = 0
+        game_map.add_wall_listener(self._on_wall_destroyed)
+
+    def _on_wall_destroyed(self, x: int, y: int):
+        self._dirty = True
+
+    def invalidate(self):
+        self._dirty = True
+
+    def update(self, target: Tile, blockers: Iterable[Tile] = (), bounds: Optional[Bounds] = None) -> bool:
+        """Recalcula se preciso; retorna True se houve recálculo."""
+        bounds = bounds or (0, 0, self.width, self.height)
+        if not self._dirty and target == self.target and bounds == self.bounds:
+            return False
+        self._compute(target, blockers, bounds)
+        return True
+
+    def _compute(self, target: Tile, blockers: Iterable[Tile], bounds: Bounds):
+        x0, y0, x1, y1 = bounds
+        width, height = x1 - x0, y1 - y0
+        passable = (self.game_map.tiles[y0:y1, x0:x1] == TILE_FLOOR).reshape(-1).tolist()
+        for bx, by in blockers:
+            bx -= x0
+            by -= y0
+            if 0 <= bx < width and 0 <= by < height:
+                passable[by * width + bx] = False
+
+        distance = [UNREACHABLE] * (width * height)
+        step: List[Optional[Tile]] = [None] * (width * height)
+        tx, ty = target[0] - x0, target[1] - y0
+        if 0 <= tx < width and 0 <= ty < height:
+            # a origem vale mesmo bloqueada (jogador sobre a própria bomba)
+            distance[ty * width + tx] = 0
+            queue = deque([(tx, ty)])
+            while queue:
+                x, y = queue.popleft()
+                next_distance = distance[y * width + x] + 1
+                for dx, dy in _NEIGHBORS:
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < width and 0 <= ny < height):
+                        continue
+                    idx = ny * width + nx
+                    if distance[idx] != UNREACHABLE or not passable[idx]:
+                        continue
+                    distance[idx] = next_distance
+                    step[idx] = (-dx, -dy)
+                    queue.append((nx, ny))
+
+        self.distance = distance
+        self._step = step
+        self.bounds = bounds
+        self.target = target
+        self._dirty = False
+        self.recomputes += 1
+
+    # -----------------------------------------------------------------
+    def _index(self, grid_x: int, grid_y: int) -> int:
+        """Posição de (grid_x, grid_y) na janela; -1 se fora dela."""
+        x0, y0, x1, y1 = self.bounds
+        if not (x0 <= grid_x < x1 and y0 <= grid_y < y1):
+            return -1
+        return (grid_y - y0) * (x1 - x0) + grid_x - x0
+
+    def distance_at(self, grid_x: int, grid_y: int) -> int:
+        idx = self._index(grid_x, grid_y)
+        return UNREACHABLE if idx < 0 else self.distance[idx]
+
+    def direction_at(self, grid_x: int, grid_y: int) -> Optional[Tile]:
+        """Passo rumo ao jogador; None no próprio alvo ou se inalcançável."""
+        idx = self._index(grid_x, grid_y)
+        return None if idx < 0 else self._step[idx]
+
+    def as_array(self) -> np.ndarray:
+        """Distâncias (height, width) em int32; UNREACHABLE onde não há caminho."""
+        x0, y0, x1, y1 = self.bounds
+        full = np.full((self.height, self.width), UNREACHABLE, dtype=np.int32)
+        full[y0:y1, x0:x1] = np.asarray(self.distance, dtype=np.int32).reshape(y1 - y0, x1 - x0)
+        return full
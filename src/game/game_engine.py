@@ -1,43 +1,118 @@
 import pygame
-import time
-import random
-from typing import List, Tuple, Optional
+from collections import deque
+from typing import Deque, List, Tuple, Optional
 
+from .camera import Camera, TileBounds
 from .game_map import GameMap
+from .level import LevelPregenerator
 from .player import Player
 from .bomb import Bomb
 from .enemy import Enemy
 from .explosion import Explosion
+from .detonation import BlastRayTable, resolve_chain
+from .danger_map import DangerMap
+from .flame_grid import FlameGrid
+from .flow_field import FlowField
+from .spatial_index import SpatialIndex
+from .entity_pool import BombPool, EnemyPool
 from .powerup import PowerUp, PowerUpType
+from .actions import Action, action_from_keys
+from .sim_clock import SimClock
+from .rng import RngStreams
+from .snapshot import restore_engine, snapshot_engine
 from ..utils.constants import GAME_CONFIG, COLORS
+from ..utils.text_cache import fonts, text_cache
+from ..utils.profiler import FrameProfiler
+from ..utils.sprite_atlas import atlas
+
+RENDER_MODES = ("dirty", "full")
+
+
+def _merge_rects(rects: List[pygame.Rect], bounds: pygame.Rect) -> List[pygame.Rect]:
+    """Recorta na tela e funde os que se sobrepõem: cada pixel vai uma vez ao display."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.clip(bounds)
+        if not rect.width or not rect.height:
+            continue
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
 
 
 class GameEngine:
-    def __init__(self, screen_width: int, screen_height: int):
-        pygame.init()
+    def __init__(self, screen_width: int, screen_height: int, headless: bool = False,
+                 seed: Optional[int] = None, time_scale: float = 1.0,
+                 profiler: Optional[FrameProfiler] = None, render_mode: str = "dirty"):
+        """
+        headless=True: não abre janela nem inicializa fontes; a entrada vem
+        como Action explícita em update(action). render() desenha numa
+        Surface off-screen (sem flip), útil para testes e simulação em lote.
+
+        seed: mesma seed + mesmas ações => mesma partida, bit a bit.
+        time_scale: acelera/desacelera advance() (não afeta update()).
+        profiler: tempos por fase de update()/render() (F3 liga o overlay);
+        sem ele, cria um FrameProfiler desligado.
+        render_mode="dirty": redesenha e envia ao display só as regiões que
+        mudaram (display.update(rects)); "full": tela inteira + flip.
+        """
+        self._init_shell(screen_width, screen_height, headless, time_scale, profiler, render_mode)
+        self.reset(seed)
+
+    def _init_shell(self, screen_width: int, screen_height: int, headless: bool,
+                    time_scale: float, profiler: Optional[FrameProfiler], render_mode: str = "dirty"):
+        """Tela, relógios e caches de render: tudo menos a partida em si."""
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"render_mode desconhecido: {render_mode!r} (esperado um de {RENDER_MODES})")
+        self.headless = headless
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
-        pygame.display.set_caption("Bomberman")
+        if headless:
+            self.screen = pygame.Surface((screen_width, screen_height))
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((screen_width, screen_height))
+            pygame.display.set_caption("Bomberman")
 
         self.clock = pygame.time.Clock()
+        # relógio da simulação: toda lógica temporal lê daqui, nunca de time.time()
+        self.sim_clock = SimClock(time_scale=time_scale)
         self.running = True
-        self.game_over = False
-        self.victory = False
-        self.score = 0
-        self.level = 1
+        self.bomb_cooldown = GAME_CONFIG['BOMB_COOLDOWN']
 
-        self.game_map = GameMap()
-        self.player = Player(1, 1, GAME_CONFIG['PLAYER_SPEED'])
-        self.enemies: List[Enemy] = []
-        self.bombs: List[Bomb] = []
-        self.explosions: List[Explosion] = []
-        self.powerups: List[PowerUp] = []
+        # HUD: só re-renderiza quando algum valor exibido muda
+        self._hud_key: Optional[tuple] = None
+        self._hud_surfaces: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
 
-        self.last_bomb_time = 0.0
-        self.bomb_cooldown = GAME_CONFIG['BOMB_COOLDOWN']
+        self.profiler = profiler or FrameProfiler()
+        self.show_profiler = False
+        self._profiler_surfaces: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._profiler_version = 0
 
-        self._initialize_enemies()
+        # dirty rects: o que está na tela desde o último render (mapa + chaves
+        # dos itens); mapa diferente (reset/restore) força um frame completo
+        self.render_mode = render_mode
+        self._drawn_map: Optional[GameMap] = None
+        self._drawn_keys: set = set()
+        self._drawn_offset: Optional[Tuple[int, int]] = None
+        self.pixels_pushed = 0   # pixels enviados ao display no último render
+
+        # viewport que segue o jogador; define também a região ativa
+        self.camera = Camera(screen_width, screen_height)
+
+        # todas as chamas ativas numa camada só, refeita quando os tiles mudam
+        self._flame_tiles: set = set()
+        self._flame_overlay: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+
+        # gancho de gravação (src.sim.replay.ReplayRecorder): ação efetiva por tick
+        self.recorder = None
+
+        self.rng: Optional[RngStreams] = None
+        # próximo nível gerado em segundo plano enquanto o atual é jogado
+        self.levels = LevelPregenerator()
 
     # ---------------------------------------------------------------------
     # Eventos: AGORA recebemos um evento por vez (sem pygame.event.get() aqui)
@@ -45,40 +120,141 @@ class GameEngine:
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self._plant_bomb()
+                self._queued_action |= Action.BOMB
             elif event.key == pygame.K_r and (self.game_over or self.victory):
                 self._restart_game()
+            elif event.key == pygame.K_F3:
+                self.toggle_profiler_overlay()
 
     # ---------------------------------------------------------------------
-    def _initialize_enemies(self):
-        enemy_positions = self.game_map.get_enemy_spawn_positions()
-        for pos in enemy_positions:
-            self.enemies.append(Enemy(pos[0], pos[1], GAME_CONFIG['ENEMY_SPEED']))
+    def _start_level(self, level: int):
+        """
+        Monta o nível `level` (mapa e inimigos vêm de src.game.level) e já
+        agenda a geração do seguinte. Do 2º nível em diante o jogador mantém
+        vidas e power-ups; bombas, chamas e itens do nível anterior somem.
+        """
+        width, height = GAME_CONFIG['MAP_WIDTH'], GAME_CONFIG['MAP_HEIGHT']
+        plan = self.levels.take(self.rng.level_seed(level), level, width, height)
+        previous = self.player if level > 1 else None
+
+        self.level = level
+        self._build_world(GameMap(self.rng.map, tiles=plan.tiles))
+        if previous is not None:
+            self.player.lives = previous.lives
+            self.player.speed = previous.speed
+            self.player.bomb_capacity = previous.bomb_capacity
+            self.player.flame_radius = previous.flame_radius
+        spawned = Enemy.spawn_many(plan.enemy_spawns, GAME_CONFIG['ENEMY_SPEED'], self.sim_clock,
+                                   self.rng.enemies, self.enemy_pool)
+        self.enemies.extend(spawned)
+        self.enemy_index.add_many(spawned, plan.enemy_spawns)
+
+        if level < GAME_CONFIG['LEVEL_COUNT']:
+            self.levels.prefetch(self.rng.level_seed(level + 1), level + 1, width, height)
+
+    def reset(self, seed: Optional[int] = None):
+        """Começa uma nova partida. Sem seed, deriva a próxima da partida atual."""
+        if seed is None and self.rng is not None:
+            seed = self.rng.next_seed()
+        if self.recorder is not None:
+            self.recorder.on_reset(self)
+        self.levels.cancel()
+        self.rng = RngStreams(seed)
+        self.sim_clock.reset()
 
-    def _restart_game(self):
         self.game_over = False
         self.victory = False
         self.score = 0
-        self.level = 1
+        # estatísticas da partida (simulação em lote / balanceamento)
+        self.walls_destroyed = 0
+        self.powerups_collected = 0
+        self.death_cause: Optional[str] = None  # "enemy" | "flame"
+
+        self._start_level(1)
+
+    def _build_world(self, game_map: GameMap):
+        """Mapa novo com jogador no spawn, sem entidades, e as estruturas derivadas."""
+        self.game_map = game_map
+        self.blast_rays = BlastRayTable(self.game_map)
+        self.game_map.add_wall_listener(self.blast_rays.invalidate_wall)
+        self.player = Player(1, 1, GAME_CONFIG['PLAYER_SPEED'], self.sim_clock)
+        self.enemies: List[Enemy] = []
+        self.bombs: List[Bomb] = []
+        # em ordem de início; como a duração é fixa, expiram em ordem (FIFO)
+        self.explosions: Deque[Explosion] = deque()
+        self.powerups: List[PowerUp] = []
+        # estado de inimigos/bombas em colunas (Enemy/Bomb são handles nos pools)
+        self.enemy_pool = EnemyPool()
+        self.bomb_pool = BombPool()
+        self.flames = FlameGrid(self.game_map.width, self.game_map.height)
+        # campo de perseguição compartilhado (ENEMY_AI = "chase")
+        self.flow_field = FlowField(self.game_map)
+        # instante da próxima chama por tile (IA dos inimigos, bots externos)
+        self.danger = DangerMap(self.game_map, self.blast_rays, self.flames)
+
+        # índices por tile, mantidos em sincronia com as listas acima
+        tile_size = self.game_map.tile_size
+        self.enemy_index = SpatialIndex(tile_size)
+        self.bomb_index = SpatialIndex(tile_size)
+        self.powerup_index = SpatialIndex(tile_size)
+
+        self.last_bomb_time = float("-inf")
+        # ações vindas de eventos (ex.: SPACE) aplicadas no próximo tick
+        self._queued_action = Action.NONE
+        self._hud_key = None
 
-        self.player = Player(1, 1, GAME_CONFIG['PLAYER_SPEED'])
-        self.enemies.clear()
-        self.bombs.clear()
-        self.explosions.clear()
-        self.powerups.clear()
+    def _restart_game(self):
+        self.reset()
 
-        self.game_map = GameMap()
-        self._initialize_enemies()
+    # ---------------------------------------------------------------------
+    # Snapshot / clone (src.game.snapshot)
+    # ---------------------------------------------------------------------
+    def snapshot(self) -> bytes:
+        """Estado completo da partida (inclusive RNGs) num bloco binário compacto."""
+        return snapshot_engine(self)
+
+    def restore(self, data: bytes):
+        """Volta ao estado de snapshot(); a partir daí, mesmas ações => mesmo jogo."""
+        restore_engine(self, data)
+
+    def clone(self) -> "GameEngine":
+        """
+        Cópia independente e headless (busca/rollouts), sem deepcopy: um
+        engine vazio restaurado do snapshot deste. O gravador não é copiado.
+        """
+        other = GameEngine.__new__(GameEngine)
+        other._init_shell(self.screen_width, self.screen_height, True,
+                          self.sim_clock.time_scale, None, self.render_mode)
+        other.restore(self.snapshot())
+        return other
+
+    @property
+    def seed(self) -> int:
+        return self.rng.seed
 
     # ---------------------------------------------------------------------
     # Update principal
     # ---------------------------------------------------------------------
-    def update(self):
+    def update(self, action: Optional[int] = None):
+        """
+        Avança um tick. `action` (bitmask de Action) substitui a leitura do
+        teclado; se None, lê pygame.key.get_pressed() (apenas com janela).
+        """
         if self.game_over or self.victory:
             return
 
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, self.game_map, self.bombs, self.player.soft_bomb_tile)
+        if action is None:
+            action = Action.NONE if self.headless else action_from_keys(pygame.key.get_pressed())
+        action |= self._queued_action
+        self._queued_action = Action.NONE
+
+        prof = self.profiler
+        prof.begin()
+
+        if action & Action.BOMB:
+            self._plant_bomb()
+
+        self.player.update(action, self.game_map, self.bomb_index, self.player.soft_bomb_tile)
 
         # Se já saiu do tile da bomba recém-plantada, remove pass-through
         if self.player.soft_bomb_tile is not None:
@@ -86,38 +262,85 @@ class GameEngine:
             pgx, pgy = self.game_map.world_to_grid(px, py)
             if (pgx, pgy) != self.player.soft_bomb_tile:
                 self.player.soft_bomb_tile = None
-
-        # Inimigos
-        for enemy in self.enemies[:]:
-            enemy.update(self.game_map, self.player)
+        prof.lap("player")
+
+        # Inimigos: só os da região ativa (tela + margem) se movem
+        world_to_grid = self.game_map.world_to_grid
+        active = self._follow_player()
+        flow_field = danger = None
+        if GAME_CONFIG['ENEMY_AI'] == 'chase':
+            flow_field, danger = self.flow_field, self.danger
+            flow_field.update(world_to_grid(*self.player.get_position()), self.bomb_index.tiles(), active)
+        for enemy in self._active_enemies(active):
+            enemy.update(self.game_map, self.player, flow_field, danger)
             if enemy.is_dead():
-                self.enemies.remove(enemy)
+                self._remove_enemy(enemy)
                 self.score += GAME_CONFIG['ENEMY_SCORE']
-
-        # Bombas -> explosão
-        for bomb in self.bombs[:]:
-            bomb.update()
-            if bomb.should_explode():
-                tiles = bomb.get_explosion_positions(self.game_map)
-                self._apply_destruction_and_spawn_powerups(tiles)
-                self.explosions.append(Explosion(tiles))
-                self.bombs.remove(bomb)
-
-        # Limpa explosões expiradas
-        self.explosions = [e for e in self.explosions if e.is_active()]
+            else:
+                self.enemy_index.move(enemy, world_to_grid(*enemy.get_position()))
+        prof.lap("enemies")
+
+        # Bombas -> explosão (vencidas ou já atingidas por chamas ativas)
+        now = self.sim_clock.time()
+        is_burning = self.flames.is_burning
+        due = [b for b in self.bombs
+               if b.should_explode() or is_burning(b.grid_x, b.grid_y, now)]
+        if due:
+            self._detonate(due)
+        prof.lap("bombs")
+
+        # Limpa explosões expiradas (só as da frente da fila podem ter expirado)
+        explosions = self.explosions
+        while explosions and not explosions[0].is_active():
+            explosions.popleft()
+        prof.lap("explosions")
 
         # Coleta power-ups
         self._check_player_powerups()
+        prof.lap("powerups")
 
         # Colisões (chamas / contato)
         self._check_collisions()
+        prof.lap("collisions")
 
         # Vitória?
         self._check_victory_condition()
+        prof.lap("victory")
+
+        self.sim_clock.advance()
+        if self.recorder is not None:
+            self.recorder.on_tick(self, action)
+
+    def advance(self, real_seconds: float, action: Optional[int] = None) -> int:
+        """
+        Passo fixo: converte tempo real decorrido (x time_scale) em ticks de
+        update(). Retorna quantos ticks rodaram (0 se o frame foi curto).
+        """
+        ticks = self.sim_clock.accumulate(real_seconds)
+        for _ in range(ticks):
+            self.update(action)
+        return ticks
+
+    def _follow_player(self) -> TileBounds:
+        """Leva a câmera ao jogador; retorna a região ativa (tiles visíveis + margem)."""
+        player = self.player
+        half = player.size / 2
+        self.camera.follow((player.x + half, player.y + half), self.game_map.pixel_size())
+        return self.camera.tile_bounds(self.game_map, GAME_CONFIG['ACTIVE_MARGIN'])
+
+    def _active_enemies(self, active: TileBounds) -> List[Enemy]:
+        """
+        Inimigos a atualizar neste tick. Se a região ativa é o mapa inteiro
+        (mapas que cabem na tela), todos, na ordem da lista; senão só os do
+        índice dentro dela, linha a linha: o custo não cresce com o mapa.
+        """
+        if active == (0, 0, self.game_map.width, self.game_map.height):
+            return self.enemies[:]
+        return list(self.enemy_index.query_tiles(*active))
 
     # ---------------------------------------------------------------------
     def _plant_bomb(self):
-        current_time = time.time()
+        current_time = self.sim_clock.time()
         # capacidade: número de bombas ativas < capacidade do jogador
         if len(self.bombs) >= self.player.bomb_capacity:
             return
@@ -130,128 +353,361 @@ class GameEngine:
         # não planta em parede ou em tile com outra bomba
         if not self.game_map.can_place_bomb(grid_x, grid_y):
             return
-        if any(b.grid_x == grid_x and b.grid_y == grid_y for b in self.bombs):
+        if self.bomb_index.at(grid_x, grid_y):
             return
 
-        bomb = Bomb(grid_x, grid_y, GAME_CONFIG['BOMB_TIMER'])
+        bomb = Bomb(grid_x, grid_y, GAME_CONFIG['BOMB_TIMER'], self.sim_clock,
+                    radius=self.player.flame_radius, pool=self.bomb_pool)
         self.bombs.append(bomb)
+        self.bomb_index.add(bomb, (grid_x, grid_y))
+        self.flow_field.invalidate()
+        self.danger.add_bomb(bomb, current_time)
         self.last_bomb_time = current_time
 
         # libera pass-through somente para o tile atual
         self.player.soft_bomb_tile = (grid_x, grid_y)
 
+    def _detonate(self, due_bombs: List[Bomb]):
+        # cascata inteira (reações em cadeia) resolvida de uma vez
+        chain = resolve_chain(due_bombs, self.bomb_index, self.blast_rays)
+        detonated = set()
+        for bomb, tiles in chain:
+            detonated.add(bomb)
+            self.bomb_index.remove(bomb)
+            explosion = Explosion(tiles, self.sim_clock)
+            self.explosions.append(explosion)
+            self.flames.ignite(tiles, explosion.expires_at)
+        self.bombs = [b for b in self.bombs if b not in detonated]
+        self.flow_field.invalidate()
+        self.danger.remove_bombs(detonated)
+        for bomb in detonated:
+            self.bomb_pool.release(bomb)
+
+        # destruição só depois: todas as chamas usaram o mapa do início do tick
+        for _, tiles in chain:
+            self._apply_destruction_and_spawn_powerups(tiles)
+
     def _apply_destruction_and_spawn_powerups(self, explosion_tiles: List[Tuple[int, int]]):
         for gx, gy in explosion_tiles:
             if not self.game_map.is_valid_position(gx, gy):
                 continue
             if self.game_map.is_destructible_wall(gx, gy):
                 self.game_map.destroy_wall(gx, gy)
+                self.walls_destroyed += 1
                 self.score += GAME_CONFIG['WALL_SCORE']
                 # drop chance
-                if random.random() < GAME_CONFIG['POWERUP_DROP_CHANCE']:
-                    ptype = random.choice([PowerUpType.BOMB, PowerUpType.FIRE,
+                if self.rng.powerups.random() < GAME_CONFIG['POWERUP_DROP_CHANCE']:
+                    ptype = self.rng.powerups.choice([PowerUpType.BOMB, PowerUpType.FIRE,
                                            PowerUpType.SPEED, PowerUpType.HEART])
-                    self.powerups.append(PowerUp(gx, gy, ptype))
+                    powerup = PowerUp(gx, gy, ptype)
+                    self.powerups.append(powerup)
+                    self.powerup_index.add(powerup, (gx, gy))
 
     def _check_player_powerups(self):
         px, py = self.player.get_position()
         pgx, pgy = self.game_map.world_to_grid(px, py)
-        for pu in self.powerups[:]:
-            if (pu.grid_x, pu.grid_y) == (pgx, pgy):
-                pu.apply_to(self.player)
-                self.powerups.remove(pu)
-
-    def _damage_player(self):
+        for pu in list(self.powerup_index.at(pgx, pgy)):
+            pu.apply_to(self.player)
+            self.powerups_collected += 1
+            self.powerups.remove(pu)
+            self.powerup_index.remove(pu)
+
+    def _remove_enemy(self, enemy: Enemy):
+        self.enemies.remove(enemy)
+        self.enemy_index.remove(enemy)
+        self.enemy_pool.release(enemy)
+
+    def _damage_player(self, cause: str):
         if self.player.is_invincible():
             return
         self.player.lives -= 1
         if self.player.lives <= 0:
+            if not self.game_over:
+                self.death_cause = cause
             self.game_over = True
             return
         # respawn
         self.player.x, self.player.y = self.game_map.grid_to_world(1, 1)
-        self.player.rect.x = int(self.player.x)
-        self.player.rect.y = int(self.player.y)
         self.player.grant_invincibility(GAME_CONFIG['PLAYER_INVINCIBILITY_TIME'])
 
     def _check_collisions(self):
-        # contato com inimigo (pode desligar se quiser)
-        px, py = self.player.get_position()
-        pgx, pgy = self.game_map.world_to_grid(px, py)
-
-        for enemy in self.enemies[:]:
-            ex, ey = enemy.get_position()
-            egx, egy = self.game_map.world_to_grid(ex, ey)
-            if (pgx, pgy) == (egx, egy):
-                self._damage_player()
-                break
-
-        # chamas atingem jogador e inimigos
-        if any(expl.contains(pgx, pgy) for expl in self.explosions):
-            self._damage_player()
-
-        for enemy in self.enemies[:]:
-            egx, egy = self.game_map.world_to_grid(*enemy.get_position())
-            if any(expl.contains(egx, egy) for expl in self.explosions):
-                enemy.take_damage()
-                if enemy.is_dead():
-                    self.enemies.remove(enemy)
-                    self.score += GAME_CONFIG['ENEMY_SCORE']
+        now = self.sim_clock.time()
+        is_burning = self.flames.is_burning
+        pgx, pgy = self.game_map.world_to_grid(*self.player.get_position())
+
+        # contato com inimigo (pode desligar se quiser): consulta O(1) no índice
+        if self.enemy_index.at(pgx, pgy):
+            self._damage_player("enemy")
+
+        # chamas atingem jogador e inimigos: consulta O(1) no FlameGrid
+        if is_burning(pgx, pgy, now):
+            self._damage_player("flame")
+
+        # inimigos nos tiles das explosões ativas (o índice já tem o tile
+        # deste tick): o custo segue as chamas, não o total de inimigos, e
+        # vale também fora da região ativa
+        at = self.enemy_index.at
+        hit = {}
+        for expl in self.explosions:
+            for gx, gy in expl.tiles:
+                for enemy in at(gx, gy):
+                    hit[enemy] = None
+        for enemy in hit:
+            enemy.take_damage()
+            if enemy.is_dead():
+                self._remove_enemy(enemy)
+                self.score += GAME_CONFIG['ENEMY_SCORE']
 
     def _check_victory_condition(self):
         if len(self.enemies) == 0:
-            self.victory = True
             self.score += GAME_CONFIG['LEVEL_COMPLETE_BONUS']
+            if self.level >= GAME_CONFIG['LEVEL_COUNT']:
+                self.victory = True
+            else:
+                # troca no mesmo tick (determinístico para replays); o mapa
+                # novo normalmente já foi gerado em segundo plano
+                self._start_level(self.level + 1)
 
     # ---------------------------------------------------------------------
     # Render
     # ---------------------------------------------------------------------
     def render(self):
-        self.screen.fill(COLORS['BLACK'])
-        self.game_map.render(self.screen)
-
-        # power-ups (chão), bombas, explosões, inimigos, jogador
-        for pu in self.powerups:
-            pu.render(self.screen)
-        for bomb in self.bombs:
-            bomb.render(self.screen)
+        prof = self.profiler
+        prof.begin()
+        self._follow_player()
+        # câmera andou: tudo na tela mudou de lugar, então frame completo
+        if (self.render_mode == "dirty" and self._drawn_map is self.game_map
+                and self._drawn_offset == self.camera.offset):
+            pixels = self._render_dirty(prof)
+        else:
+            pixels = self._render_full(prof)
+        self.pixels_pushed = pixels
+        prof.count("pixels", pixels)
+        # o frame termina no render; loops headless sem render chamam end_frame()
+        prof.end_frame()
+
+    def _render_full(self, prof: FrameProfiler) -> int:
+        # o fundo em cache do mapa já limpa a tela; fill só se sobrar borda
+        map_w, map_h = self.game_map.pixel_size()
+        if map_w < self.screen_width or map_h < self.screen_height:
+            self.screen.fill(COLORS['BLACK'])
+        self.game_map.render(self.screen, self.camera.offset)
+        prof.lap("map")
+
+        overlay = self._overlay_items()
+        prof.lap("hud")
+
+        # power-ups (chão), bombas, explosões, inimigos, jogador: um blits por camada
+        layers = self._frame_layers(overlay)
+        for layer in layers[:-1]:
+            self.screen.blits([blit for _, blits, _ in layer for blit in blits], doreturn=False)
+        prof.lap("entities")
+
+        self.screen.blits([(surface, pos) for _, surface, pos in overlay], doreturn=False)
+        prof.lap("hud")
+        if not self.headless:
+            pygame.display.flip()
+        prof.lap("flip")
+
+        if self.render_mode == "dirty":
+            # base para o próximo frame
+            self._drawn_map = self.game_map
+            self._drawn_offset = self.camera.offset
+            self._drawn_keys = {key for layer in layers for _, _, keys in layer for key in keys}
+        return self.screen_width * self.screen_height
+
+    def _render_dirty(self, prof: FrameProfiler) -> int:
+        """
+        Redesenha só o que mudou desde o frame anterior: cada item visível
+        tem chaves (o que é, estado visual, rect); chaves que surgiram ou
+        sumiram viram dirty rects, junto com os tiles de parede destruídos.
+        Em cada dirty rect (com clip) o fundo do mapa é restaurado e os itens
+        que o tocam são redesenhados em ordem de camada, num único blits.
+        """
+        screen = self.screen
+        game_map = self.game_map
+        offset = self.camera.offset
+        dirty = [rect.move(-offset[0], -offset[1]) for rect in game_map.refresh()]
+        prof.lap("map")
+
+        overlay = self._overlay_items()
+        prof.lap("hud")
+        layers = self._frame_layers(overlay)
+        items = [item for layer in layers for item in layer]
+        # itens do overlay (última camada) a partir deste índice
+        first_overlay = len(items) - len(layers[-1])
+        keys = {key for _, _, item_keys in items for key in item_keys}
+        dirty += [pygame.Rect(key[-4:]) for key in keys ^ self._drawn_keys]
+        self._drawn_keys = keys
+        rects = _merge_rects(dirty, screen.get_rect())
+        prof.lap("entities")
+
+        if rects:
+            map_rect = pygame.Rect((-offset[0], -offset[1]), game_map.pixel_size())
+            bounds = [bound for bound, _, _ in items]
+            for rect in rects:
+                screen.set_clip(rect)
+                if not map_rect.contains(rect):
+                    screen.fill(COLORS['BLACK'], rect)
+                game_map.blit_region(screen, rect.clip(map_rect), offset)
+                prof.lap("map")
+                # em ordem de camada: entidades, depois o overlay por cima
+                hits = rect.collidelistall(bounds)
+                screen.blits([blit for index in hits if index < first_overlay for blit in items[index][1]],
+                             doreturn=False)
+                prof.lap("entities")
+                screen.blits([blit for index in hits if index >= first_overlay for blit in items[index][1]],
+                             doreturn=False)
+                prof.lap("hud")
+            screen.set_clip(None)
+
+        if rects and not self.headless:
+            pygame.display.update(rects)
+        prof.lap("flip")
+        return sum(rect.width * rect.height for rect in rects)
+
+    def _frame_layers(self, overlay: List[Tuple[tuple, pygame.Surface, Tuple[int, int]]]) -> List[List[tuple]]:
+        """
+        Camadas (power-ups, bombas, chamas, inimigos, jogador, overlay) de
+        itens (limites, blits, chaves) em coordenadas de tela: blits são
+        pares (surface, posição) do atlas de sprites; cada chave termina no
+        rect (x, y, w, h) que cobre. As chamas de todas as explosões são um
+        item só (_flame_layer). Em mapas maiores que a tela, só entra o que
+        os índices acham na área visível.
+        """
+        sprites = atlas.sprites()
+        game_map = self.game_map
+        ts = game_map.tile_size
+        camera = self.camera
+        ox, oy = camera.offset
+        if camera.covers(game_map.pixel_size()):
+            visible_powerups, visible_bombs, visible_enemies = self.powerups, self.bombs, self.enemies
+            flame_view = None
+        else:
+            flame_view = camera.tile_bounds(game_map)
+            # margem de 1 tile: entidades indexadas pelo canto ainda invadem a tela
+            view = camera.tile_bounds(game_map, 1)
+            visible_powerups = self.powerup_index.query_tiles(*view)
+            visible_bombs = self.bomb_index.query_tiles(*view)
+            visible_enemies = self.enemy_index.query_tiles(*view)
+
+        powerups = []
+        for pu in visible_powerups:
+            rect = pu.rect.move(-ox, -oy)
+            powerups.append((rect, ((sprites[pu.sprite_name], rect.topleft),), (("powerup", pu.ptype, *rect),)))
+
+        bombs = []
+        for bomb in visible_bombs:
+            rect = pygame.Rect(bomb.world_x - ox, bomb.world_y - oy, ts, ts)
+            blits = [(surface, (x - ox, y - oy)) for surface, (x, y) in bomb.sprites()]
+            # o número do timer entra na chave: mudou => redesenha
+            bombs.append((rect, blits, (("bomb", bomb.label(), *rect),)))
+
+        flames = []
+        overlay_tiles = self._flame_layer(flame_view)
+        if overlay_tiles:
+            surface, (x, y) = self._flame_overlay
+            pos = (x - ox, y - oy)
+            flames.append((surface.get_rect(topleft=pos), ((surface, pos),),
+                           [("flame", gx * ts - ox, gy * ts - oy, ts, ts) for gx, gy in overlay_tiles]))
+
+        enemies = []
+        enemy_sprite = sprites["enemy"]
+        for enemy in visible_enemies:
+            rect = enemy.rect.move(-ox, -oy)
+            enemies.append((rect, ((enemy_sprite, rect.topleft),), (("enemy", *rect),)))
+
+        player = self.player
+        rect = player.rect.move(-ox, -oy)
+        name = player.sprite_name
+        players = [(rect, ((sprites[name], rect.topleft),), ((name, *rect),))]
+
+        overlays = []
+        for key, surface, pos in overlay:
+            rect = surface.get_rect(topleft=pos)
+            overlays.append((rect, ((surface, pos),), (key + tuple(rect),)))
+        return [powerups, bombs, flames, enemies, players, overlays]
+
+    def _flame_layer(self, view: Optional[TileBounds] = None) -> set:
+        """
+        Tiles em chamas de todas as explosões ativas, recortados a `view`
+        (tiles visíveis; None = mapa inteiro na tela); a camada combinada
+        (self._flame_overlay) só é remontada quando esse conjunto muda.
+        Tiles cobertos por mais de uma explosão são misturados uma vez só.
+        """
+        tiles = set()
         for expl in self.explosions:
-            expl.render(self.screen)
-        for enemy in self.enemies:
-            enemy.render(self.screen)
-        self.player.render(self.screen)
-
-        self._render_ui()
-        pygame.display.flip()
-
-    def _render_ui(self):
-        font = pygame.font.Font(None, 36)
-
-        score_text = font.render(f"Score: {self.score}", True, COLORS['WHITE'])
-        level_text = font.render(f"Level: {self.level}", True, COLORS['WHITE'])
-
-        # status do player
-        status_text = font.render(
-            f"Lives: {self.player.lives}  Bombs: {len(self.bombs)}/{self.player.bomb_capacity}  Fire: {self.player.flame_radius}",
-            True, COLORS['WHITE']
-        )
-
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(level_text, (10, 44))
-        self.screen.blit(status_text, (10, 78))
+            tiles.update(expl.tiles)
+        if view is not None:
+            x0, y0, x1, y1 = view
+            tiles = {(x, y) for x, y in tiles if x0 <= x < x1 and y0 <= y < y1}
+        if tiles != self._flame_tiles:
+            self._flame_tiles = tiles
+            self._flame_overlay = atlas.flame_overlay(tiles) if tiles else None
+        return tiles
+
+    def _overlay_items(self) -> List[Tuple[tuple, pygame.Surface, Tuple[int, int]]]:
+        """HUD, avisos e overlay do profiler: (chave de conteúdo, surface, posição)."""
+        if not pygame.font.get_init():
+            return []
+        items = [(("hud", i, self._hud_key), surface, pos)
+                 for i, (surface, pos) in enumerate(self._hud_surfaces_for_frame())]
 
         if self.game_over:
-            go_text = font.render("GAME OVER - Press R to restart", True, COLORS['RED'])
+            go_text = text_cache.render("GAME OVER - Press R to restart", 36, COLORS['RED'])
             rect = go_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            self.screen.blit(go_text, rect)
+            items.append((("game_over",), go_text, rect.topleft))
 
         if self.victory:
-            vc_text = font.render("VICTORY! - Press R to restart", True, COLORS['GREEN'])
+            vc_text = text_cache.render("VICTORY! - Press R to restart", 36, COLORS['GREEN'])
             rect = vc_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            self.screen.blit(vc_text, rect)
+            items.append((("victory",), vc_text, rect.topleft))
+
+        if self.show_profiler:
+            items += [(("profiler", self._profiler_version, i), surface, pos)
+                      for i, (surface, pos) in enumerate(self._profiler_surfaces_for_frame())]
+        return items
+
+    def _hud_surfaces_for_frame(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        hud_key = (self.score, self.level, self.player.lives, len(self.bombs),
+                   self.player.bomb_capacity, self.player.flame_radius)
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+            score_text = text_cache.render(f"Score: {self.score}", 36, COLORS['WHITE'])
+            level_text = text_cache.render(f"Level: {self.level}", 36, COLORS['WHITE'])
+
+            # status do player
+            status_text = text_cache.render(
+                f"Lives: {self.player.lives}  Bombs: {len(self.bombs)}/{self.player.bomb_capacity}  Fire: {self.player.flame_radius}",
+                36, COLORS['WHITE']
+            )
+            self._hud_surfaces = [(score_text, (10, 10)), (level_text, (10, 44)), (status_text, (10, 78))]
+        return self._hud_surfaces
+
+    def toggle_profiler_overlay(self):
+        """
+        Mostra/esconde o overlay de tempos por fase. Só a exibição: se o
+        profiler mede (e grava CSV) é decidido por --profile/--profile-csv.
+        """
+        self.show_profiler = not self.show_profiler
+        self._profiler_surfaces = []
+
+    def _profiler_surfaces_for_frame(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        # os números mudam todo frame: re-rasteriza só a cada 30 frames e
+        # direto na fonte, sem poluir o cache de textos do HUD
+        if not self._profiler_surfaces or self.profiler.frames % 30 == 0:
+            font = fonts.get(18)
+            x = self.screen_width - 240
+            self._profiler_surfaces = [
+                (font.render(line, True, COLORS['YELLOW'], COLORS['BLACK']), (x, 10 + i * 16))
+                for i, line in enumerate(self.profiler.overlay_lines())
+            ]
+            self._profiler_version += 1
+        return self._profiler_surfaces
 
     # ---------------------------------------------------------------------
     def run(self):
+        frame_seconds = 1.0 / GAME_CONFIG['FPS']
         while self.running:
             # mantive por compat: se alguém chamar run direto
             for event in pygame.event.get():
@@ -259,9 +715,9 @@ class GameEngine:
                     self.running = False
                 else:
                     self.handle_event(event)
-            self.update()
+            self.advance(frame_seconds)
             self.render()
-            self.clock.tick(GAME_CONFIG['FPS'])
+            frame_seconds = self.clock.tick(GAME_CONFIG['FPS']) / 1000.0
 
         pygame.quit()
 
@@ -1,55 +1,136 @@
 import pygame
-from typing import List, Tuple, Optional
+import random
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, List, Tuple, Optional
 from ..utils.constants import GAME_CONFIG
+from ..utils.sprite_atlas import TILE_SPRITES, atlas
+
+# Tipos de tile codificados em um único ndarray uint8
+TILE_FLOOR = 0
+TILE_WALL = 1
+TILE_DESTRUCTIBLE = 2
+
+DESTRUCTIBLE_DENSITY = 0.3
+
+# camada estática em chunks de CHUNK_TILES x CHUNK_TILES tiles, criados ao
+# aparecer na tela e mantidos num LRU com teto chunk_budget(tela), nunca
+# abaixo de MIN_CACHED_CHUNKS
+CHUNK_TILES = 16
+MIN_CACHED_CHUNKS = 16
+# anel de chunks além dos visíveis mantido no cache (câmera indo e voltando)
+CHUNK_CACHE_RING = 1
+
+
+def chunk_budget(view_width: int, view_height: int, span: int, ring: int = CHUNK_CACHE_RING) -> int:
+    """
+    Teto do cache de chunks para uma viewport de view_width x view_height
+    pixels e chunks de `span` pixels: os (ceil(w/span)+1) x (ceil(h/span)+1)
+    que ela pode tocar (desalinhada), mais `ring` chunks em volta.
+    """
+    cols = -(-view_width // span) + 1 + 2 * ring
+    rows = -(-view_height // span) + 1 + 2 * ring
+    return max(MIN_CACHED_CHUNKS, cols * rows)
+
+
+def generate_tiles(width: int, height: int, np_rng: np.random.Generator,
+                   density: float = DESTRUCTIBLE_DENSITY, solid_density: float = 0.0) -> np.ndarray:
+    """
+    Gera o mapa inteiro de forma vetorizada:
+     - borda e pilares (x, y pares) sólidos;
+     - blocos destrutíveis com probabilidade `density`, fora da faixa de
+       2 tiles junto à borda (mantém o spawn do jogador livre);
+     - paredes sólidas extras com probabilidade `solid_density` na mesma
+       área (níveis altos); podem isolar bolsões, ver src.game.level.
+    """
+    ys, xs = np.ogrid[:height, :width]
+    solid = (xs == 0) | (xs == width - 1) | (ys == 0) | (ys == height - 1)
+    solid = solid | ((xs % 2 == 0) & (ys % 2 == 0))
+    eligible = ~solid & (xs >= 2) & (ys >= 2) & (xs < width - 2) & (ys < height - 2)
+
+    tiles = np.full((height, width), TILE_FLOOR, dtype=np.uint8)
+    tiles[solid] = TILE_WALL
+    tiles[eligible & (np_rng.random((height, width)) < density)] = TILE_DESTRUCTIBLE
+    if solid_density > 0:
+        # sorteio à parte: com solid_density = 0 o mapa é o mesmo de sempre
+        tiles[eligible & (np_rng.random((height, width)) < solid_density)] = TILE_WALL
+    return tiles
 
 
 class GameMap:
-    def __init__(self):
-        self.width = GAME_CONFIG['MAP_WIDTH']
-        self.height = GAME_CONFIG['MAP_HEIGHT']
+    def __init__(self, rng: random.Random = None, tiles: Optional[np.ndarray] = None):
+        """tiles: grade pronta (ex.: restaurada de um snapshot); pula a geração."""
+        # fluxo de aleatoriedade do engine (determinístico) ou um gerador próprio
+        self.rng = rng or random.Random()
+        if tiles is not None:
+            self.height, self.width = tiles.shape
+        else:
+            self.width = GAME_CONFIG['MAP_WIDTH']
+            self.height = GAME_CONFIG['MAP_HEIGHT']
         self.tile_size = GAME_CONFIG['TILE_SIZE']
+        # gerador numpy derivado do fluxo do mapa (mesma seed => mesmo mapa)
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+
+        # tiles[y, x] in {TILE_FLOOR, TILE_WALL, TILE_DESTRUCTIBLE}
+        self.tiles: np.ndarray = np.zeros((self.height, self.width), dtype=np.uint8)
+        self._cells = memoryview(self.tiles.reshape(-1))
+
+        # camada estática pré-renderizada, em chunks (cx, cy) -> Surface
+        # criados só quando visíveis, e tiles que mudaram desde então (só
+        # esses são redesenhados); memória e custo dependem da tela, não do
+        # mapa: um 500x500 inteiro seriam 20000x20000 pixels
+        self._chunks: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self.max_chunks = MIN_CACHED_CHUNKS
+        self._view_size: Tuple[int, int] = (0, 0)
+        self._dirty_tiles: set = set()
+        # observadores de destroy_wall (caches que dependem das paredes)
+        self._wall_listeners: List[Callable[[int, int], None]] = []
         
-        self.walls: List[List[int]] = []
-        self.destructible_walls: List[List[int]] = []
-        
-        self._generate_map()
+        if tiles is not None:
+            self.tiles = np.array(tiles, dtype=np.uint8)
+            self._cells = memoryview(self.tiles.reshape(-1))
+        else:
+            self._generate_map()
     
     def _generate_map(self):
-        self.walls = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        self.destructible_walls = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                if x == 0 or x == self.width - 1 or y == 0 or y == self.height - 1:
-                    self.walls[y][x] = 1
-                elif x % 2 == 0 and y % 2 == 0:
-                    self.walls[y][x] = 1
-                elif self._should_place_destructible_wall(x, y):
-                    self.destructible_walls[y][x] = 1
-    
-    def _should_place_destructible_wall(self, x: int, y: int) -> bool:
-        if x < 2 or y < 2 or x >= self.width - 2 or y >= self.height - 2:
-            return False
-        
-        if (x == 1 and y == 1) or (x == 2 and y == 1) or (x == 1 and y == 2):
-            return False
-        
-        import random
-        return random.random() < 0.3
+        self.tiles = generate_tiles(self.width, self.height, self.np_rng)
+        # visão 1-D do mesmo buffer: leitura escalar rápida (int Python, sem np.bool_)
+        self._cells = memoryview(self.tiles.reshape(-1))
+
+    # --- compat: antigas grades list-of-lists (agora visões derivadas) ---
+    @property
+    def walls(self) -> np.ndarray:
+        return (self.tiles == TILE_WALL).astype(np.uint8)
+
+    @property
+    def destructible_walls(self) -> np.ndarray:
+        return (self.tiles == TILE_DESTRUCTIBLE).astype(np.uint8)
+
+    def tile_at(self, x: int, y: int) -> int:
+        if not self.is_valid_position(x, y):
+            return TILE_WALL
+        return self._cells[y * self.width + x]
     
     def is_wall(self, x: int, y: int) -> bool:
         if not self.is_valid_position(x, y):
             return True
-        return self.walls[y][x] == 1
+        return self._cells[y * self.width + x] == TILE_WALL
     
     def is_destructible_wall(self, x: int, y: int) -> bool:
         if not self.is_valid_position(x, y):
             return False
-        return self.destructible_walls[y][x] == 1
+        return self._cells[y * self.width + x] == TILE_DESTRUCTIBLE
     
     def destroy_wall(self, x: int, y: int):
-        if self.is_valid_position(x, y):
-            self.destructible_walls[y][x] = 0
+        if self.is_valid_position(x, y) and self._cells[y * self.width + x] == TILE_DESTRUCTIBLE:
+            self._cells[y * self.width + x] = TILE_FLOOR
+            self._dirty_tiles.add((x, y))
+            for listener in self._wall_listeners:
+                listener(x, y)
+
+    def add_wall_listener(self, listener: Callable[[int, int], None]):
+        """listener(x, y) é chamado sempre que um bloco destrutível some."""
+        self._wall_listeners.append(listener)
     
     def can_place_bomb(self, x: int, y: int) -> bool:
         if not self.is_valid_position(x, y):
@@ -72,28 +153,109 @@ class GameMap:
     def is_player_position(self, x: int, y: int) -> bool:
         return x == 1 and y == 1
     
-    def get_enemy_spawn_positions(self) -> List[Tuple[int, int]]:
-        positions = []
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if not self.is_wall(x, y) and not self.is_destructible_wall(x, y):
-                    if not (x == 1 and y == 1):
-                        positions.append((x, y))
+    # --- consultas em lote (vetorizadas); retornam arrays N x 2 de (x, y) ---
+    def free_tiles(self) -> np.ndarray:
+        ys, xs = np.nonzero(self.tiles == TILE_FLOOR)
+        return np.column_stack((xs, ys))
+
+    def destructible_tiles(self) -> np.ndarray:
+        ys, xs = np.nonzero(self.tiles == TILE_DESTRUCTIBLE)
+        return np.column_stack((xs, ys))
+
+    def get_enemy_spawn_positions(self, count: int = 5) -> List[Tuple[int, int]]:
+        free = self.tiles == TILE_FLOOR
+        free[1, 1] = False  # spawn do jogador
+        ys, xs = np.nonzero(free)
         
-        import random
-        return random.sample(positions, min(5, len(positions)))
+        chosen = self.np_rng.choice(len(xs), size=min(count, len(xs)), replace=False)
+        return [(int(xs[i]), int(ys[i])) for i in chosen]
     
-    def render(self, screen: pygame.Surface):
-        for y in range(self.height):
-            for x in range(self.width):
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
-                                 self.tile_size, self.tile_size)
-                
-                if self.is_wall(x, y):
-                    pygame.draw.rect(screen, (100, 100, 100), rect)
-                elif self.is_destructible_wall(x, y):
-                    pygame.draw.rect(screen, (139, 69, 19), rect)
-                else:
-                    pygame.draw.rect(screen, (50, 50, 50), rect)
-                
-                pygame.draw.rect(screen, (0, 0, 0), rect, 1)
+    def pixel_size(self) -> Tuple[int, int]:
+        return self.width * self.tile_size, self.height * self.tile_size
+
+    def _tile_blits(self, cells, origin: Tuple[int, int] = (0, 0)) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(sprite, posição relativa a `origin` em pixels) de cada célula (x, y), prontos para Surface.blits."""
+        sprites = atlas.sprites()
+        by_code = [sprites[name] for name in TILE_SPRITES]
+        ts = self.tile_size
+        ox, oy = origin
+        tiles = self.tiles
+        return [(by_code[tiles[y, x]], (x * ts - ox, y * ts - oy)) for x, y in cells]
+
+    def _chunk_rect(self, cx: int, cy: int) -> pygame.Rect:
+        """Área do chunk em pixels de mundo (os da borda podem ser menores)."""
+        span = CHUNK_TILES * self.tile_size
+        map_w, map_h = self.pixel_size()
+        return pygame.Rect(cx * span, cy * span, min(span, map_w - cx * span), min(span, map_h - cy * span))
+
+    def _chunk(self, cx: int, cy: int) -> pygame.Surface:
+        chunk = self._chunks.get((cx, cy))
+        if chunk is not None:
+            self._chunks.move_to_end((cx, cy))
+            return chunk
+        rect = self._chunk_rect(cx, cy)
+        chunk = pygame.Surface(rect.size)
+        if pygame.display.get_surface() is not None:
+            # mesmo formato de pixel da tela => blit sem conversão
+            chunk = chunk.convert()
+        x0, y0 = cx * CHUNK_TILES, cy * CHUNK_TILES
+        cells = [(x, y) for y in range(y0, min(y0 + CHUNK_TILES, self.height))
+                 for x in range(x0, min(x0 + CHUNK_TILES, self.width))]
+        chunk.blits(self._tile_blits(cells, rect.topleft), doreturn=False)
+        self._chunks[(cx, cy)] = chunk
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def refresh(self) -> List[pygame.Rect]:
+        """
+        Redesenha nos chunks em memória os tiles que mudaram (os demais são
+        criados já atualizados). Retorna os rects (pixels de mundo) desses tiles.
+        """
+        ts = self.tile_size
+        changed = []
+        for x, y in self._dirty_tiles:
+            key = (x // CHUNK_TILES, y // CHUNK_TILES)
+            chunk = self._chunks.get(key)
+            if chunk is not None:
+                chunk.blits(self._tile_blits(((x, y),), self._chunk_rect(*key).topleft), doreturn=False)
+            changed.append(pygame.Rect(x * ts, y * ts, ts, ts))
+        self._dirty_tiles.clear()
+        return changed
+
+    def fit_view(self, width: int, height: int):
+        """
+        Ajusta o teto do cache à viewport (a tela que segue a câmera): um
+        frame nunca reconstrói chunks que ele mesmo usa, e a memória continua
+        limitada pelo tamanho da tela, não do mapa.
+        """
+        self._view_size = (width, height)
+        self.max_chunks = chunk_budget(width, height, CHUNK_TILES * self.tile_size)
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+
+    def blit_region(self, screen: pygame.Surface, rect: pygame.Rect, offset: Tuple[int, int] = (0, 0)):
+        """
+        Copia a camada estática sob `rect` (coordenadas de tela) para a tela;
+        `offset` é o canto da câmera no mundo. Só os chunks tocados são usados.
+        """
+        if screen.get_size() != self._view_size:
+            self.fit_view(*screen.get_size())
+        ox, oy = offset
+        world = rect.move(ox, oy).clip(pygame.Rect((0, 0), self.pixel_size()))
+        if not world.width or not world.height:
+            return
+        span = CHUNK_TILES * self.tile_size
+        blits = []
+        for cy in range(world.top // span, (world.bottom - 1) // span + 1):
+            for cx in range(world.left // span, (world.right - 1) // span + 1):
+                chunk_rect = self._chunk_rect(cx, cy)
+                part = world.clip(chunk_rect)
+                blits.append((self._chunk(cx, cy), (part.x - ox, part.y - oy),
+                              part.move(-chunk_rect.x, -chunk_rect.y)))
+        screen.blits(blits, doreturn=False)
+
+    def render(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
+        """Desenha a parte do mapa visível na tela, com a câmera em `offset`."""
+        self.refresh()
+        self.blit_region(screen, screen.get_rect(), offset)
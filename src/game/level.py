@@ -0,0 +1,174 @@
+"""
+Progressão de níveis.
+
+Cada nível é uma função pura de (seed do nível, número, tamanho do mapa):
+a seed vem de RngStreams.level_seed, então a mesma partida sempre gera a
+mesma campanha, não importa quando (ou em que thread) o nível foi gerado.
+A dificuldade cresce com o nível: mais inimigos, blocos destrutíveis mais
+densos e paredes sólidas extras.
+
+Paredes sólidas extras podem isolar partes do mapa; a validação analisa a
+componente conexa do spawn do jogador sobre os tiles não sólidos (chão e
+blocos destrutíveis): o que ficou fora vira parede e os inimigos só nascem
+dentro dela, então jogador e inimigos sempre se alcançam destruindo blocos.
+
+LevelPregenerator gera o próximo nível numa thread enquanto o atual é
+jogado; a troca de nível só pega o resultado pronto.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .game_map import DESTRUCTIBLE_DENSITY, TILE_FLOOR, TILE_WALL, generate_tiles
+from ..utils.constants import GAME_CONFIG
+
+Tile = Tuple[int, int]
+
+PLAYER_SPAWN: Tile = (1, 1)
+SPAWN_SAFE_DISTANCE = 4     # inimigos nascem a pelo menos 4 passos (Manhattan) do jogador
+MAX_ATTEMPTS = 8            # mapas que não comportam os inimigos são sorteados de novo
+_BASE_AREA = 20 * 15        # ENEMY_COUNT / LEVEL_ENEMY_STEP valem para este tamanho
+
+
+class LevelSpec:
+    """Parâmetros de dificuldade de um nível num mapa width x height."""
+
+    def __init__(self, level: int, width: int, height: int):
+        self.level = level
+        step = level - 1
+        area_scale = width * height / _BASE_AREA
+        # mapas grandes ganham mais inimigos, até LEVEL_MAX_ENEMIES
+        self.enemies = max(1, min(round((GAME_CONFIG['ENEMY_COUNT'] + GAME_CONFIG['LEVEL_ENEMY_STEP'] * step)
+                                        * area_scale), GAME_CONFIG['LEVEL_MAX_ENEMIES']))
+        self.density = min(DESTRUCTIBLE_DENSITY + GAME_CONFIG['LEVEL_DENSITY_STEP'] * step,
+                           GAME_CONFIG['LEVEL_MAX_DENSITY'])
+        self.solid_density = GAME_CONFIG['LEVEL_SOLID_STEP'] * step
+
+
+class LevelPlan:
+    """Um nível pronto: tiles validados e onde cada inimigo nasce."""
+
+    def __init__(self, level: int, tiles: np.ndarray, enemy_spawns: List[Tile]):
+        self.level = level
+        self.tiles = tiles
+        self.enemy_spawns = enemy_spawns
+
+
+# ---------------------------------------------------------------------------
+# Geração e validação
+# ---------------------------------------------------------------------------
+def reachable_mask(tiles: np.ndarray, start: Tile = PLAYER_SPAWN) -> np.ndarray:
+    """
+    Tiles alcançáveis a partir de `start` andando por chão e destruindo
+    blocos (tudo que não é parede sólida), vizinhança 4. Rotulação de
+    componentes vetorizada: cada aresta entre tiles abertos liga a raiz
+    maior à menor, e saltos de ponteiro (labels[labels]) achatam as
+    árvores; poucas rodadas bastam mesmo em 500x500, e o NumPy solta o GIL
+    nas operações grandes, então a thread de pré-geração quase não disputa
+    com o loop do jogo.
+    """
+    height, width = tiles.shape
+    sx, sy = start
+    if not (0 <= sx < width and 0 <= sy < height) or tiles[sy, sx] == TILE_WALL:
+        return np.zeros((height, width), dtype=bool)
+    open_cells = tiles != TILE_WALL
+    cells = np.arange(height * width, dtype=np.int32).reshape(height, width)
+    right = open_cells[:, :-1] & open_cells[:, 1:]
+    down = open_cells[:-1, :] & open_cells[1:, :]
+    a = np.concatenate((cells[:, :-1][right], cells[:-1, :][down]))
+    b = np.concatenate((cells[:, 1:][right], cells[1:, :][down]))
+    labels = cells.reshape(-1).copy()
+    while True:
+        label_a, label_b = labels[a], labels[b]
+        # arestas já dentro de uma mesma componente não voltam a importar
+        split = label_a != label_b
+        if not split.any():
+            break
+        a, b, label_a, label_b = a[split], b[split], label_a[split], label_b[split]
+        np.minimum.at(labels, np.maximum(label_a, label_b), np.minimum(label_a, label_b))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    return (labels == labels[sy * width + sx]).reshape(height, width)
+
+
+def _spawn_candidates(tiles: np.ndarray, reachable: np.ndarray) -> np.ndarray:
+    """Chão alcançável e longe do spawn do jogador, como N x 2 de (x, y)."""
+    height, width = tiles.shape
+    ys, xs = np.ogrid[:height, :width]
+    far = np.abs(xs - PLAYER_SPAWN[0]) + np.abs(ys - PLAYER_SPAWN[1]) >= SPAWN_SAFE_DISTANCE
+    ys, xs = np.nonzero((tiles == TILE_FLOOR) & reachable & far)
+    return np.column_stack((xs, ys))
+
+
+def generate_level(seed: int, level: int, width: int, height: int) -> LevelPlan:
+    """
+    Gera e valida o nível. Se o mapa sorteado não tem chão alcançável
+    suficiente para os inimigos, sorteia de novo (mesmo gerador, então
+    continua determinístico); na última tentativa, sem paredes extras.
+    """
+    spec = LevelSpec(level, width, height)
+    np_rng = np.random.default_rng(seed)
+    for attempt in range(MAX_ATTEMPTS):
+        solid_density = spec.solid_density if attempt < MAX_ATTEMPTS - 1 else 0.0
+        tiles = generate_tiles(width, height, np_rng, spec.density, solid_density)
+        reachable = reachable_mask(tiles)
+        # bolsões isolados viram parede: nada nasce nem cai onde não se chega
+        tiles[~reachable] = TILE_WALL
+        candidates = _spawn_candidates(tiles, reachable)
+        if len(candidates) >= spec.enemies or attempt == MAX_ATTEMPTS - 1:
+            break
+    chosen = np_rng.choice(len(candidates), size=min(spec.enemies, len(candidates)), replace=False)
+    spawns = [(int(candidates[i][0]), int(candidates[i][1])) for i in chosen]
+    return LevelPlan(level, tiles, spawns)
+
+
+# ---------------------------------------------------------------------------
+# Pré-geração em segundo plano
+# ---------------------------------------------------------------------------
+class LevelPregenerator:
+    """
+    Gera níveis numa thread de fundo (compartilhada por todos os engines).
+    prefetch() agenda; take() devolve o resultado pronto ou, se ninguém
+    pediu antes, gera na hora. O resultado é o mesmo nos dois caminhos.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self):
+        self._pending: Dict[tuple, Future] = {}
+        self.ready = 0      # take() com o nível já pronto
+        self.waited = 0     # take() esperou a thread terminar
+        self.inline = 0     # take() gerou na hora (sem prefetch)
+
+    @classmethod
+    def _pool(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-pregen")
+        return cls._executor
+
+    def prefetch(self, seed: int, level: int, width: int, height: int):
+        key = (seed, level, width, height)
+        if key not in self._pending:
+            self._pending[key] = self._pool().submit(generate_level, *key)
+
+    def take(self, seed: int, level: int, width: int, height: int) -> LevelPlan:
+        key = (seed, level, width, height)
+        future = self._pending.pop(key, None)
+        if future is None:
+            self.inline += 1
+            return generate_level(*key)
+        if future.done():
+            self.ready += 1
+        else:
+            self.waited += 1
+        return future.result()
+
+    def cancel(self):
+        """Descarta o que foi agendado (ex.: reset no meio da partida)."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
@@ -1,17 +1,27 @@
-import time
 import pygame
-from typing import Tuple, List, Optional
+from typing import Tuple, Optional
+from .actions import Action
+from .sim_clock import WALL_CLOCK
 from ..utils.constants import GAME_CONFIG, COLORS
+from ..utils.sprite_atlas import atlas
 
 class Player:
-    def __init__(self, x: int, y: int, speed: float):
+    __slots__ = ("x", "y", "speed", "clock", "lives", "invincible_until",
+                 "bomb_capacity", "flame_radius", "soft_bomb_tile")
+
+    color = COLORS['BLUE']
+
+    @property
+    def size(self) -> int:
+        # lido a cada acesso, não no import: TILE_SIZE pode mudar depois
+        # (batch_runner --set TILE_SIZE=...) e a hitbox tem que seguir a grade
+        return GAME_CONFIG['TILE_SIZE'] - 6
+
+    def __init__(self, x: int, y: int, speed: float, clock=None):
         self.x = x * GAME_CONFIG['TILE_SIZE']
         self.y = y * GAME_CONFIG['TILE_SIZE']
         self.speed = speed
-        self.size = GAME_CONFIG['TILE_SIZE'] - 6
-        self.color = COLORS['BLUE']
-
-        self.rect = pygame.Rect(self.x, self.y, self.size, self.size)
+        self.clock = clock or WALL_CLOCK
 
         # Bomberman attrs
         self.lives = GAME_CONFIG['PLAYER_LIVES']
@@ -23,30 +33,35 @@ class Player:
 
     # --- Helpers ---
     def is_invincible(self) -> bool:
-        return time.time() < self.invincible_until
+        return self.clock.time() < self.invincible_until
 
     def grant_invincibility(self, seconds: float):
-        self.invincible_until = time.time() + seconds
+        self.invincible_until = self.clock.time() + seconds
 
     def get_position(self) -> Tuple[float, float]:
         return self.x, self.y
 
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(int(self.x), int(self.y), self.size, self.size)
+
     # --- Update & movement ---
     def update(self,
-               keys: pygame.key.ScancodeWrapper,
+               action: int,
                game_map,
-               bombs: List,
+               bombs,
                soft_bomb_tile: Optional[Tuple[int, int]]):
+        """bombs: SpatialIndex das bombas (consulta por tile)."""
         dx = 0.0
         dy = 0.0
 
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if action & Action.LEFT:
             dx = -self.speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if action & Action.RIGHT:
             dx = self.speed if dx == 0 else dx  # sem diagonais rápidas
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if action & Action.UP:
             dy = -self.speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if action & Action.DOWN:
             dy = self.speed if dy == 0 else dy
 
         new_x = self.x + dx
@@ -58,9 +73,6 @@ class Player:
         if self._can_move_to(self.x, new_y, game_map, bombs, soft_bomb_tile):
             self.y = new_y
 
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
-
     def _can_move_to(self, x: float, y: float, game_map, bombs, soft_bomb_tile) -> bool:
         # Criar retângulo do player na nova posição
         player_rect = pygame.Rect(x, y, self.size, self.size)
@@ -79,8 +91,13 @@ class Player:
                 if not game_map.is_valid_position(grid_x, grid_y):
                     return False
                 
-                # Se é uma parede (sólida ou destrutível)
-                if game_map.is_wall(grid_x, grid_y) or game_map.is_destructible_wall(grid_x, grid_y):
+                # Parede (sólida ou destrutível) ou bomba (todas são parede),
+                # exceto a recém-plantada: enquanto o jogador ainda estiver
+                # neste mesmo tile, permitimos sair
+                blocked = game_map.is_wall(grid_x, grid_y) or game_map.is_destructible_wall(grid_x, grid_y)
+                if not blocked and bombs.at(grid_x, grid_y):
+                    blocked = (grid_x, grid_y) != soft_bomb_tile
+                if blocked:
                     # Verificar se o player está realmente colidindo com este tile
                     tile_rect = pygame.Rect(grid_x * GAME_CONFIG['TILE_SIZE'],
                                           grid_y * GAME_CONFIG['TILE_SIZE'],
@@ -88,22 +105,12 @@ class Player:
                     if player_rect.colliderect(tile_rect):
                         return False
 
-        # Colisão com bombas (todas são parede), exceto a recém-plantada
-        for b in bombs:
-            if (b.grid_x, b.grid_y) == soft_bomb_tile:
-                # enquanto o jogador ainda estiver neste mesmo tile, permitimos sair
-                continue
-            bomb_rect = pygame.Rect(b.grid_x * GAME_CONFIG['TILE_SIZE'],
-                                    b.grid_y * GAME_CONFIG['TILE_SIZE'],
-                                    GAME_CONFIG['TILE_SIZE'], GAME_CONFIG['TILE_SIZE'])
-            if player_rect.colliderect(bomb_rect):
-                return False
-
         return True
 
+    @property
+    def sprite_name(self) -> str:
+        # efeito visual de invencibilidade: variante ciano
+        return "player_invincible" if self.is_invincible() else "player"
+
     def render(self, screen: pygame.Surface):
-        color = self.color
-        # efeito visual de invencibilidade
-        if self.is_invincible():
-            color = COLORS['CYAN']
-        pygame.draw.rect(screen, color, self.rect)
+        screen.blit(atlas.get(self.sprite_name), self.rect)
@@ -1,6 +1,7 @@
 import pygame
 from typing import Tuple
-from ..utils.constants import GAME_CONFIG, COLORS
+from ..utils.constants import GAME_CONFIG
+from ..utils.sprite_atlas import atlas
 
 class PowerUpType:
     BOMB = "BOMB_UP"
@@ -8,21 +9,18 @@ class PowerUpType:
     SPEED = "SPEED_UP"
     HEART = "HEART"
 
-POWERUP_COLORS = {
-    PowerUpType.BOMB: COLORS['CYAN'],
-    PowerUpType.FIRE: COLORS['ORANGE'],
-    PowerUpType.SPEED: COLORS['YELLOW'],
-    PowerUpType.HEART: COLORS['PINK'],
-}
-
 class PowerUp:
+    __slots__ = ("grid_x", "grid_y", "ptype")
+
     def __init__(self, grid_x: int, grid_y: int, ptype: str):
         self.grid_x = grid_x
         self.grid_y = grid_y
         self.ptype = ptype
-        self.tile_size = GAME_CONFIG['TILE_SIZE']
-        self.rect = pygame.Rect(grid_x * self.tile_size, grid_y * self.tile_size,
-                                self.tile_size, self.tile_size)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        tile_size = GAME_CONFIG['TILE_SIZE']
+        return pygame.Rect(self.grid_x * tile_size, self.grid_y * tile_size, tile_size, tile_size)
 
     def apply_to(self, player) -> None:
         if self.ptype == PowerUpType.BOMB:
@@ -34,7 +32,9 @@ class PowerUp:
         elif self.ptype == PowerUpType.HEART:
             player.lives += 1  # vida extra
 
+    @property
+    def sprite_name(self) -> str:
+        return f"powerup:{self.ptype}"
+
     def render(self, screen: pygame.Surface):
-        color = POWERUP_COLORS.get(self.ptype, COLORS['WHITE'])
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, COLORS['BLACK'], self.rect, 2)
+        screen.blit(atlas.get(self.sprite_name), self.rect)
@@ -0,0 +1,30 @@
+import random
+from typing import Optional
+
+
+class RngStreams:
+    """
+    Fluxos de aleatoriedade independentes por engine, derivados de uma seed.
+    Cada subsistema usa o seu próprio fluxo, então consumir números em um
+    (ex.: drops de power-up) não altera a sequência dos outros (ex.: mapa).
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.map = self.stream("map")
+        self.enemies = self.stream("enemies")
+        self.powerups = self.stream("powerups")
+
+    def stream(self, name: str) -> random.Random:
+        # seeds str são determinísticas entre execuções (não usam hash())
+        return random.Random(f"{self.seed}:{name}")
+
+    def level_seed(self, level: int) -> int:
+        """Seed do gerador do nível `level` (mesma partida => mesma campanha)."""
+        return self.stream(f"level:{level}").getrandbits(64)
+
+    def next_seed(self) -> int:
+        """Seed da próxima partida (reinício), derivada desta."""
+        return self.stream("episodes").getrandbits(32)
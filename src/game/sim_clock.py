@@ -0,0 +1,53 @@
+import time
+from ..utils.constants import GAME_CONFIG
+
+
+class WallClock:
+    """Relógio de parede (time.time()); padrão para entidades criadas fora do engine."""
+
+    def time(self) -> float:
+        return time.time()
+
+
+WALL_CLOCK = WallClock()
+
+
+class SimClock:
+    """
+    Relógio de simulação com passo fixo.
+    - time() só avança em advance(), nunca lê o relógio real;
+    - accumulate(segundos_reais) converte tempo real (x time_scale) em
+      número de ticks fixos a executar, com teto por frame para que um
+      engasgo não vire uma avalanche de ticks.
+    """
+
+    def __init__(self, tick_rate: int = None, time_scale: float = 1.0,
+                 max_ticks_per_frame: int = None):
+        self.tick_rate = tick_rate or GAME_CONFIG['FPS']
+        self.dt = 1.0 / self.tick_rate
+        self.time_scale = time_scale
+        self.max_ticks_per_frame = max_ticks_per_frame or GAME_CONFIG['MAX_TICKS_PER_FRAME']
+        self.ticks = 0
+        self._accumulator = 0.0
+
+    def time(self) -> float:
+        # derivado do contador inteiro: sem deriva de soma de floats
+        return self.ticks * self.dt
+
+    def advance(self, ticks: int = 1):
+        self.ticks += ticks
+
+    def accumulate(self, real_seconds: float) -> int:
+        self._accumulator += real_seconds * self.time_scale
+        steps = int(self._accumulator / self.dt)
+        if steps > self.max_ticks_per_frame:
+            # descarta o excesso (jogo desacelera em vez de travar)
+            steps = self.max_ticks_per_frame
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * self.dt
+        return steps
+
+    def reset(self):
+        self.ticks = 0
+        self._accumulator = 0.0
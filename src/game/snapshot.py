@@ -0,0 +1,264 @@
+"""
+Snapshot binário do estado de uma partida (GameEngine.snapshot/restore).
+
+Só entra o estado primário; índices espaciais, FlameGrid, DangerMap,
+BlastRayTable e FlowField são reconstruídos no restore a partir dele.
+Os geradores aleatórios vão junto, então restaurar e repetir as mesmas
+ações reproduz a partida bit a bit (mesmo state_checksum do replay).
+
+Formato (little-endian):
+    cabeçalho   "BMSS" | versão u8 | largura, altura u16 | nº de inimigos,
+                bombas, explosões, power-ups u16 | nº de tiles de chama u32
+    estado      seed, ticks, relógio, flags, placar e jogador (_STATE)
+    tiles       u8 [altura x largura]
+    inimigos    f64 [n x 11]   x, y, velocidade, vida, vivo, direção (2),
+                               última troca, intervalo, tile alvo (2; nan = nenhum)
+    bombas      f64 [n x 5]    tile (2), timer, instante do plantio, raio
+    explosões   f64 [n x 3]    início, fim, nº de tiles | i16 [tiles x 2]
+    power-ups   u16 [n x 3]    tile (2), índice em POWERUP_TYPES
+    RNGs        mapa, inimigos, power-ups: u32 [625] + gauss (u8, f64);
+                PCG64 do mapa: estado e incremento (u128), has_uint32 u8, uinteger u32
+"""
+import math
+import struct
+from typing import List, Tuple
+
+import numpy as np
+
+from .bomb import Bomb
+from .enemy import Enemy
+from .explosion import Explosion
+from .game_map import GameMap
+from .powerup import PowerUp, PowerUpType
+from .rng import RngStreams
+
+MAGIC = b"BMSS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBHHHHHHI")
+# seed, ticks, acumulador | game_over, victory, death_cause, ação na fila |
+# score, level, paredes, power-ups, vidas | bombas, raio | soft_bomb_tile |
+# última bomba, x, y, velocidade, invencível até
+_STATE = struct.Struct("<qQdBBBBiiiiiBBhhddddd")
+_MT_STATE = struct.Struct("<625I")
+_MT_GAUSS = struct.Struct("<Bd")
+_PCG64 = struct.Struct("<16s16sBI")
+
+_ENEMY_COLUMNS = 11
+_BOMB_COLUMNS = 5
+_EXPLOSION_COLUMNS = 3
+
+DEATH_CAUSES = (None, "enemy", "flame")
+POWERUP_TYPES = (PowerUpType.BOMB, PowerUpType.FIRE, PowerUpType.SPEED, PowerUpType.HEART)
+
+
+class SnapshotError(ValueError):
+    """Bloco que não é um snapshot válido desta versão."""
+
+
+# ---------------------------------------------------------------------------
+# Geradores aleatórios
+# ---------------------------------------------------------------------------
+def _pack_random(rng) -> bytes:
+    version, internal, gauss = rng.getstate()
+    return _MT_STATE.pack(*internal) + _MT_GAUSS.pack(gauss is not None, gauss or 0.0)
+
+
+def _unpack_random(rng, data: bytes, pos: int) -> int:
+    internal = _MT_STATE.unpack_from(data, pos)
+    pos += _MT_STATE.size
+    has_gauss, gauss = _MT_GAUSS.unpack_from(data, pos)
+    rng.setstate((3, internal, gauss if has_gauss else None))
+    return pos + _MT_GAUSS.size
+
+
+def _pack_pcg64(generator: np.random.Generator) -> bytes:
+    state = generator.bit_generator.state
+    return _PCG64.pack(state["state"]["state"].to_bytes(16, "little"),
+                       state["state"]["inc"].to_bytes(16, "little"),
+                       state["has_uint32"], state["uinteger"])
+
+
+def _unpack_pcg64(generator: np.random.Generator, data: bytes, pos: int) -> int:
+    value, inc, has_uint32, uinteger = _PCG64.unpack_from(data, pos)
+    generator.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": int.from_bytes(value, "little"), "inc": int.from_bytes(inc, "little")},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+    return pos + _PCG64.size
+
+
+def _read_array(data: bytes, pos: int, dtype, shape: Tuple[int, ...]) -> Tuple[np.ndarray, int]:
+    count = int(np.prod(shape))
+    array = np.frombuffer(data, dtype=dtype, count=count, offset=pos).reshape(shape)
+    return array, pos + array.nbytes
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+def snapshot_engine(engine) -> bytes:
+    game_map = engine.game_map
+    player = engine.player
+    enemies = engine.enemies
+    bombs = engine.bombs
+    explosions = engine.explosions
+    powerups = engine.powerups
+
+    flame_tiles: List[Tuple[int, int]] = []
+    for explosion in explosions:
+        flame_tiles += explosion.tiles
+    soft_x, soft_y = player.soft_bomb_tile if player.soft_bomb_tile is not None else (-1, -1)
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, game_map.width, game_map.height, len(enemies), len(bombs),
+                     len(explosions), len(powerups), len(flame_tiles)),
+        _STATE.pack(engine.rng.seed, engine.sim_clock.ticks, engine.sim_clock._accumulator,
+                    engine.game_over, engine.victory, DEATH_CAUSES.index(engine.death_cause),
+                    engine._queued_action, engine.score, engine.level, engine.walls_destroyed,
+                    engine.powerups_collected, player.lives, player.bomb_capacity, player.flame_radius,
+                    soft_x, soft_y, engine.last_bomb_time, player.x, player.y, player.speed,
+                    player.invincible_until),
+        np.ascontiguousarray(game_map.tiles, dtype=np.uint8).tobytes(),
+    ]
+
+    nan = math.nan
+    rows = []
+    for enemy in enemies:
+        target_x, target_y = enemy.target_tile if enemy.target_tile is not None else (nan, nan)
+        rows.append((enemy.x, enemy.y, enemy.speed, enemy.health, enemy.is_alive,
+                     enemy.direction[0], enemy.direction[1], enemy.last_direction_change,
+                     enemy.direction_change_interval, target_x, target_y))
+    parts.append(np.array(rows, dtype="<f8").reshape(-1, _ENEMY_COLUMNS).tobytes())
+
+    rows = [(b.grid_x, b.grid_y, b.timer, b.plant_time, b.explosion_radius) for b in bombs]
+    parts.append(np.array(rows, dtype="<f8").reshape(-1, _BOMB_COLUMNS).tobytes())
+
+    rows = [(e.started, e.expires_at, len(e.tiles)) for e in explosions]
+    parts.append(np.array(rows, dtype="<f8").reshape(-1, _EXPLOSION_COLUMNS).tobytes())
+    parts.append(np.array(flame_tiles, dtype="<i2").reshape(-1, 2).tobytes())
+
+    rows = [(p.grid_x, p.grid_y, POWERUP_TYPES.index(p.ptype)) for p in powerups]
+    parts.append(np.array(rows, dtype="<u2").reshape(-1, 3).tobytes())
+
+    rng = engine.rng
+    parts += (_pack_random(rng.map), _pack_random(rng.enemies), _pack_random(rng.powerups),
+              _pack_pcg64(game_map.np_rng))
+    return b"".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Restore
+# ---------------------------------------------------------------------------
+def restore_engine(engine, data: bytes):
+    """
+    Substitui a partida do engine pela do snapshot. O mapa pode ter outro
+    tamanho que o do GAME_CONFIG atual; o render recria a camada estática.
+    """
+    data = bytes(data)
+    if len(data) < _HEADER.size + _STATE.size:
+        raise SnapshotError("bloco curto demais para um snapshot")
+    (magic, version, width, height, n_enemies, n_bombs,
+     n_explosions, n_powerups, n_flame_tiles) = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("não é um snapshot de GameEngine")
+    if version != VERSION:
+        raise SnapshotError(f"versão de snapshot {version} não suportada (esperada {VERSION})")
+    expected = (_HEADER.size + _STATE.size + width * height
+                + 8 * (n_enemies * _ENEMY_COLUMNS + n_bombs * _BOMB_COLUMNS
+                       + n_explosions * _EXPLOSION_COLUMNS)
+                + 4 * n_flame_tiles + 6 * n_powerups
+                + 3 * (_MT_STATE.size + _MT_GAUSS.size) + _PCG64.size)
+    if len(data) != expected:
+        raise SnapshotError(f"snapshot com {len(data)} bytes, esperado {expected}")
+
+    (seed, ticks, accumulator, game_over, victory, death_cause, queued_action,
+     score, level, walls_destroyed, powerups_collected, lives, bomb_capacity, flame_radius,
+     soft_x, soft_y, last_bomb_time, player_x, player_y, player_speed,
+     invincible_until) = _STATE.unpack_from(data, _HEADER.size)
+    pos = _HEADER.size + _STATE.size
+    tiles, pos = _read_array(data, pos, np.uint8, (height, width))
+    enemy_rows, pos = _read_array(data, pos, "<f8", (n_enemies, _ENEMY_COLUMNS))
+    bomb_rows, pos = _read_array(data, pos, "<f8", (n_bombs, _BOMB_COLUMNS))
+    explosion_rows, pos = _read_array(data, pos, "<f8", (n_explosions, _EXPLOSION_COLUMNS))
+    flame_tiles, pos = _read_array(data, pos, "<i2", (n_flame_tiles, 2))
+    powerup_rows, pos = _read_array(data, pos, "<u2", (n_powerups, 3))
+
+    if engine.recorder is not None:
+        # o replay em curso não descreve mais esta partida
+        engine.recorder.on_reset(engine)
+    engine.rng = RngStreams(seed)
+    clock = engine.sim_clock
+    clock.ticks = ticks
+    clock._accumulator = accumulator
+
+    engine.game_over = bool(game_over)
+    engine.victory = bool(victory)
+    engine.death_cause = DEATH_CAUSES[death_cause]
+    engine.score = score
+    engine.level = level
+    engine.walls_destroyed = walls_destroyed
+    engine.powerups_collected = powerups_collected
+
+    engine._build_world(GameMap(engine.rng.map, tiles=tiles))
+    game_map = engine.game_map
+    engine.last_bomb_time = last_bomb_time
+    engine._queued_action = queued_action
+
+    player = engine.player
+    player.x, player.y = player_x, player_y
+    player.speed = player_speed
+    player.lives = lives
+    player.invincible_until = invincible_until
+    player.bomb_capacity = bomb_capacity
+    player.flame_radius = flame_radius
+    player.soft_bomb_tile = (soft_x, soft_y) if soft_x >= 0 else None
+
+    for (x, y, speed, health, alive, dir_x, dir_y, last_change, interval,
+         target_x, target_y) in enemy_rows.tolist():
+        enemy = Enemy(0, 0, speed, clock, engine.rng.enemies, pool=engine.enemy_pool)
+        enemy.x, enemy.y = x, y
+        enemy.health = int(health)
+        enemy.is_alive = bool(alive)
+        enemy.direction = (int(dir_x), int(dir_y))
+        enemy.last_direction_change = last_change
+        enemy.direction_change_interval = interval
+        enemy.target_tile = None if math.isnan(target_x) else (int(target_x), int(target_y))
+        engine.enemies.append(enemy)
+        engine.enemy_index.add(enemy, game_map.world_to_grid(x, y))
+
+    for grid_x, grid_y, timer, plant_time, radius in bomb_rows.tolist():
+        bomb = Bomb(int(grid_x), int(grid_y), timer, clock, radius=int(radius), pool=engine.bomb_pool)
+        bomb.plant_time = plant_time
+        engine.bombs.append(bomb)
+        engine.bomb_index.add(bomb, (bomb.grid_x, bomb.grid_y))
+
+    flame_tiles = [tuple(tile) for tile in flame_tiles.tolist()]
+    start = 0
+    for started, expires_at, count in explosion_rows.tolist():
+        count = int(count)
+        explosion = Explosion(flame_tiles[start:start + count], clock)
+        start += count
+        explosion.started = started
+        explosion.expires_at = expires_at
+        engine.explosions.append(explosion)
+        engine.flames.ignite(explosion.tiles, expires_at)
+
+    for grid_x, grid_y, ptype in powerup_rows.tolist():
+        powerup = PowerUp(grid_x, grid_y, POWERUP_TYPES[ptype])
+        engine.powerups.append(powerup)
+        engine.powerup_index.add(powerup, (grid_x, grid_y))
+
+    # depois das chamas: o DangerMap considera as chamas acesas
+    now = clock.time()
+    for bomb in engine.bombs:
+        engine.danger.add_bomb(bomb, now)
+
+    # por último: os construtores acima consumiram números dos fluxos
+    rng = engine.rng
+    pos = _unpack_random(rng.map, data, pos)
+    pos = _unpack_random(rng.enemies, data, pos)
+    pos = _unpack_random(rng.powerups, data, pos)
+    _unpack_pcg64(game_map.np_rng, data, pos)
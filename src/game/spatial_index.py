@@ -0,0 +1,93 @@
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Tile = Tuple[int, int]
+
+_EMPTY: Tuple = ()
+
+
+class SpatialIndex:
+    """
+    Hash espacial por tile: (grid_x, grid_y) -> entidades naquele tile.
+    O engine mantém o índice em sincronia (spawn, movimento, morte), então
+    "o que há no tile (x, y)?" e "o que há perto deste retângulo?" custam
+    O(1) / O(tiles tocados) em vez de varrer a lista inteira.
+    """
+
+    def __init__(self, tile_size: int):
+        self.tile_size = tile_size
+        self._cells: Dict[Tile, List[Hashable]] = {}
+        self._tile_of: Dict[Hashable, Tile] = {}
+
+    def add(self, entity: Hashable, tile: Tile):
+        self._cells.setdefault(tile, []).append(entity)
+        self._tile_of[entity] = tile
+
+    def add_many(self, entities: Iterable[Hashable], tiles: Iterable[Tile]):
+        cells, tile_of = self._cells, self._tile_of
+        for entity, tile in zip(entities, tiles):
+            cells.setdefault(tile, []).append(entity)
+            tile_of[entity] = tile
+
+    def remove(self, entity: Hashable):
+        tile = self._tile_of.pop(entity, None)
+        if tile is None:
+            return
+        bucket = self._cells[tile]
+        bucket.remove(entity)
+        if not bucket:
+            del self._cells[tile]
+
+    def move(self, entity: Hashable, tile: Tile):
+        """Atualiza o tile da entidade (no-op se não mudou, o caso comum)."""
+        old = self._tile_of.get(entity)
+        if old == tile:
+            return
+        if old is not None:
+            self.remove(entity)
+        self.add(entity, tile)
+
+    def at(self, grid_x: int, grid_y: int) -> Sequence[Hashable]:
+        return self._cells.get((grid_x, grid_y), _EMPTY)
+
+    def first_at(self, grid_x: int, grid_y: int) -> Optional[Hashable]:
+        bucket = self._cells.get((grid_x, grid_y))
+        return bucket[0] if bucket else None
+
+    def tile_of(self, entity: Hashable) -> Optional[Tile]:
+        return self._tile_of.get(entity)
+
+    def tiles(self) -> Iterable[Tile]:
+        """Tiles ocupados por ao menos uma entidade."""
+        return self._cells.keys()
+
+    def query_rect(self, x: float, y: float, width: float, height: float) -> Iterator[Hashable]:
+        """Entidades nos tiles tocados pelo retângulo (em coordenadas de mundo)."""
+        ts = self.tile_size
+        return self.query_tiles(int(x // ts), int(y // ts),
+                                int((x + width) // ts) + 1, int((y + height) // ts) + 1)
+
+    def query_tiles(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[Hashable]:
+        """Entidades nos tiles x0 <= x < x1, y0 <= y < y1 (linha a linha)."""
+        cells = self._cells
+        if len(cells) < (x1 - x0) * (y1 - y0):
+            # poucos tiles ocupados: varre os ocupados, na mesma ordem
+            hits = sorted((grid_y, grid_x) for grid_x, grid_y in cells
+                          if x0 <= grid_x < x1 and y0 <= grid_y < y1)
+            for grid_y, grid_x in hits:
+                yield from cells[(grid_x, grid_y)]
+            return
+        for grid_y in range(y0, y1):
+            for grid_x in range(x0, x1):
+                bucket = cells.get((grid_x, grid_y))
+                if bucket:
+                    yield from bucket
+
+    def clear(self):
+        self._cells.clear()
+        self._tile_of.clear()
+
+    def __len__(self) -> int:
+        return len(self._tile_of)
+
+    def __contains__(self, entity: Hashable) -> bool:
+        return entity in self._tile_of
@@ -1,15 +1,19 @@
+import argparse
 import pygame
 import sys
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 from .game.game_engine import GameEngine
 from .ui.menu import Menu
 from .ui.score_display import ScoreDisplay
 from .database.score_manager import ScoreManager
+from .sim.replay import ReplayRecorder
 from .utils.constants import GAME_CONFIG
+from .utils.profiler import FrameProfiler
 
 
 class BombermanApp:
-    def __init__(self):
+    def __init__(self, profiler: Optional[FrameProfiler] = None, record_path: Optional[str] = None,
+                 render_mode: str = "dirty"):
         pygame.init()
         self.screen_width = GAME_CONFIG['SCREEN_WIDTH']
         self.screen_height = GAME_CONFIG['SCREEN_HEIGHT']
@@ -17,7 +21,14 @@ class BombermanApp:
         pygame.display.set_caption("Bomberman")
         
         self.clock = pygame.time.Clock()
+        self.frame_seconds = 1.0 / GAME_CONFIG['FPS']
         self.running = True
+        # compartilhado entre partidas: janela de percentis e CSV contínuos
+        self.profiler = profiler or FrameProfiler()
+        # grava cada partida em replay (a última partida sobrescreve o arquivo)
+        self.record_path = record_path
+        self.recorder: Optional[ReplayRecorder] = None
+        self.render_mode = render_mode
         
         self.current_state = "menu"
         self.game_engine: Optional[GameEngine] = None
@@ -38,7 +49,17 @@ class BombermanApp:
     
     def _start_game(self):
         self.current_state = "game"
-        self.game_engine = GameEngine(self.screen_width, self.screen_height)
+        self.game_engine = GameEngine(self.screen_width, self.screen_height, profiler=self.profiler,
+                                      render_mode=self.render_mode)
+        if self.profiler.enabled:
+            self.game_engine.show_profiler = True
+        if self.record_path:
+            self.recorder = ReplayRecorder(self.game_engine)
+    
+    def _finish_recording(self):
+        if self.recorder is not None:
+            self.recorder.save(self.record_path)
+            self.recorder = None
     
     def _show_high_scores(self):
         self.current_state = "high_scores"
@@ -59,6 +80,7 @@ class BombermanApp:
     
     def _handle_game_events(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self._finish_recording()
             self.current_state = "menu"
             self.game_engine = None
         else:
@@ -99,9 +121,11 @@ class BombermanApp:
     
     def update(self):
         if self.current_state == "game" and self.game_engine:
-            self.game_engine.update()
+            # passo fixo: o tempo real do último frame vira N ticks de simulação
+            self.game_engine.advance(self.frame_seconds)
             
             if self.game_engine.is_game_over() or self.game_engine.is_victory():
+                self._finish_recording()
                 if self.score_manager.is_high_score(self.game_engine.get_score()):
                     self.current_state = "name_input"
                     self.is_entering_name = True
@@ -110,10 +134,12 @@ class BombermanApp:
                     self.game_engine = None
     
     def render(self):
+        if self.current_state == "game" and self.game_engine:
+            # o engine apresenta o próprio frame (flip ou display.update(rects))
+            self.game_engine.render()
+            return
         if self.current_state == "menu":
             self.menu.render(self.screen)
-        elif self.current_state == "game" and self.game_engine:
-            self.game_engine.render()
         elif self.current_state == "high_scores":
             high_scores = self.score_manager.get_high_scores()
             self.score_display.render_high_scores(self.screen, high_scores)
@@ -129,14 +155,50 @@ class BombermanApp:
             self.handle_events()
             self.update()
             self.render()
-            self.clock.tick(GAME_CONFIG['FPS'])
+            self.frame_seconds = self.clock.tick(GAME_CONFIG['FPS']) / 1000.0
         
+        self._finish_recording()
+        self.profiler.close()
+        self.score_manager.close()
         pygame.quit()
         sys.exit()
 
 
-def main():
-    app = BombermanApp()
+def _map_size(value: str) -> Tuple[int, int]:
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"esperado LARGURAxALTURA, ex.: 500x500 (recebido {value!r})")
+    if width < 5 or height < 5:
+        raise argparse.ArgumentTypeError("o mapa precisa de ao menos 5x5 tiles")
+    return width, height
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Bomberman")
+    parser.add_argument("--profile", action="store_true",
+                        help="liga o profiler por fase e o overlay (F3 alterna)")
+    parser.add_argument("--profile-csv", metavar="PATH",
+                        help="grava os tempos de cada frame em CSV (implica --profile)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="grava a partida em replay (python -m src.sim.replay play PATH)")
+    parser.add_argument("--full-redraw", action="store_true",
+                        help="redesenha a tela inteira todo frame (sem dirty rects)")
+    parser.add_argument("--map-size", type=_map_size, metavar="WxH",
+                        help="tamanho do mapa em tiles (ex.: 500x500); maior que a tela, a câmera segue o jogador")
+    parser.add_argument("--enemy-ai", choices=("wander", "chase"), default=GAME_CONFIG['ENEMY_AI'],
+                        help="movimento dos inimigos: aleatório ou perseguindo o jogador (flow field)")
+    args = parser.parse_args(argv)
+
+    GAME_CONFIG['ENEMY_AI'] = args.enemy_ai
+    if args.map_size:
+        GAME_CONFIG['MAP_WIDTH'], GAME_CONFIG['MAP_HEIGHT'] = args.map_size
+
+    profiler = FrameProfiler(enabled=args.profile or bool(args.profile_csv))
+    if args.profile_csv:
+        profiler.start_csv(args.profile_csv)
+    app = BombermanApp(profiler, record_path=args.record,
+                       render_mode="full" if args.full_redraw else "dirty")
     app.run()
 
 
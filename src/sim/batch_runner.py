@@ -0,0 +1,274 @@
+"""
+Simulação em lote: roda partidas headless com seed em um
+ProcessPoolExecutor (todos os núcleos) para balancear GAME_CONFIG.
+
+Cada worker devolve colunas compactas (arrays NumPy) por bloco de
+partidas; o processo principal agrega estatísticas de forma incremental
+e grava todas as colunas em um arquivo .npz.
+
+Uso:
+    python -m src.sim.batch_runner --games 100000 --set POWERUP_DROP_CHANCE=0.3 \\
+        --output data/sim_results.npz
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Sequence
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+from ..game.actions import Action
+from ..game.game_engine import GameEngine
+from ..utils.constants import GAME_CONFIG
+
+# como a partida terminou (coluna "end_cause" guarda o índice)
+END_CAUSES = ("timeout", "victory", "enemy", "flame")
+
+COLUMNS = ("seed", "score", "ticks", "level", "walls_destroyed", "powerups_collected", "end_cause")
+METRICS = ("score", "ticks", "level", "walls_destroyed", "powerups_collected")
+
+MOVES = (Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN)
+OPPOSITE = {Action.LEFT: Action.RIGHT, Action.RIGHT: Action.LEFT,
+            Action.UP: Action.DOWN, Action.DOWN: Action.UP}
+
+
+class RandomPolicy:
+    """Anda em direções aleatórias (trocando a cada ~0.25s) e planta bombas ao acaso."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.move = Action.NONE
+
+    def act(self, engine: GameEngine) -> int:
+        if engine.sim_clock.ticks % 15 == 0:
+            self.move = self.rng.choice((Action.NONE,) + MOVES)
+        bomb = Action.BOMB if self.rng.random() < 0.02 else Action.NONE
+        return self.move | bomb
+
+
+class ScriptedPolicy:
+    """
+    Planta uma bomba, foge desfazendo os últimos passos e espera a
+    explosão; depois volta a explorar. Simples, mas sobrevive mais
+    que a aleatória, o que dá partidas mais longas para balanceamento.
+    """
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.trail: List[int] = []
+        self.move = Action.NONE
+        self.escape: List[int] = []
+        self.last_position = None
+
+    def act(self, engine: GameEngine) -> int:
+        position = engine.player.get_position()
+        if position != self.last_position and self.move != Action.NONE:
+            # só passos que de fato moveram o jogador entram na trilha;
+            # voltar pelo mesmo caminho cancela o passo anterior
+            if self.trail and self.trail[-1] == OPPOSITE[self.move]:
+                self.trail.pop()
+            else:
+                self.trail.append(self.move)
+        self.last_position = position
+
+        if self.escape:
+            self.move = Action.NONE
+            return self.escape.pop()
+        if engine.bombs or engine.explosions:
+            self.move = Action.NONE
+            return Action.NONE
+        if engine.sim_clock.ticks % 20 == 0:
+            # passos para sair do alcance da chama (raio + folga de 1.5 tile)
+            needed = int((engine.player.flame_radius + 1.5) * GAME_CONFIG['TILE_SIZE'] / engine.player.speed)
+            if self._is_straight_enough(self.trail[-needed:], needed) and self.rng.random() < 0.3:
+                # desfaz os passos recentes ao fugir da própria bomba
+                self.escape = [OPPOSITE[m] for m in self.trail[-needed:]]
+                self.trail.clear()
+                self.move = Action.NONE
+                return Action.BOMB
+            self.move = self.rng.choice(MOVES)
+        return self.move
+
+    @staticmethod
+    def _is_straight_enough(steps: List[int], needed: int) -> bool:
+        # trilha que vai e volta não afasta o jogador da bomba
+        if len(steps) < needed:
+            return False
+        dx = steps.count(Action.RIGHT) - steps.count(Action.LEFT)
+        dy = steps.count(Action.DOWN) - steps.count(Action.UP)
+        return abs(dx) + abs(dy) >= needed
+
+
+POLICIES = {"random": RandomPolicy, "scripted": ScriptedPolicy}
+
+
+def _apply_overrides(overrides: Dict[str, float]):
+    GAME_CONFIG.update(overrides)
+
+
+def run_games(seeds: Sequence[int], max_ticks: int, policy: str) -> Dict[str, np.ndarray]:
+    """Roda um bloco de partidas (no worker) e devolve uma coluna por métrica."""
+    engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True)
+    columns = {name: np.zeros(len(seeds), dtype=np.int64) for name in COLUMNS}
+    columns["end_cause"] = np.zeros(len(seeds), dtype=np.uint8)
+
+    for row, seed in enumerate(seeds):
+        engine.reset(seed)
+        agent = POLICIES[policy](seed)
+        ticks = 0
+        while ticks < max_ticks and not (engine.game_over or engine.victory):
+            engine.update(agent.act(engine))
+            ticks += 1
+
+        if engine.victory:
+            cause = "victory"
+        elif engine.game_over:
+            cause = engine.death_cause
+        else:
+            cause = "timeout"
+        columns["seed"][row] = seed
+        columns["score"][row] = engine.score
+        columns["ticks"][row] = ticks
+        columns["level"][row] = engine.level
+        columns["walls_destroyed"][row] = engine.walls_destroyed
+        columns["powerups_collected"][row] = engine.powerups_collected
+        columns["end_cause"][row] = END_CAUSES.index(cause)
+    return columns
+
+
+class RunningStats:
+    """Média/variância (Welford, combinando blocos), mínimo e máximo incrementais."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add_batch(self, values: np.ndarray):
+        if values.size == 0:
+            return
+        n = values.size
+        mean = float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        delta = mean - self.mean
+        total = self.count + n
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def summary(self) -> dict:
+        std = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+        return {"mean": round(self.mean, 4), "std": round(std, 4), "min": self.min, "max": self.max}
+
+
+class BatchAggregator:
+    def __init__(self):
+        self.stats = {name: RunningStats() for name in METRICS}
+        self.end_causes = np.zeros(len(END_CAUSES), dtype=np.int64)
+        self.chunks: List[Dict[str, np.ndarray]] = []
+
+    def add(self, columns: Dict[str, np.ndarray]):
+        for name in METRICS:
+            self.stats[name].add_batch(columns[name])
+        self.end_causes += np.bincount(columns["end_cause"], minlength=len(END_CAUSES))
+        self.chunks.append(columns)
+
+    @property
+    def games(self) -> int:
+        return int(self.end_causes.sum())
+
+    def summary(self) -> dict:
+        return {
+            "games": self.games,
+            "metrics": {name: stats.summary() for name, stats in self.stats.items()},
+            "end_causes": {cause: int(n) for cause, n in zip(END_CAUSES, self.end_causes)},
+        }
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: np.concatenate([c[name] for c in self.chunks]) if self.chunks
+                else np.zeros(0, dtype=np.int64) for name in COLUMNS}
+
+
+def run_batch(games: int, workers: int, chunk_size: int, max_ticks: int, policy: str,
+              base_seed: int, overrides: Dict[str, float], progress=None) -> BatchAggregator:
+    aggregator = BatchAggregator()
+    seeds = range(base_seed, base_seed + games)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, games, chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_apply_overrides,
+                             initargs=(overrides,)) as executor:
+        # limita blocos em voo: resultados chegam em streaming e a memória fica estável
+        pending = set()
+        next_chunk = 0
+        while next_chunk < len(chunks) or pending:
+            while next_chunk < len(chunks) and len(pending) < workers * 2:
+                pending.add(executor.submit(run_games, list(chunks[next_chunk]), max_ticks, policy))
+                next_chunk += 1
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                aggregator.add(future.result())
+            if progress:
+                progress(aggregator)
+    return aggregator
+
+
+def _parse_override(text: str):
+    key, sep, value = text.partition("=")
+    if not sep or key not in GAME_CONFIG:
+        raise argparse.ArgumentTypeError(f"esperado CHAVE=VALOR com chave de GAME_CONFIG: {text!r}")
+    current = GAME_CONFIG[key]
+    try:
+        return key, type(current)(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inválido para {key}: {value!r}")
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Batch headless Bomberman simulation")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--max-ticks", type=int, default=GAME_CONFIG['FPS'] * 180,
+                        help="limite de ticks por partida (padrão: 3 min de jogo)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="seed da primeira partida")
+    parser.add_argument("--set", dest="overrides", type=_parse_override, action="append", default=[],
+                        metavar="KEY=VALUE", help="sobrescreve GAME_CONFIG nos workers")
+    parser.add_argument("--output", default="data/sim_results.npz", help="colunas por partida (.npz)")
+    args = parser.parse_args(argv)
+
+    overrides = dict(args.overrides)
+    start = time.perf_counter()
+
+    def progress(aggregator: BatchAggregator):
+        elapsed = time.perf_counter() - start
+        print(f"\r{aggregator.games}/{args.games} partidas ({aggregator.games / elapsed:.0f}/s)",
+              end="", flush=True)
+
+    aggregator = run_batch(args.games, args.workers, args.chunk_size, args.max_ticks,
+                           args.policy, args.seed, overrides, progress)
+    elapsed = time.perf_counter() - start
+    print()
+
+    summary = aggregator.summary()
+    summary.update({"policy": args.policy, "overrides": overrides, "workers": args.workers,
+                    "seconds": round(elapsed, 3)})
+
+    if os.path.dirname(args.output):
+        os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    np.savez_compressed(args.output, end_cause_names=np.array(END_CAUSES), **aggregator.columns())
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Replays determinísticos: seed + fingerprint do GAME_CONFIG + a ação de
+cada tick, com checksums periódicos do estado para detectar desync.
+
+Formato (.bmr):
+    cabeçalho  "BMRP" | versão u8 | seed i64 | tick_rate u16 |
+               intervalo de checksum u16 | ticks u32 | fingerprint 8 bytes
+    corpo      zlib( varint nº de runs | (ação u8, varint repetições)* |
+                     varint nº de checksums | crc32 u32* |
+                     varint tamanho | JSON dos valores de GAME_CONFIG fora do padrão )
+
+O fingerprint é do GAME_CONFIG inteiro da gravação; os valores fora do
+padrão (--map-size, --enemy-ai, ...) vão no corpo e o ReplayPlayer os
+aplica durante a reprodução. Versão 1 não tem esse bloco.
+
+A maioria dos ticks repete a ação anterior, então as ações viram poucas
+runs (ação, repetições). Uso:
+    python -m src.sim.replay info replay.bmr
+    python -m src.sim.replay play replay.bmr [--realtime]
+"""
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import time
+import zlib
+from typing import List, Optional, Tuple
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from ..game.game_engine import GameEngine
+from ..utils.constants import DEFAULT_GAME_CONFIG, GAME_CONFIG
+
+MAGIC = b"BMRP"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+_HEADER = struct.Struct("<4sBqHHI8s")
+
+DEFAULT_CHECKSUM_INTERVAL = 60   # um checksum por segundo de jogo
+
+
+class ReplayError(Exception):
+    """Arquivo de replay inválido ou incompatível com este build."""
+
+
+class ReplayDesyncError(ReplayError):
+    def __init__(self, tick: int, expected: int, actual: int):
+        super().__init__(f"desync no tick {tick}: checksum {actual:#010x}, esperado {expected:#010x}")
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint / checksum
+# ---------------------------------------------------------------------------
+def config_fingerprint(config: Optional[dict] = None) -> bytes:
+    """8 bytes do sha1 do GAME_CONFIG serializado (chaves ordenadas)."""
+    payload = json.dumps(config if config is not None else GAME_CONFIG, sort_keys=True)
+    return hashlib.sha1(payload.encode()).digest()[:8]
+
+
+def config_overrides() -> dict:
+    """Valores do GAME_CONFIG atual que diferem do padrão (DEFAULT_GAME_CONFIG)."""
+    return {key: value for key, value in GAME_CONFIG.items() if DEFAULT_GAME_CONFIG.get(key) != value}
+
+
+@contextlib.contextmanager
+def applied_config(overrides: dict):
+    """GAME_CONFIG com `overrides` aplicados; restaura os valores anteriores ao sair."""
+    original = dict(GAME_CONFIG)
+    GAME_CONFIG.update(overrides)
+    try:
+        yield
+    finally:
+        GAME_CONFIG.clear()
+        GAME_CONFIG.update(original)
+
+
+def state_checksum(engine: GameEngine) -> int:
+    """crc32 do estado que importa para a simulação (mapa, entidades, placar)."""
+    crc = zlib.crc32(engine.game_map.tiles.tobytes())
+    player = engine.player
+    values = [engine.sim_clock.ticks, engine.score, player.x, player.y, player.lives,
+              player.bomb_capacity, player.flame_radius, player.speed, len(engine.enemies)]
+    for enemy in engine.enemies:
+        values += (enemy.x, enemy.y)
+    for bomb in engine.bombs:
+        values += (bomb.grid_x, bomb.grid_y, bomb.plant_time)
+    for powerup in engine.powerups:
+        values += (powerup.grid_x, powerup.grid_y)
+    return zlib.crc32(struct.pack(f"<{len(values)}d", *values), crc)
+
+
+# ---------------------------------------------------------------------------
+# Varints
+# ---------------------------------------------------------------------------
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("corpo do replay truncado")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+class Replay:
+    def __init__(self, seed: int, tick_rate: int, fingerprint: bytes,
+                 checksum_interval: int = DEFAULT_CHECKSUM_INTERVAL, config: Optional[dict] = None):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.fingerprint = fingerprint
+        self.checksum_interval = checksum_interval
+        self.config = dict(config or {})     # GAME_CONFIG fora do padrão na gravação
+        self.runs: List[List[int]] = []      # [ação, repetições]
+        self.checksums: List[int] = []       # após os ticks interval, 2*interval, ...
+        self.ticks = 0
+
+    def append(self, action: int):
+        if self.runs and self.runs[-1][0] == action:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([action, 1])
+        self.ticks += 1
+
+    def actions(self):
+        for action, count in self.runs:
+            for _ in range(count):
+                yield action
+
+    # -----------------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        body = bytearray()
+        _write_varint(body, len(self.runs))
+        for action, count in self.runs:
+            body.append(action)
+            _write_varint(body, count)
+        _write_varint(body, len(self.checksums))
+        body += struct.pack(f"<{len(self.checksums)}I", *self.checksums)
+        config = json.dumps(self.config, sort_keys=True).encode()
+        _write_varint(body, len(config))
+        body += config
+        header = _HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate,
+                              self.checksum_interval, self.ticks, self.fingerprint)
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size:
+            raise ReplayError("arquivo curto demais para um replay")
+        magic, version, seed, tick_rate, interval, ticks, fingerprint = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("não é um arquivo de replay")
+        if version not in SUPPORTED_VERSIONS:
+            raise ReplayError(f"versão de replay {version} não suportada (esperada {VERSION})")
+        try:
+            body = zlib.decompress(data[_HEADER.size:])
+        except zlib.error as error:
+            raise ReplayError(f"corpo do replay corrompido: {error}")
+
+        replay = cls(seed, tick_rate, fingerprint, interval)
+        count, pos = _read_varint(body, 0)
+        for _ in range(count):
+            action = body[pos]
+            repeat, pos = _read_varint(body, pos + 1)
+            replay.runs.append([action, repeat])
+        replay.ticks = sum(repeat for _, repeat in replay.runs)
+        if replay.ticks != ticks:
+            raise ReplayError(f"cabeçalho diz {ticks} ticks, corpo tem {replay.ticks}")
+        count, pos = _read_varint(body, pos)
+        replay.checksums = list(struct.unpack_from(f"<{count}I", body, pos))
+        pos += 4 * count
+        if version >= 2:
+            size, pos = _read_varint(body, pos)
+            try:
+                replay.config = json.loads(body[pos:pos + size].decode())
+            except ValueError as error:
+                raise ReplayError(f"config do replay corrompida: {error}")
+        return replay
+
+    def save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """
+    Gancho de gravação do GameEngine (engine.recorder): recebe a ação
+    efetiva de cada tick executado. Grava uma partida; um reset() do
+    engine encerra a gravação.
+    """
+
+    def __init__(self, engine: GameEngine, checksum_interval: int = DEFAULT_CHECKSUM_INTERVAL):
+        if engine.sim_clock.ticks != 0:
+            raise ReplayError("a gravação precisa começar no tick 0 (logo após reset)")
+        self.replay = Replay(engine.seed, engine.sim_clock.tick_rate, config_fingerprint(), checksum_interval,
+                             config_overrides())
+        self.recording = True
+        engine.recorder = self
+
+    def on_tick(self, engine: GameEngine, action: int):
+        if not self.recording:
+            return
+        replay = self.replay
+        replay.append(action)
+        if replay.ticks % replay.checksum_interval == 0:
+            replay.checksums.append(state_checksum(engine))
+
+    def on_reset(self, engine: GameEngine):
+        self.recording = False
+
+    def save(self, path: str):
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    """
+    Reexecuta um replay conferindo os checksums a cada intervalo, com os
+    valores de GAME_CONFIG gravados no replay aplicados (e desfeitos no fim).
+    """
+
+    def __init__(self, replay: Replay, strict_config: bool = True):
+        with applied_config(replay.config):
+            if strict_config and replay.fingerprint != config_fingerprint():
+                raise ReplayError("replay gravado com outro GAME_CONFIG (use strict_config=False para tentar mesmo assim)")
+            if replay.tick_rate != GAME_CONFIG['FPS']:
+                raise ReplayError(f"replay a {replay.tick_rate} ticks/s, este build roda a {GAME_CONFIG['FPS']}")
+        self.replay = replay
+
+    def make_engine(self, headless: bool = True) -> GameEngine:
+        with applied_config(self.replay.config):
+            return GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                              headless=headless, seed=self.replay.seed)
+
+    def run(self, engine: Optional[GameEngine] = None, realtime: bool = False) -> GameEngine:
+        """
+        headless (padrão): o mais rápido possível. realtime: abre a janela,
+        renderiza e respeita o FPS. Levanta ReplayDesyncError no 1º checksum
+        divergente.
+        """
+        with applied_config(self.replay.config):
+            return self._run(engine or self.make_engine(headless=not realtime), realtime)
+
+    def _run(self, engine: GameEngine, realtime: bool) -> GameEngine:
+        replay = self.replay
+        interval = replay.checksum_interval
+        checksums = replay.checksums
+        tick = 0
+        for action in replay.actions():
+            engine.update(action)
+            tick += 1
+            if tick % interval == 0:
+                index = tick // interval - 1
+                if index < len(checksums):
+                    actual = state_checksum(engine)
+                    if actual != checksums[index]:
+                        raise ReplayDesyncError(tick, checksums[index], actual)
+            if realtime:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return engine
+                engine.render()
+                engine.clock.tick(replay.tick_rate)
+        return engine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bomberman replay tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    info = sub.add_parser("info", help="mostra o cabeçalho e o tamanho do replay")
+    info.add_argument("path")
+    play = sub.add_parser("play", help="reexecuta conferindo checksums")
+    play.add_argument("path")
+    play.add_argument("--realtime", action="store_true", help="abre a janela e joga no FPS normal")
+    play.add_argument("--ignore-config", action="store_true", help="não exige o mesmo GAME_CONFIG")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    if args.command == "info":
+        print(json.dumps({
+            "seed": replay.seed,
+            "ticks": replay.ticks,
+            "seconds": round(replay.ticks / replay.tick_rate, 2),
+            "runs": len(replay.runs),
+            "checksums": len(replay.checksums),
+            "bytes": os.path.getsize(args.path),
+            "config": replay.config,
+            "config_matches": replay.fingerprint == config_fingerprint({**GAME_CONFIG, **replay.config}),
+        }, indent=2))
+        return
+
+    start = time.perf_counter()
+    engine = ReplayPlayer(replay, strict_config=not args.ignore_config).run(realtime=args.realtime)
+    elapsed = time.perf_counter() - start
+    print(f"{replay.ticks} ticks em {elapsed:.3f}s ({replay.ticks / max(elapsed, 1e-9):.0f} ticks/s), "
+          f"sem desync; score final {engine.score}")
+
+
+if __name__ == "__main__":
+    main()
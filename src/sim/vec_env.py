@@ -0,0 +1,448 @@
+"""
+Ambiente vetorizado: N partidas independentes avançadas por uma única
+chamada de step(), com o estado de todas em arrays NumPy compartilhados.
+
+As regras seguem GameEngine.update tick a tick (movimento com colisão
+AABB, bombas com capacidade/cooldown/pass-through, reações em cadeia,
+chamas, power-ups, dano/invencibilidade e pontuação de GAME_CONFIG).
+Mapa e posições iniciais dos inimigos são gerados como no GameEngine com
+a mesma seed; já os sorteios por tick (direção dos inimigos, drops) usam
+um hash contador (seed, tick, entidade), então cada partida é
+reprodutível independentemente das outras do lote, mas não replica os
+fluxos random.Random do engine. Os inimigos usam sempre o movimento
+aleatório (ENEMY_AI = "wander", o padrão); com ENEMY_AI = "chase" o engine
+persegue por flow field e o ambiente se recusa a rodar, já que não o replica.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..game.actions import Action
+from ..game.game_map import TILE_FLOOR, TILE_WALL, TILE_DESTRUCTIBLE
+from ..game.level import generate_level
+from ..game.rng import RngStreams
+from ..utils.constants import GAME_CONFIG
+
+# planos da observação (N, C, H, W)
+OBS_CHANNELS = ("wall", "destructible", "bomb", "flame", "powerup", "enemy", "player")
+
+# power-ups no grid: 0 = nenhum; mesma ordem do sorteio em GameEngine
+POWERUP_NONE, POWERUP_BOMB, POWERUP_FIRE, POWERUP_SPEED, POWERUP_HEART = range(5)
+
+# mesma ordem de Enemy: [(1, 0), (-1, 0), (0, 1), (0, -1)]
+ENEMY_DIRECTIONS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.float64)
+BLAST_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+# sais do hash contador, um por tipo de sorteio
+_SALT_DIR, _SALT_INTERVAL, _SALT_BLOCK_X, _SALT_BLOCK_Y, _SALT_DROP, _SALT_TYPE = range(1, 7)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    # finalizador splitmix64 (aritmética uint64 com wrap-around)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _uniform(seeds: np.ndarray, tick: np.ndarray, index: np.ndarray, salt: int) -> np.ndarray:
+    """Uniforme em [0, 1) determinística por (seed, tick, índice, sal), com broadcast."""
+    with np.errstate(over="ignore"):
+        h = _mix64(seeds.astype(np.uint64) + _GOLDEN * np.uint64(salt))
+        h = _mix64(h ^ (np.asarray(tick, dtype=np.uint64) + _GOLDEN))
+        h = _mix64(h ^ (np.asarray(index, dtype=np.uint64) * _GOLDEN))
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+class VecBombermanEnv:
+    def __init__(self, num_envs: int, max_enemies: int = 5, max_episode_ticks: Optional[int] = None):
+        if GAME_CONFIG['ENEMY_AI'] != 'wander':
+            raise ValueError(f"VecBombermanEnv só replica ENEMY_AI = 'wander' "
+                             f"(configurado: {GAME_CONFIG['ENEMY_AI']!r})")
+        self.num_envs = num_envs
+        self.max_enemies = max_enemies
+        self.max_episode_ticks = max_episode_ticks
+
+        self.width = GAME_CONFIG['MAP_WIDTH']
+        self.height = GAME_CONFIG['MAP_HEIGHT']
+        self.tile_size = GAME_CONFIG['TILE_SIZE']
+        self.actor_size = self.tile_size - 6
+        self.dt = 1.0 / GAME_CONFIG['FPS']
+        self.max_bombs = GAME_CONFIG['MAX_BOMB_CAPACITY']
+
+        n, h, w = num_envs, self.height, self.width
+        e, b = max_enemies, self.max_bombs
+
+        self.seeds = np.zeros(n, dtype=np.uint64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.victory = np.zeros(n, dtype=bool)
+
+        self.tiles = np.zeros((n, h, w), dtype=np.uint8)
+        self.flame_expiry = np.full((n, h, w), -np.inf)
+        self.powerups = np.zeros((n, h, w), dtype=np.uint8)
+        self.bomb_slot = np.full((n, h, w), -1, dtype=np.int8)
+
+        self.player_x = np.zeros(n)
+        self.player_y = np.zeros(n)
+        self.player_speed = np.zeros(n)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.bomb_capacity = np.zeros(n, dtype=np.int64)
+        self.flame_radius = np.zeros(n, dtype=np.int64)
+        self.invincible_until = np.zeros(n)
+        self.last_bomb_time = np.zeros(n)
+        self.soft_x = np.zeros(n, dtype=np.int64)
+        self.soft_y = np.zeros(n, dtype=np.int64)
+
+        self.bomb_active = np.zeros((n, b), dtype=bool)
+        self.bomb_x = np.zeros((n, b), dtype=np.int64)
+        self.bomb_y = np.zeros((n, b), dtype=np.int64)
+        self.bomb_plant_time = np.zeros((n, b))
+        self.bomb_radius = np.zeros((n, b), dtype=np.int64)
+
+        self.enemy_alive = np.zeros((n, e), dtype=bool)
+        self.enemy_x = np.zeros((n, e))
+        self.enemy_y = np.zeros((n, e))
+        self.enemy_dir = np.zeros((n, e), dtype=np.int64)
+        self.enemy_last_change = np.zeros((n, e))
+        self.enemy_interval = np.zeros((n, e))
+
+        self._env_ids = np.arange(n)
+
+    # ------------------------------------------------------------------
+    # Reset
+    # ------------------------------------------------------------------
+    def reset(self, seeds: Optional[Sequence[int]] = None) -> np.ndarray:
+        if seeds is None:
+            seeds = [RngStreams().seed for _ in range(self.num_envs)]
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"esperadas {self.num_envs} seeds, recebidas {len(seeds)}")
+        self._reset_envs(np.arange(self.num_envs), [int(s) for s in seeds])
+        return self._observe()
+
+    def _reset_envs(self, env_ids: np.ndarray, seeds: Sequence[int]):
+        ts = self.tile_size
+        for i, seed in zip(env_ids, seeds):
+            # mesmo gerador do GameEngine(seed=...): mesmo mapa e mesmos spawns
+            # do 1º nível (o ambiente vetorizado joga só um nível por episódio)
+            plan = generate_level(RngStreams(seed).level_seed(1), 1, self.width, self.height)
+            self.tiles[i] = plan.tiles
+            spawns = plan.enemy_spawns[:self.max_enemies]
+            self.enemy_alive[i] = False
+            for j, (gx, gy) in enumerate(spawns):
+                self.enemy_alive[i, j] = True
+                self.enemy_x[i, j] = gx * ts
+                self.enemy_y[i, j] = gy * ts
+            self.seeds[i] = seed
+
+        ids = env_ids
+        self.ticks[ids] = 0
+        self.score[ids] = 0
+        self.game_over[ids] = False
+        self.victory[ids] = False
+        self.flame_expiry[ids] = -np.inf
+        self.powerups[ids] = POWERUP_NONE
+        self.bomb_slot[ids] = -1
+
+        self.player_x[ids] = ts
+        self.player_y[ids] = ts
+        self.player_speed[ids] = GAME_CONFIG['PLAYER_SPEED']
+        self.lives[ids] = GAME_CONFIG['PLAYER_LIVES']
+        self.bomb_capacity[ids] = GAME_CONFIG['PLAYER_BOMB_CAPACITY']
+        self.flame_radius[ids] = GAME_CONFIG['EXPLOSION_RADIUS']
+        self.invincible_until[ids] = 0.0
+        self.last_bomb_time[ids] = -np.inf
+        self.soft_x[ids] = -1
+        self.soft_y[ids] = -1
+        self.bomb_active[ids] = False
+
+        # direção e intervalo iniciais sorteados no tick 0 (como Enemy.__init__)
+        seeds_col = self.seeds[ids][:, None]
+        enemy_idx = np.arange(self.max_enemies)[None, :]
+        self.enemy_dir[ids] = (_uniform(seeds_col, 0, enemy_idx, _SALT_DIR) * 4).astype(np.int64)
+        self.enemy_interval[ids] = 1.0 + 1.5 * _uniform(seeds_col, 0, enemy_idx, _SALT_INTERVAL)
+        self.enemy_last_change[ids] = 0.0
+
+    # ------------------------------------------------------------------
+    # Step
+    # ------------------------------------------------------------------
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Avança um tick em todas as partidas. Retorna (obs, rewards, dones,
+        info); rewards é o ganho de pontuação no tick. Partidas encerradas
+        são reiniciadas automaticamente (obs já é a da nova partida);
+        info["final_score"] guarda a pontuação final delas.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        live = ~(self.game_over | self.victory)
+        now = self.ticks * self.dt
+        score_before = self.score.copy()
+
+        self._plant_bombs(actions, live, now)
+        self._move_player(actions, live)
+        self._update_enemies(live, now)
+        self._detonate(live, now)
+        self._collect_powerups(live)
+        self._check_collisions(live, now)
+
+        self.victory |= live & ~self.enemy_alive.any(axis=1)
+        self.score += np.where(live & self.victory, GAME_CONFIG['LEVEL_COMPLETE_BONUS'], 0)
+        self.ticks += live
+
+        rewards = (self.score - score_before).astype(np.float32)
+        dones = self.game_over | self.victory
+        if self.max_episode_ticks is not None:
+            dones |= self.ticks >= self.max_episode_ticks
+
+        info = {
+            "final_score": np.where(dones, self.score, 0),
+            "victory": self.victory.copy(),
+            "ticks": self.ticks.copy(),
+        }
+        finished = np.flatnonzero(dones)
+        if finished.size:
+            next_seeds = [RngStreams(int(self.seeds[i])).next_seed() for i in finished]
+            self._reset_envs(finished, next_seeds)
+        return self._observe(), rewards, dones, info
+
+    # ------------------------------------------------------------------
+    def _tile_of(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        ts = self.tile_size
+        return (x // ts).astype(np.int64), (y // ts).astype(np.int64)
+
+    def _can_move_to(self, env: np.ndarray, x: np.ndarray, y: np.ndarray,
+                     soft_x: np.ndarray = None, soft_y: np.ndarray = None) -> np.ndarray:
+        """
+        Versão vetorizada de Player/Enemy._can_move_to para arrays de
+        posições (com broadcast de `env`). Com soft_x/soft_y, bombas também
+        bloqueiam (exceto a do tile de pass-through), como para o jogador.
+        """
+        ts, size = self.tile_size, self.actor_size
+        # pygame.Rect trunca coordenadas float
+        rx = np.trunc(x).astype(np.int64)
+        ry = np.trunc(y).astype(np.int64)
+        gx0, gy0 = self._tile_of(x, y)
+        gx1, gy1 = self._tile_of(x + size, y + size)
+
+        ok = np.ones(np.broadcast(env, x).shape, dtype=bool)
+        for gx, gy in ((gx0, gy0), (gx1, gy0), (gx0, gy1), (gx1, gy1)):
+            valid = (gx >= 0) & (gx < self.width) & (gy >= 0) & (gy < self.height)
+            cx = np.clip(gx, 0, self.width - 1)
+            cy = np.clip(gy, 0, self.height - 1)
+            blocked = self.tiles[env, cy, cx] != TILE_FLOOR
+            if soft_x is not None:
+                bomb_here = self.bomb_slot[env, cy, cx] >= 0
+                blocked |= bomb_here & ~((gx == soft_x) & (gy == soft_y))
+            collide = (rx < gx * ts + ts) & (rx + size > gx * ts) & (ry < gy * ts + ts) & (ry + size > gy * ts)
+            ok &= valid & ~(blocked & collide)
+        return ok
+
+    def _plant_bombs(self, actions: np.ndarray, live: np.ndarray, now: np.ndarray):
+        env = self._env_ids
+        gx, gy = self._tile_of(self.player_x, self.player_y)
+        gx = np.clip(gx, 0, self.width - 1)
+        gy = np.clip(gy, 0, self.height - 1)
+        active_count = self.bomb_active.sum(axis=1)
+        want = (live & ((actions & Action.BOMB) != 0)
+                & (active_count < self.bomb_capacity)
+                & (now - self.last_bomb_time >= GAME_CONFIG['BOMB_COOLDOWN'])
+                & (self.tiles[env, gy, gx] == TILE_FLOOR)
+                & (self.bomb_slot[env, gy, gx] < 0))
+        if not want.any():
+            return
+        ids = np.flatnonzero(want)
+        slots = np.argmin(self.bomb_active[ids], axis=1)  # primeiro slot livre
+        self.bomb_active[ids, slots] = True
+        self.bomb_x[ids, slots] = gx[ids]
+        self.bomb_y[ids, slots] = gy[ids]
+        self.bomb_plant_time[ids, slots] = now[ids]
+        self.bomb_radius[ids, slots] = self.flame_radius[ids]
+        self.bomb_slot[ids, gy[ids], gx[ids]] = slots
+        self.last_bomb_time[ids] = now[ids]
+        self.soft_x[ids] = gx[ids]
+        self.soft_y[ids] = gy[ids]
+
+    def _move_player(self, actions: np.ndarray, live: np.ndarray):
+        env = self._env_ids
+        speed = self.player_speed
+        left = (actions & Action.LEFT) != 0
+        right = (actions & Action.RIGHT) != 0
+        up = (actions & Action.UP) != 0
+        down = (actions & Action.DOWN) != 0
+        # mesma precedência de Player.update (esquerda/cima vencem)
+        dx = np.where(left, -speed, np.where(right, speed, 0.0))
+        dy = np.where(up, -speed, np.where(down, speed, 0.0))
+
+        new_x = self.player_x + dx
+        move_x = live & self._can_move_to(env, new_x, self.player_y, self.soft_x, self.soft_y)
+        self.player_x = np.where(move_x, new_x, self.player_x)
+        new_y = self.player_y + dy
+        move_y = live & self._can_move_to(env, self.player_x, new_y, self.soft_x, self.soft_y)
+        self.player_y = np.where(move_y, new_y, self.player_y)
+
+        # saiu do tile da bomba recém-plantada: fim do pass-through
+        gx, gy = self._tile_of(self.player_x, self.player_y)
+        left_soft = (gx != self.soft_x) | (gy != self.soft_y)
+        self.soft_x = np.where(left_soft, -1, self.soft_x)
+        self.soft_y = np.where(left_soft, -1, self.soft_y)
+
+    def _update_enemies(self, live: np.ndarray, now: np.ndarray):
+        env = self._env_ids[:, None]
+        alive = self.enemy_alive & live[:, None]
+        seeds = self.seeds[:, None]
+        tick = self.ticks[:, None]
+        idx = np.arange(self.max_enemies)[None, :]
+        now_col = now[:, None]
+
+        change = alive & (now_col - self.enemy_last_change >= self.enemy_interval)
+        new_dir = (_uniform(seeds, tick, idx, _SALT_DIR) * 4).astype(np.int64)
+        self.enemy_dir = np.where(change, new_dir, self.enemy_dir)
+        self.enemy_last_change = np.where(change, now_col, self.enemy_last_change)
+        self.enemy_interval = np.where(change, 1.0 + 1.5 * _uniform(seeds, tick, idx, _SALT_INTERVAL),
+                                       self.enemy_interval)
+
+        speed = GAME_CONFIG['ENEMY_SPEED']
+        dx = ENEMY_DIRECTIONS[self.enemy_dir, 0] * speed
+        dy = ENEMY_DIRECTIONS[self.enemy_dir, 1] * speed
+
+        new_x = self.enemy_x + dx
+        ok_x = self._can_move_to(env, new_x, self.enemy_y)
+        self.enemy_x = np.where(alive & ok_x, new_x, self.enemy_x)
+        blocked_x = alive & ~ok_x
+        self.enemy_dir = np.where(blocked_x, (_uniform(seeds, tick, idx, _SALT_BLOCK_X) * 4).astype(np.int64),
+                                  self.enemy_dir)
+
+        new_y = self.enemy_y + dy
+        ok_y = self._can_move_to(env, self.enemy_x, new_y)
+        self.enemy_y = np.where(alive & ok_y, new_y, self.enemy_y)
+        blocked_y = alive & ~ok_y
+        self.enemy_dir = np.where(blocked_y, (_uniform(seeds, tick, idx, _SALT_BLOCK_Y) * 4).astype(np.int64),
+                                  self.enemy_dir)
+
+    def _blast_mask(self, bombs: np.ndarray) -> np.ndarray:
+        """Tiles atingidos pelas bombas marcadas em `bombs` (N, B), mesma regra de raycast do engine."""
+        n = self.num_envs
+        mask = np.zeros((n, self.height, self.width), dtype=bool)
+        env = np.broadcast_to(self._env_ids[:, None], bombs.shape)
+        bx, by = self.bomb_x, self.bomb_y
+        mask[env[bombs], by[bombs], bx[bombs]] = True
+
+        max_radius = int(self.bomb_radius[bombs].max())
+        for dx, dy in BLAST_DIRECTIONS:
+            ray = bombs.copy()
+            for i in range(1, max_radius + 1):
+                nx = bx + dx * i
+                ny = by + dy * i
+                valid = (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+                cx = np.clip(nx, 0, self.width - 1)
+                cy = np.clip(ny, 0, self.height - 1)
+                tile = self.tiles[env, cy, cx]
+                ray &= valid & (tile != TILE_WALL) & (i <= self.bomb_radius)
+                if not ray.any():
+                    break
+                mask[env[ray], cy[ray], cx[ray]] = True
+                ray &= tile != TILE_DESTRUCTIBLE
+        return mask
+
+    def _detonate(self, live: np.ndarray, now: np.ndarray):
+        env = self._env_ids[:, None]
+        now_col = now[:, None]
+        active = self.bomb_active & live[:, None]
+        on_flame = self.flame_expiry[env, self.bomb_y, self.bomb_x] > now_col
+        due = active & ((now_col - self.bomb_plant_time >= GAME_CONFIG['BOMB_TIMER']) | on_flame)
+        if not due.any():
+            return
+
+        # propagação da cadeia: repete até nenhuma bomba nova ser atingida
+        while True:
+            blast = self._blast_mask(due)
+            hit = active & blast[env, self.bomb_y, self.bomb_x]
+            if not (hit & ~due).any():
+                break
+            due |= hit
+
+        expires = now + GAME_CONFIG['EXPLOSION_DURATION_MS'] / 1000.0
+        self.flame_expiry = np.where(blast, np.maximum(self.flame_expiry, expires[:, None, None]),
+                                     self.flame_expiry)
+
+        self.bomb_active &= ~due
+        envs = np.broadcast_to(env, due.shape)
+        self.bomb_slot[envs[due], self.bomb_y[due], self.bomb_x[due]] = -1
+
+        destroyed = blast & (self.tiles == TILE_DESTRUCTIBLE)
+        self.tiles[destroyed] = TILE_FLOOR
+        self.score += destroyed.sum(axis=(1, 2)) * GAME_CONFIG['WALL_SCORE']
+
+        if destroyed.any():
+            d_env, d_y, d_x = np.nonzero(destroyed)
+            cell = d_y * self.width + d_x
+            tick = self.ticks[d_env]
+            seeds = self.seeds[d_env]
+            drop = _uniform(seeds, tick, cell, _SALT_DROP) < GAME_CONFIG['POWERUP_DROP_CHANCE']
+            ptype = 1 + (_uniform(seeds, tick, cell, _SALT_TYPE) * 4).astype(np.int64)
+            self.powerups[d_env[drop], d_y[drop], d_x[drop]] = ptype[drop]
+
+    def _collect_powerups(self, live: np.ndarray):
+        env = self._env_ids
+        gx, gy = self._tile_of(self.player_x, self.player_y)
+        ptype = np.where(live, self.powerups[env, gy, gx], POWERUP_NONE)
+        if not ptype.any():
+            return
+        self.powerups[env, gy, gx] = np.where(ptype != POWERUP_NONE, POWERUP_NONE, self.powerups[env, gy, gx])
+        self.bomb_capacity = np.where(ptype == POWERUP_BOMB,
+                                      np.minimum(self.bomb_capacity + 1, GAME_CONFIG['MAX_BOMB_CAPACITY']),
+                                      self.bomb_capacity)
+        self.flame_radius = np.where(ptype == POWERUP_FIRE,
+                                     np.minimum(self.flame_radius + 1, GAME_CONFIG['MAX_FLAME_RADIUS']),
+                                     self.flame_radius)
+        self.player_speed = np.where(ptype == POWERUP_SPEED,
+                                     np.minimum(self.player_speed + GAME_CONFIG['SPEED_UP_DELTA'],
+                                                GAME_CONFIG['MAX_SPEED']),
+                                     self.player_speed)
+        self.lives += ptype == POWERUP_HEART
+
+    def _check_collisions(self, live: np.ndarray, now: np.ndarray):
+        env = self._env_ids
+        pgx, pgy = self._tile_of(self.player_x, self.player_y)
+        egx, egy = self._tile_of(self.enemy_x, self.enemy_y)
+        alive = self.enemy_alive & live[:, None]
+
+        contact = (alive & (egx == pgx[:, None]) & (egy == pgy[:, None])).any(axis=1)
+        burning = self.flame_expiry[env, pgy, pgx] > now
+        hurt = live & (contact | burning) & ~(now < self.invincible_until)
+        if hurt.any():
+            self.lives -= hurt
+            dead = hurt & (self.lives <= 0)
+            self.game_over |= dead
+            respawn = hurt & ~dead
+            self.player_x = np.where(respawn, self.tile_size, self.player_x)
+            self.player_y = np.where(respawn, self.tile_size, self.player_y)
+            self.invincible_until = np.where(respawn, now + GAME_CONFIG['PLAYER_INVINCIBILITY_TIME'],
+                                             self.invincible_until)
+
+        env_col = env[:, None]
+        killed = alive & (self.flame_expiry[env_col, egy, egx] > now[:, None])
+        if killed.any():
+            self.enemy_alive &= ~killed
+            self.score += killed.sum(axis=1) * GAME_CONFIG['ENEMY_SCORE']
+
+    # ------------------------------------------------------------------
+    def _observe(self) -> np.ndarray:
+        n, h, w = self.num_envs, self.height, self.width
+        obs = np.zeros((n, len(OBS_CHANNELS), h, w), dtype=np.uint8)
+        now = (self.ticks * self.dt)[:, None, None]
+        obs[:, 0] = self.tiles == TILE_WALL
+        obs[:, 1] = self.tiles == TILE_DESTRUCTIBLE
+        obs[:, 2] = self.bomb_slot >= 0
+        obs[:, 3] = self.flame_expiry > now
+        obs[:, 4] = self.powerups
+
+        env = np.broadcast_to(self._env_ids[:, None], self.enemy_alive.shape)
+        egx, egy = self._tile_of(self.enemy_x, self.enemy_y)
+        alive = self.enemy_alive
+        obs[env[alive], 5, egy[alive], egx[alive]] = 1
+
+        pgx, pgy = self._tile_of(self.player_x, self.player_y)
+        obs[self._env_ids, 6, pgy, pgx] = 1
+        return obs
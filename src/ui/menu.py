@@ -1,15 +1,17 @@
 import pygame
 from typing import List, Callable
 from ..utils.constants import COLORS
+from ..utils.text_cache import text_cache
 
 
 class Menu:
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        # tamanhos de fonte; o texto renderizado vem do cache compartilhado
+        self.font_size_large = 48
+        self.font_size_medium = 36
+        self.font_size_small = 24
         
         self.selected_option = 0
         self.options = []
@@ -32,13 +34,13 @@ class Menu:
     def render(self, screen: pygame.Surface):
         screen.fill(COLORS['BLACK'])
         
-        title_text = self.font_large.render("BOMBERMAN", True, COLORS['WHITE'])
+        title_text = text_cache.render("BOMBERMAN", self.font_size_large, COLORS['WHITE'])
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 100))
         screen.blit(title_text, title_rect)
         
         for i, option in enumerate(self.options):
             color = COLORS['GREEN'] if i == self.selected_option else COLORS['WHITE']
-            option_text = self.font_medium.render(option, True, color)
+            option_text = text_cache.render(option, self.font_size_medium, color)
             option_rect = option_text.get_rect(center=(self.screen_width // 2, 200 + i * 50))
             screen.blit(option_text, option_rect)
         
@@ -49,6 +51,6 @@ class Menu:
         ]
         
         for i, instruction in enumerate(instructions):
-            inst_text = self.font_small.render(instruction, True, COLORS['GRAY'])
+            inst_text = text_cache.render(instruction, self.font_size_small, COLORS['GRAY'])
             inst_rect = inst_text.get_rect(center=(self.screen_width // 2, 400 + i * 30))
             screen.blit(inst_text, inst_rect)
@@ -4,7 +4,9 @@ GAME_CONFIG = {
     'TILE_SIZE': 40,
     'MAP_WIDTH': 20,
     'MAP_HEIGHT': 15,
-    'FPS': 60,
+    'ACTIVE_MARGIN': 4,             # tiles além da tela em que inimigos ainda se movem
+    'FPS': 60,                      # também é a taxa de ticks da simulação
+    'MAX_TICKS_PER_FRAME': 10,      # teto de ticks de simulação por frame
 
     # Player movement & lives
     'PLAYER_SPEED': 3.0,
@@ -13,6 +15,9 @@ GAME_CONFIG = {
 
     # Enemies
     'ENEMY_SPEED': 1.5,
+    'ENEMY_AI': 'wander',           # 'wander' | 'chase' (flow field até o jogador; sem VecBombermanEnv)
+    'ENEMY_DANGER_HORIZON': 0.5,    # s: inimigos (chase) evitam chamas previstas nesse prazo
+    'ENEMY_COUNT': 5,               # no nível 1, num mapa 20x15 (escala com a área)
 
     # Bombs & explosions
     'BOMB_TIMER': 3.0,
@@ -21,6 +26,14 @@ GAME_CONFIG = {
     'EXPLOSION_RADIUS': 2,
     'EXPLOSION_DURATION_MS': 500,  # duração da chama
 
+    # Levels: cada nível tem mais inimigos e blocos mais densos
+    'LEVEL_COUNT': 8,               # vencer o último nível = vitória
+    'LEVEL_ENEMY_STEP': 2,          # inimigos a mais por nível (mapa 20x15)
+    'LEVEL_MAX_ENEMIES': 24,        # teto por nível, por maior que seja o mapa
+    'LEVEL_DENSITY_STEP': 0.04,     # densidade de blocos destrutíveis a mais por nível
+    'LEVEL_MAX_DENSITY': 0.6,
+    'LEVEL_SOLID_STEP': 0.015,      # paredes sólidas extras por nível, a partir do 2º
+
     # Scores
     'ENEMY_SCORE': 100,
     'WALL_SCORE': 50,
@@ -34,6 +47,10 @@ GAME_CONFIG = {
     'MAX_FLAME_RADIUS': 8,
 }
 
+# valores de fábrica (GAME_CONFIG pode ser alterado em tempo de execução,
+# ex.: --map-size; replays gravam só o que difere daqui)
+DEFAULT_GAME_CONFIG = dict(GAME_CONFIG)
+
 COLORS = {
     'BLACK': (0, 0, 0),
     'WHITE': (255, 255, 255),
@@ -0,0 +1,176 @@
+import csv
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, TextIO
+
+# fases instrumentadas no GameEngine, na ordem em que acontecem
+UPDATE_PHASES = ("player", "enemies", "bombs", "explosions", "powerups", "collisions", "victory")
+RENDER_PHASES = ("map", "entities", "hud", "flip")
+PHASES = UPDATE_PHASES + RENDER_PHASES
+# contadores por frame (não são tempos): pixels enviados ao display
+COUNTERS = ("pixels",)
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Percentil por posição mais próxima (lista já ordenada)."""
+    if not sorted_values:
+        return 0.0
+    rank = int(round(pct / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+    """
+    Cronômetro por fase do frame. O engine chama begin() no início de
+    update()/render(), lap(fase) ao fim de cada fase e end_frame() quando
+    o frame termina; o tempo entre laps é somado à fase (um frame pode ter
+    vários ticks de update). Mantém uma janela móvel por fase para
+    p50/p95/p99 e, opcionalmente, grava uma linha de CSV por frame.
+
+    Desligado, begin()/lap()/end_frame() só testam um bool e retornam.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 300,
+                 timer: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.window = window
+        self._timer = timer
+        self._last = 0.0
+        self._frame: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self._counts: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._frame_start: Optional[float] = None
+        self._samples: Dict[str, Deque[float]] = {}
+        self.frames = 0
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer = None
+        self.reset()
+
+    # -----------------------------------------------------------------
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            self._clear_frame()
+            self._frame_start = None
+
+    def disable(self):
+        self.enabled = False
+
+    def toggle(self) -> bool:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def reset(self):
+        """Descarta a janela móvel (não mexe no CSV)."""
+        self._samples = {name: deque(maxlen=self.window) for name in PHASES + ("total", "interval") + COUNTERS}
+        self.frames = 0
+        self._clear_frame()
+
+    def _clear_frame(self):
+        frame = self._frame
+        for name in frame:
+            frame[name] = 0.0
+        counts = self._counts
+        for name in counts:
+            counts[name] = 0
+
+    # -----------------------------------------------------------------
+    # Caminho quente
+    # -----------------------------------------------------------------
+    def begin(self):
+        if self.enabled:
+            self._last = self._timer()
+
+    def lap(self, phase: str):
+        if not self.enabled:
+            return
+        now = self._timer()
+        self._frame[phase] += now - self._last
+        self._last = now
+
+    def count(self, name: str, value: int):
+        """Soma `value` ao contador `name` (COUNTERS) do frame atual."""
+        if self.enabled:
+            self._counts[name] += value
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        now = self._timer()
+        frame = self._frame
+        samples = self._samples
+        total = 0.0
+        for name, seconds in frame.items():
+            samples[name].append(seconds)
+            total += seconds
+        samples["total"].append(total)
+        # intervalo entre frames (inclui espera do clock.tick): mostra quedas de FPS
+        interval = now - self._frame_start if self._frame_start is not None else total
+        samples["interval"].append(interval)
+        for name, value in self._counts.items():
+            samples[name].append(value)
+        self._frame_start = now
+        self.frames += 1
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerow([self.frames, _ms(interval), _ms(total)]
+                                      + [_ms(frame[name]) for name in PHASES]
+                                      + [self._counts[name] for name in COUNTERS])
+        self._clear_frame()
+
+    # -----------------------------------------------------------------
+    # Consulta
+    # -----------------------------------------------------------------
+    def percentiles(self, phase: str) -> Dict[str, float]:
+        """{"p50": ms, "p95": ms, "p99": ms} da janela móvel da fase."""
+        values = sorted(self._samples[phase])
+        return {f"p{p}": round(percentile(values, p) * 1000.0, 4) for p in PERCENTILES}
+
+    def counter_percentiles(self, name: str) -> Dict[str, float]:
+        """Como percentiles(), mas para um contador (valor bruto, sem ms)."""
+        values = sorted(self._samples[name])
+        return {f"p{p}": percentile(values, p) for p in PERCENTILES}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {name: self.percentiles(name) for name in PHASES + ("total", "interval")}
+        summary.update((name, self.counter_percentiles(name)) for name in COUNTERS)
+        return summary
+
+    def overlay_lines(self) -> List[str]:
+        if not self.enabled:
+            return ["profiler desligado (rode com --profile)"]
+        lines = [f"{'fase':<11}{'p50':>7}{'p95':>7}{'p99':>7} ms"]
+        for name in PHASES + ("total", "interval"):
+            stats = self.percentiles(name)
+            lines.append(f"{name:<11}{stats['p50']:7.2f}{stats['p95']:7.2f}{stats['p99']:7.2f}")
+        for name in COUNTERS:
+            stats = self.counter_percentiles(name)
+            lines.append(f"{name:<11}{stats['p50']:7.0f}{stats['p95']:7.0f}{stats['p99']:7.0f}")
+        return lines
+
+    # -----------------------------------------------------------------
+    # CSV
+    # -----------------------------------------------------------------
+    def start_csv(self, path: str):
+        """Passa a gravar uma linha por frame (ms) em `path`."""
+        self.stop_csv()
+        self._csv_file = open(path, "w", newline="")
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(["frame", "interval_ms", "total_ms"] + [f"{name}_ms" for name in PHASES] + list(COUNTERS))
+
+    def stop_csv(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+
+    def close(self):
+        self.stop_csv()
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 4)
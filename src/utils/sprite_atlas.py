@@ -0,0 +1,112 @@
+import pygame
+from typing import Dict, Iterable, Optional, Tuple
+
+from .constants import GAME_CONFIG, COLORS
+
+# índice = código do tile no GameMap (TILE_FLOOR, TILE_WALL, TILE_DESTRUCTIBLE)
+TILE_SPRITES = ("floor", "wall", "destructible")
+
+_TILE_COLORS = {"floor": (50, 50, 50), "wall": (100, 100, 100), "destructible": (139, 69, 19)}
+_POWERUP_COLORS = {"BOMB_UP": COLORS['CYAN'], "FIRE_UP": COLORS['ORANGE'],
+                   "SPEED_UP": COLORS['YELLOW'], "HEART": COLORS['PINK']}
+_FLAME_ALPHA = 180
+_FLAME_KEY = (255, 0, 255)   # colorkey do overlay de chamas: nunca aparece na arte
+
+
+class SpriteAtlas:
+    """
+    Superfícies pré-renderizadas de tudo que o jogo desenha: tiles,
+    power-ups, bomba, inimigo, jogador (normal e ciano, invencível) e o
+    tile de chama (opaco; a transparência vem do overlay). Construídas
+    uma vez por tamanho de tile e convertidas para o formato da tela
+    (convert/convert_alpha) assim que existe um display, então cada
+    sprite custa um blit sem conversão. Arte de verdade entra em
+    _build(), com os mesmos nomes.
+    """
+
+    def __init__(self):
+        self._sprites: Dict[str, pygame.Surface] = {}
+        self._tile_size: Optional[int] = None
+        self._converted = False
+        self.builds = 0
+
+    def sprites(self) -> Dict[str, pygame.Surface]:
+        """Nome -> Surface; (re)constrói se o tile mudou ou o display surgiu."""
+        if self._tile_size != GAME_CONFIG['TILE_SIZE'] or (
+                not self._converted and pygame.display.get_surface() is not None):
+            self._build()
+        return self._sprites
+
+    def get(self, name: str) -> pygame.Surface:
+        return self.sprites()[name]
+
+    def _build(self):
+        ts = GAME_CONFIG['TILE_SIZE']
+        actor = ts - 6
+        sprites: Dict[str, pygame.Surface] = {}
+
+        for name, color in _TILE_COLORS.items():
+            surface = pygame.Surface((ts, ts))
+            surface.fill(color)
+            pygame.draw.rect(surface, COLORS['BLACK'], surface.get_rect(), 1)
+            sprites[name] = surface
+
+        for ptype, color in _POWERUP_COLORS.items():
+            surface = pygame.Surface((ts, ts))
+            surface.fill(color)
+            pygame.draw.rect(surface, COLORS['BLACK'], surface.get_rect(), 2)
+            sprites[f"powerup:{ptype}"] = surface
+
+        for name, color in (("bomb", COLORS['RED']), ("enemy", COLORS['RED']),
+                            ("player", COLORS['BLUE']), ("player_invincible", COLORS['CYAN'])):
+            surface = pygame.Surface((actor, actor))
+            surface.fill(color)
+            sprites[name] = surface
+
+        flame = pygame.Surface((ts, ts))
+        flame.fill(COLORS['ORANGE'])
+        sprites["flame"] = flame
+
+        converted = pygame.display.get_surface() is not None
+        if converted:
+            # mesmo formato de pixel da tela => blit sem conversão
+            sprites = {name: surface.convert() for name, surface in sprites.items()}
+        self._sprites = sprites
+        self._tile_size = ts
+        self._converted = converted
+        self.builds += 1
+
+    def flame_overlay(self, tiles: Iterable[Tuple[int, int]]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Uma surface com todos os `tiles` (grid) em chamas e a posição do seu
+        canto na tela. Tiles repetidos viram um só, então chamas sobrepostas
+        são mescladas numa única camada. O fora-da-chama é colorkey e a
+        transparência é alpha da surface inteira, com RLE: o blit pula os
+        pixels vazios e mistura os demais de uma vez, bem mais barato que
+        alpha por pixel ou um blit por tile.
+        """
+        tiles = list(tiles)
+        ts = GAME_CONFIG['TILE_SIZE']
+        left = min(gx for gx, _ in tiles)
+        top = min(gy for _, gy in tiles)
+        width = max(gx for gx, _ in tiles) - left + 1
+        height = max(gy for _, gy in tiles) - top + 1
+
+        surface = pygame.Surface((width * ts, height * ts))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(_FLAME_KEY)
+        flame = self.get("flame")
+        surface.blits([(flame, ((gx - left) * ts, (gy - top) * ts)) for gx, gy in tiles], doreturn=False)
+        surface.set_colorkey(_FLAME_KEY, pygame.RLEACCEL)
+        surface.set_alpha(_FLAME_ALPHA, pygame.RLEACCEL)
+        return surface, (left * ts, top * ts)
+
+    def clear(self):
+        self._sprites = {}
+        self._tile_size = None
+        self._converted = False
+
+
+# instância compartilhada por mapa, entidades e engine
+atlas = SpriteAtlas()
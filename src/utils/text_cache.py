@@ -0,0 +1,83 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+Color = Tuple[int, int, int]
+
+
+class FontRegistry:
+    """Uma instância de pygame.font.Font por (nome, tamanho), compartilhada."""
+
+    def __init__(self):
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+    def get(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+
+class TextCache:
+    """
+    Cache LRU de superfícies de texto já rasterizadas, chave
+    (fonte, tamanho, texto, cor, antialias). Textos que raramente mudam
+    (HUD, timers de bomba, menus) passam a custar só um blit.
+    """
+
+    def __init__(self, fonts: FontRegistry, max_entries: int = 512):
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text: str, size: int, color: Color,
+               name: Optional[str] = None, antialias: bool = True) -> pygame.Surface:
+        key = (name, size, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.fonts.get(size, name).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._surfaces),
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# instâncias compartilhadas por engine, bombas e telas de UI
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
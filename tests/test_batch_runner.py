@@ -0,0 +1,35 @@
+import unittest
+import numpy as np
+from src.sim.batch_runner import BatchAggregator, RunningStats, run_games, END_CAUSES
+
+
+class TestBatchRunner(unittest.TestCase):
+    def test_run_games_is_deterministic(self):
+        first = run_games([5, 6], max_ticks=300, policy="random")
+        second = run_games([5, 6], max_ticks=300, policy="random")
+        for name in first:
+            self.assertTrue(np.array_equal(first[name], second[name]))
+        self.assertEqual(first["seed"].tolist(), [5, 6])
+        self.assertTrue((first["ticks"] <= 300).all())
+
+    def test_running_stats_match_numpy(self):
+        values = np.arange(100, dtype=np.float64) ** 1.5
+        stats = RunningStats()
+        for chunk in np.array_split(values, 7):
+            stats.add_batch(chunk)
+        summary = stats.summary()
+        self.assertAlmostEqual(summary["mean"], round(values.mean(), 4))
+        self.assertAlmostEqual(summary["std"], round(values.std(ddof=1), 4))
+        self.assertEqual(summary["max"], values.max())
+
+    def test_aggregator_counts_end_causes(self):
+        aggregator = BatchAggregator()
+        aggregator.add(run_games([1, 2, 3], max_ticks=60, policy="scripted"))
+        self.assertEqual(aggregator.games, 3)
+        self.assertEqual(sum(aggregator.summary()["end_causes"].values()), 3)
+        self.assertEqual(len(aggregator.columns()["score"]), 3)
+        self.assertEqual(len(END_CAUSES), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
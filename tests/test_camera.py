@@ -0,0 +1,104 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from src.game.actions import Action
+from src.game.camera import Camera
+from src.game.explosion import Explosion
+from src.game.game_engine import GameEngine
+from src.game.game_map import CHUNK_TILES, chunk_budget
+from src.utils.constants import GAME_CONFIG
+
+
+class TestCamera(unittest.TestCase):
+    def test_follow_centres_and_clamps(self):
+        camera = Camera(800, 600)
+        camera.follow((5000, 5000), (20000, 20000))
+        self.assertEqual(camera.offset, (4600, 4700))
+        camera.follow((10, 10), (20000, 20000))
+        self.assertEqual(camera.offset, (0, 0))
+        camera.follow((19990, 19990), (20000, 20000))
+        self.assertEqual(camera.offset, (19200, 19400))
+        # mapa menor que a tela: fica no canto
+        camera.follow((400, 300), (800, 600))
+        self.assertEqual(camera.offset, (0, 0))
+        self.assertTrue(camera.covers((800, 600)))
+        self.assertFalse(camera.covers((840, 600)))
+
+
+class TestLargeMap(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(GAME_CONFIG, {'MAP_WIDTH': 200, 'MAP_HEIGHT': 200, 'ENEMY_AI': 'wander'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_engine(self, render_mode: str = "dirty") -> GameEngine:
+        engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                            headless=True, seed=8, render_mode=render_mode)
+        engine.player.lives = 10 ** 6
+        return engine
+
+    def teleport(self, engine: GameEngine, grid_x: int, grid_y: int):
+        engine.player.x, engine.player.y = engine.game_map.grid_to_world(grid_x, grid_y)
+
+    def test_only_enemies_near_the_screen_move(self):
+        engine = self.make_engine()
+        x0, y0, x1, y1 = engine._follow_player()
+        inside = [e for e in engine.enemies if x0 <= engine.enemy_index.tile_of(e)[0] < x1
+                  and y0 <= engine.enemy_index.tile_of(e)[1] < y1]
+        outside = [e for e in engine.enemies if e not in inside]
+        self.assertTrue(outside)
+        before = {enemy: enemy.get_position() for enemy in outside}
+        for _ in range(120):
+            engine.update(Action.NONE)
+        for enemy in outside:
+            self.assertEqual(enemy.get_position(), before[enemy])
+
+    def test_chunk_cache_is_bounded(self):
+        engine = self.make_engine()
+        for grid_x, grid_y in ((1, 1), (60, 60), (120, 30), (190, 190), (30, 150), (100, 100)):
+            self.teleport(engine, grid_x, grid_y)
+            engine.render()
+        span = CHUNK_TILES * engine.game_map.tile_size
+        self.assertLessEqual(len(engine.game_map._chunks), chunk_budget(800, 600, span))
+        self.assertEqual(engine.camera.offset[0] // engine.game_map.tile_size, 100 - 10)
+
+    def test_visible_chunks_are_not_rebuilt(self):
+        # viewport de ~101x101 tiles: 7x7 chunks visíveis, todos cabem no cache
+        engine = GameEngine(101 * 40, 101 * 40, headless=True, seed=8)
+        self.teleport(engine, 100, 100)
+        engine.render()
+        chunks = dict(engine.game_map._chunks)
+        self.assertGreaterEqual(len(chunks), 49)
+        engine.render()
+        for key, chunk in engine.game_map._chunks.items():
+            self.assertIs(chunk, chunks[key])
+
+    def test_flames_off_screen_are_culled(self):
+        engine = self.make_engine()
+        engine._follow_player()
+        x0, y0, x1, y1 = engine.camera.tile_bounds(engine.game_map)
+        # uma explosão fora da tela e outra atravessando a borda
+        engine.explosions.append(Explosion([(x1 + 20, y1 + 20), (x1 + 21, y1 + 20)], engine.sim_clock))
+        engine.explosions.append(Explosion([(x0 + 3, y0 + 3), (x1 - 1, y0 + 3), (x1, y0 + 3)], engine.sim_clock))
+        engine.render()
+        self.assertEqual(engine._flame_tiles, {(x0 + 3, y0 + 3), (x1 - 1, y0 + 3)})
+        self.assertTrue(all(x0 <= x < x1 and y0 <= y < y1 for x, y in engine._flame_tiles))
+
+    def test_scrolling_dirty_matches_full(self):
+        full, dirty = self.make_engine("full"), self.make_engine()
+        for step in range(240):
+            for engine in (full, dirty):
+                engine.player.invincible_until = float("inf")
+                if step % 3 == 0:
+                    # câmera andando: frame completo; parada: dirty rects
+                    self.teleport(engine, 40 + step // 6, 40 + step // 12)
+                engine.update(Action.BOMB if step % 50 == 0 else Action.NONE)
+                engine.render()
+            self.assertEqual(pygame.image.tobytes(dirty.screen, "RGB"), pygame.image.tobytes(full.screen, "RGB"))
+        self.assertGreater(dirty.camera.offset[0], 40 * dirty.game_map.tile_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
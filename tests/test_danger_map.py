@@ -0,0 +1,93 @@
+import math
+import random
+import unittest
+
+from src.game.bomb import Bomb
+from src.game.danger_map import DangerMap
+from src.game.detonation import BlastRayTable
+from src.game.flame_grid import FlameGrid
+from src.game.game_map import GameMap, TILE_DESTRUCTIBLE, TILE_FLOOR
+from src.game.sim_clock import SimClock
+
+
+class TestDangerMap(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimClock()
+        self.game_map = GameMap(random.Random(3))
+        self.game_map.tiles[self.game_map.tiles == TILE_DESTRUCTIBLE] = TILE_FLOOR
+        rays = BlastRayTable(self.game_map)
+        self.game_map.add_wall_listener(rays.invalidate_wall)
+        self.flames = FlameGrid(self.game_map.width, self.game_map.height)
+        self.danger = DangerMap(self.game_map, rays, self.flames)
+
+    def _plant(self, x, y, timer=3.0, radius=2):
+        bomb = Bomb(x, y, timer, self.clock, radius=radius)
+        self.danger.add_bomb(bomb, self.clock.time())
+        return bomb
+
+    def test_bomb_marks_its_blast(self):
+        self._plant(3, 1)
+        now = self.clock.time()
+        self.assertAlmostEqual(self.danger.time_until_flame(3, 1, now), 3.0)
+        self.assertAlmostEqual(self.danger.time_until_flame(5, 1, now), 3.0)
+        self.assertEqual(self.danger.time_until_flame(6, 1, now), math.inf)
+        self.assertAlmostEqual(self.danger.time_until_flame(3, 3, now), 3.0)
+        self.assertEqual(self.danger.time_until_flame(3, 4, now), math.inf)
+        self.assertFalse(self.danger.is_safe(4, 1, now))
+        self.assertTrue(self.danger.is_safe(4, 1, now, horizon=1.0))
+        self.assertFalse(self.danger.is_safe(4, 1, now, horizon=5.0))
+        self.assertTrue(self.danger.is_safe(7, 1, now))
+
+    def test_chain_brings_later_bomb_forward(self):
+        early = self._plant(1, 1, timer=1.0)
+        late = self._plant(3, 1, timer=3.0)     # atingida pela primeira
+        far = self._plant(5, 1, timer=3.0)      # atingida pela segunda
+        now = self.clock.time()
+        self.assertAlmostEqual(self.danger.detonation_time(late), 1.0)
+        self.assertAlmostEqual(self.danger.detonation_time(far), 1.0)
+        self.assertAlmostEqual(self.danger.time_until_flame(7, 1, now), 1.0)
+
+        self.danger.remove_bombs([early, late, far])
+        self.assertEqual(float(self.danger.flame_at.min()), math.inf)
+
+    def test_removal_restores_other_bombs_coverage(self):
+        first = self._plant(3, 1, timer=1.0, radius=1)
+        self._plant(5, 1, timer=2.0, radius=1)
+        self.danger.remove_bombs([first])
+        now = self.clock.time()
+        self.assertEqual(self.danger.time_until_flame(3, 1, now), math.inf)
+        self.assertAlmostEqual(self.danger.time_until_flame(4, 1, now), 2.0)
+
+    def test_destroyed_wall_opens_blast_line(self):
+        self.game_map.tiles[1, 4] = TILE_DESTRUCTIBLE
+        self.danger.blast_rays.clear()
+        self._plant(3, 1, timer=3.0, radius=3)
+        now = self.clock.time()
+        self.assertEqual(self.danger.time_until_flame(5, 1, now), math.inf)
+        self.game_map.destroy_wall(4, 1)
+        self.assertAlmostEqual(self.danger.time_until_flame(6, 1, now), 3.0)
+
+    def test_escape_step_leads_out_of_blast(self):
+        self._plant(3, 1, radius=2)
+        now = self.clock.time()
+        # seguindo os passos de fuga, sai do alcance (raio 2) em até 3 tiles
+        x, y, steps = 3, 1, 0
+        while not self.danger.is_safe(x, y, now):
+            dx, dy = self.danger.escape_step(x, y, now)
+            x, y = x + dx, y + dy
+            steps += 1
+        self.assertLessEqual(steps, 3)
+        self.assertIsNone(self.danger.escape_step(x, y, now))
+
+    def test_array_view_counts_burning_tiles(self):
+        self._plant(3, 1)
+        self.flames.ignite([(7, 1)], until=1.0)
+        remaining = self.danger.time_until_flame_array(self.clock.time())
+        self.assertEqual(remaining.shape, (self.game_map.height, self.game_map.width))
+        self.assertAlmostEqual(remaining[1, 3], 3.0)
+        self.assertEqual(remaining[1, 7], 0.0)
+        self.assertEqual(remaining[5, 5], math.inf)
+
+
+if __name__ == '__main__':
+    unittest.main()
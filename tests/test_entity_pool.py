@@ -0,0 +1,93 @@
+import random
+import unittest
+from unittest import mock
+
+from src.game.actions import Action
+from src.game.bomb import Bomb
+from src.game.enemy import Enemy
+from src.game.entity_pool import BombPool, EnemyPool
+from src.game.game_engine import GameEngine
+from src.game.player import Player
+from src.game.sim_clock import SimClock
+from src.utils.constants import GAME_CONFIG
+
+
+class TestEntityPool(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimClock()
+        self.pool = EnemyPool()
+        rng = random.Random(3)
+        self.enemies = [Enemy(x, 1, 2.0, self.clock, rng, pool=self.pool) for x in range(1, 6)]
+
+    def test_handles_read_and_write_columns(self):
+        enemy = self.enemies[2]
+        self.assertEqual(enemy.get_position(), (3 * GAME_CONFIG['TILE_SIZE'], GAME_CONFIG['TILE_SIZE']))
+        enemy.x = 100.5
+        enemy.target_tile = (4, 2)
+        self.assertEqual(self.pool.x[enemy._slot], 100.5)
+        self.assertEqual(enemy.target_tile, (4, 2))
+        enemy.target_tile = None
+        self.assertIsNone(enemy.target_tile)
+        enemy.take_damage()
+        self.assertTrue(enemy.is_dead())
+        self.assertEqual(list(self.pool.column("alive")), [1, 1, 0, 1, 1])
+
+    def test_spawn_many_matches_one_by_one(self):
+        pool = EnemyPool()
+        tiles = [(x, 1) for x in range(1, 6)]
+        enemies = Enemy.spawn_many(tiles, 2.0, self.clock, random.Random(3), pool)
+        self.assertEqual([e._slot for e in enemies], list(range(5)))
+        for name, _ in EnemyPool.FIELDS:
+            self.assertEqual(list(getattr(pool, name)), list(getattr(self.pool, name)))
+
+    def test_release_swaps_last_row_into_hole(self):
+        positions = [enemy.get_position() for enemy in self.enemies]
+        removed = self.enemies[1]
+        self.pool.release(removed)
+        self.assertEqual(len(self.pool), 4)
+        # o handle removido segue legível; os outros não mudam de estado
+        self.assertEqual(removed.get_position(), positions[1])
+        self.assertIsNot(removed._pool, self.pool)
+        for enemy, position in zip(self.enemies, positions):
+            self.assertEqual(enemy.get_position(), position)
+        self.assertEqual(self.pool.handles[1], self.enemies[4])
+        # handle de outro pool: no-op
+        self.pool.release(removed)
+        self.assertEqual(len(self.pool), 4)
+
+    def test_bomb_handles(self):
+        pool = BombPool()
+        bombs = [Bomb(x, 3, 2.0, self.clock, radius=x, pool=pool) for x in range(1, 4)]
+        pool.release(bombs[0])
+        self.assertEqual([(b.grid_x, b.explosion_radius) for b in bombs], [(1, 1), (2, 2), (3, 3)])
+        self.assertFalse(bombs[2].should_explode())
+        self.clock.advance(int(2.0 * self.clock.tick_rate))
+        self.assertTrue(bombs[2].should_explode())
+
+    def test_hitbox_follows_tile_size_changed_after_import(self):
+        # ex.: batch_runner --set TILE_SIZE=32, aplicado nos workers após o import
+        with mock.patch.dict(GAME_CONFIG, {'TILE_SIZE': 32}):
+            player = Player(2, 3, 3.0)
+            enemy = Enemy(2, 3, 2.0, self.clock, random.Random(1))
+            bomb = Bomb(2, 3, 3.0, self.clock)
+            for entity in (player, enemy, bomb):
+                self.assertEqual(entity.size, 26)
+            self.assertEqual(player.rect, (64, 96, 26, 26))
+            self.assertEqual(enemy.rect, (64, 96, 26, 26))
+        self.assertEqual(player.size, GAME_CONFIG['TILE_SIZE'] - 6)
+
+    def test_engine_keeps_pools_in_sync(self):
+        engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=4)
+        self.assertEqual(len(engine.enemy_pool), len(engine.enemies))
+        engine.update(Action.BOMB)
+        self.assertEqual(len(engine.bomb_pool), 1)
+        while engine.bombs and not engine.game_over:
+            engine.update(Action.NONE)
+        self.assertEqual(len(engine.bomb_pool), 0)
+        engine._remove_enemy(engine.enemies[0])
+        self.assertEqual(len(engine.enemy_pool), len(engine.enemies))
+        self.assertEqual(set(engine.enemy_pool.handles), set(engine.enemies))
+
+
+if __name__ == '__main__':
+    unittest.main()
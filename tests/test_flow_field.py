@@ -0,0 +1,77 @@
+import random
+import unittest
+from unittest import mock
+
+from src.game.actions import Action
+from src.game.flow_field import UNREACHABLE, FlowField
+from src.game.game_engine import GameEngine
+from src.game.game_map import GameMap, TILE_DESTRUCTIBLE, TILE_FLOOR
+from src.utils.constants import GAME_CONFIG
+
+
+class TestFlowField(unittest.TestCase):
+    def setUp(self):
+        self.game_map = GameMap(random.Random(3))
+        self.game_map.tiles[self.game_map.tiles == TILE_DESTRUCTIBLE] = TILE_FLOOR
+        self.field = FlowField(self.game_map)
+
+    def test_distances_and_steps_lead_to_target(self):
+        self.field.update((1, 1))
+        self.assertEqual(self.field.distance_at(1, 1), 0)
+        self.assertEqual(self.field.distance_at(3, 1), 2)
+        self.assertEqual(self.field.distance_at(2, 2), UNREACHABLE)  # pilar
+
+        # seguindo os passos a partir de qualquer tile, a distância cai 1 por passo
+        x, y = 9, 7
+        while (x, y) != (1, 1):
+            dx, dy = self.field.direction_at(x, y)
+            self.assertEqual(self.field.distance_at(x + dx, y + dy), self.field.distance_at(x, y) - 1)
+            x, y = x + dx, y + dy
+
+    def test_bombs_block_paths(self):
+        self.field.update((1, 1))
+        self.assertEqual(self.field.distance_at(1, 3), 2)
+        self.field.invalidate()
+        self.field.update((1, 1), [(1, 2)])
+        self.assertEqual(self.field.distance_at(1, 2), UNREACHABLE)
+        self.assertGreater(self.field.distance_at(1, 3), 2)
+
+    def test_recomputes_only_on_change(self):
+        self.assertTrue(self.field.update((1, 1)))
+        self.assertFalse(self.field.update((1, 1)))
+        self.assertTrue(self.field.update((1, 3)))
+        self.game_map.tiles[1, 5] = TILE_DESTRUCTIBLE
+        self.game_map.destroy_wall(5, 1)  # listener do mapa invalida o campo
+        self.assertTrue(self.field.update((1, 3)))
+        self.assertEqual(self.field.recomputes, 3)
+
+    def test_as_array_shape(self):
+        self.field.update((1, 1))
+        grid = self.field.as_array()
+        self.assertEqual(grid.shape, (self.game_map.height, self.game_map.width))
+        self.assertEqual(grid[3, 1], 2)
+
+
+class TestEnemyChase(unittest.TestCase):
+    @mock.patch.dict(GAME_CONFIG, {'ENEMY_AI': 'chase'})
+    def test_enemies_close_in_on_player(self):
+        engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                            headless=True, seed=3)
+        to_grid = engine.game_map.world_to_grid
+
+        def distances():
+            return [engine.flow_field.distance_at(*to_grid(*e.get_position())) for e in engine.enemies]
+
+        engine.update(Action.NONE)
+        reachable = [i for i, d in enumerate(distances()) if d != UNREACHABLE]
+        self.assertTrue(reachable)
+        before = distances()
+        for _ in range(60):
+            engine.update(Action.NONE)
+        after = distances()
+        for i in reachable:
+            self.assertLess(after[i], before[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+import pygame
+from src.game.actions import Action
+from src.game.bomb import Bomb
+from src.game.game_engine import GameEngine
+from src.utils.constants import GAME_CONFIG
+
+
+class TestHeadlessGameEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = self._make_engine(1234)
+
+    def _make_engine(self, seed):
+        return GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                          headless=True, seed=seed)
+
+    def _state(self, engine):
+        return (engine.score, engine.player.get_position(), engine.player.lives,
+                [e.get_position() for e in engine.enemies],
+                [(b.grid_x, b.grid_y) for b in engine.bombs],
+                [p.grid_x * 1000 + p.grid_y for p in engine.powerups])
+
+    def test_headless_does_not_open_display(self):
+        self.assertIsNone(pygame.display.get_surface())
+
+    def test_action_moves_player(self):
+        x0, y0 = self.engine.player.get_position()
+        # (1,1) sempre livre e (2,1) nunca recebe bloco destrutível
+        self.engine.update(Action.RIGHT)
+        x1, y1 = self.engine.player.get_position()
+        self.assertGreater(x1, x0)
+        self.assertEqual(y1, y0)
+
+    def test_bomb_action_plants_bomb(self):
+        self.engine.update(Action.BOMB)
+        self.assertEqual(len(self.engine.bombs), 1)
+        self.assertEqual((self.engine.bombs[0].grid_x, self.engine.bombs[0].grid_y), (1, 1))
+
+    def test_bomb_explodes_on_simulated_time(self):
+        self.engine.update(Action.BOMB)
+        ticks = int(GAME_CONFIG['BOMB_TIMER'] * GAME_CONFIG['FPS'])
+        for _ in range(ticks - 2):
+            self.engine.update(Action.NONE)
+        self.assertEqual(len(self.engine.bombs), 1)
+        for _ in range(2):
+            self.engine.update(Action.NONE)
+        self.assertEqual(len(self.engine.bombs), 0)
+
+    def test_flame_grid_tracks_explosion_lifetime(self):
+        self.engine.update(Action.BOMB)
+        self.engine.update(Action.RIGHT)
+        while self.engine.bombs:
+            self.engine.update(Action.NONE)
+        explosion = self.engine.explosions[0]
+        now = self.engine.sim_clock.time()
+        for gx, gy in explosion.tiles:
+            self.assertTrue(self.engine.flames.is_burning(gx, gy, now))
+        self.assertFalse(self.engine.flames.is_burning(5, 5, now))
+
+        while self.engine.sim_clock.time() < explosion.expires_at:
+            self.engine.update(Action.NONE)
+        self.engine.update(Action.NONE)
+        self.assertEqual(len(self.engine.explosions), 0)
+        self.assertFalse(self.engine.flames.is_burning(1, 1, self.engine.sim_clock.time()))
+
+    def _place_bomb(self, x, y, timer):
+        bomb = Bomb(x, y, timer, self.engine.sim_clock)
+        self.engine.bombs.append(bomb)
+        self.engine.bomb_index.add(bomb, (x, y))
+        return bomb
+
+    def test_chain_reaction_resolves_in_one_tick(self):
+        self.engine.game_map.tiles[1:4, 1] = 0
+        self.engine.game_map.tiles[3, 1:4] = 0
+        self._place_bomb(1, 1, 0.0)
+        self._place_bomb(1, 3, 60.0)
+        self._place_bomb(3, 3, 60.0)   # só alcançada pela bomba (1, 3)
+        self.engine.update(Action.NONE)
+        self.assertEqual(self.engine.bombs, [])
+        self.assertEqual(len(self.engine.explosions), 3)
+
+    def test_blast_ray_table_matches_raycast(self):
+        game_map = self.engine.game_map
+        rays = self.engine.blast_rays
+        for y in range(game_map.height):
+            for x in range(game_map.width):
+                for radius in (1, 2, 8):
+                    expected = Bomb(x, y, 1.0, radius=radius).get_explosion_positions(game_map)
+                    self.assertEqual(sorted(rays.blast_tiles(x, y, radius)), sorted(expected))
+
+        # destruir uma parede invalida os raios que passavam por ela
+        wx, wy = (int(v) for v in game_map.destructible_tiles()[0])
+        game_map.destroy_wall(wx, wy)
+        for x in range(game_map.width):
+            expected = Bomb(x, wy, 1.0, radius=8).get_explosion_positions(game_map)
+            self.assertEqual(sorted(rays.blast_tiles(x, wy, 8)), sorted(expected))
+
+    def test_same_seed_replays_identically(self):
+        a = self._make_engine(7)
+        b = self._make_engine(7)
+        actions = [Action.RIGHT, Action.BOMB, Action.LEFT, Action.DOWN, Action.NONE]
+        for tick in range(600):
+            action = actions[(tick // 20) % len(actions)]
+            a.update(action)
+            b.update(action)
+        self.assertEqual(self._state(a), self._state(b))
+        self.assertEqual(a.sim_clock.ticks, b.sim_clock.ticks)
+
+    def test_advance_uses_fixed_timestep(self):
+        dt = self.engine.sim_clock.dt
+        self.assertEqual(self.engine.advance(dt * 0.5), 0)
+        self.assertEqual(self.engine.advance(dt * 0.6), 1)
+        self.engine.sim_clock.time_scale = 4.0
+        self.assertEqual(self.engine.advance(dt), 4)
+        # engasgo longo não vira avalanche de ticks
+        self.assertEqual(self.engine.advance(10.0), GAME_CONFIG['MAX_TICKS_PER_FRAME'])
+
+    def test_offscreen_render(self):
+        self.engine.update(Action.NONE)
+        self.engine.render()
+
+    def test_dirty_rects_match_full_redraw(self):
+        full = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                          headless=True, seed=1234, render_mode="full")
+        dirty = self.engine
+        full.render()
+        dirty.render()
+        screen_pixels = GAME_CONFIG['SCREEN_WIDTH'] * GAME_CONFIG['SCREEN_HEIGHT']
+        self.assertEqual(dirty.pixels_pushed, screen_pixels)  # 1º frame: tela inteira
+
+        moves = [Action.RIGHT | Action.BOMB] * 6 + [Action.LEFT] * 30 + [Action.DOWN] * 60 + [Action.NONE] * 120
+        pushed = []
+        for action in moves:
+            full.update(action)
+            dirty.update(action)
+            full.render()
+            dirty.render()
+            pushed.append(dirty.pixels_pushed)
+            self.assertEqual(pygame.image.tobytes(dirty.screen, "RGB"), pygame.image.tobytes(full.screen, "RGB"))
+        self.assertLess(sum(pushed) / len(pushed), screen_pixels / 10)
+
+        # mapa novo (reset): volta a desenhar tudo
+        dirty.reset(5)
+        dirty.render()
+        self.assertEqual(dirty.pixels_pushed, screen_pixels)
+
+    def test_unknown_render_mode(self):
+        with self.assertRaises(ValueError):
+            GameEngine(800, 600, headless=True, seed=1, render_mode="fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
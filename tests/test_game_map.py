@@ -0,0 +1,68 @@
+import random
+import unittest
+import numpy as np
+import pygame
+from src.game.game_map import GameMap, TILE_WALL
+
+
+class TestGameMap(unittest.TestCase):
+    def setUp(self):
+        self.game_map = GameMap(random.Random(3))
+        self.screen = pygame.Surface(self.game_map.pixel_size())
+
+    def _first_destructible(self):
+        for y in range(self.game_map.height):
+            for x in range(self.game_map.width):
+                if self.game_map.is_destructible_wall(x, y):
+                    return x, y
+        self.fail("mapa sem blocos destrutíveis")
+
+    def test_render_redraws_destroyed_wall(self):
+        x, y = self._first_destructible()
+        ts = self.game_map.tile_size
+        center = (x * ts + ts // 2, y * ts + ts // 2)
+
+        self.game_map.render(self.screen)
+        self.assertEqual(self.screen.get_at(center)[:3], (139, 69, 19))
+
+        self.game_map.destroy_wall(x, y)
+        self.game_map.render(self.screen)
+        self.assertEqual(self.screen.get_at(center)[:3], (50, 50, 50))
+
+    def test_destroy_marks_only_changed_tiles(self):
+        x, y = self._first_destructible()
+        self.game_map.destroy_wall(0, 0)  # parede sólida: nada muda
+        self.game_map.destroy_wall(x, y)
+        self.game_map.destroy_wall(x, y)
+        self.assertEqual(self.game_map._dirty_tiles, {(x, y)})
+
+    def test_same_seed_same_map(self):
+        other = GameMap(random.Random(3))
+        self.assertTrue(np.array_equal(self.game_map.tiles, other.tiles))
+
+    def test_border_and_pillars_are_solid(self):
+        tiles = self.game_map.tiles
+        self.assertTrue((tiles[0, :] == TILE_WALL).all())
+        self.assertTrue((tiles[:, -1] == TILE_WALL).all())
+        self.assertTrue(self.game_map.is_wall(2, 2))
+        self.assertTrue(self.game_map.is_wall(-1, 3))
+        self.assertFalse(self.game_map.is_destructible_wall(1, 1))
+
+    def test_bulk_queries_match_accessors(self):
+        for x, y in self.game_map.free_tiles():
+            self.assertFalse(self.game_map.is_wall(x, y))
+            self.assertFalse(self.game_map.is_destructible_wall(x, y))
+        for x, y in self.game_map.destructible_tiles():
+            self.assertTrue(self.game_map.is_destructible_wall(x, y))
+
+    def test_enemy_spawn_positions(self):
+        positions = self.game_map.get_enemy_spawn_positions()
+        self.assertEqual(len(positions), 5)
+        self.assertEqual(len(set(positions)), 5)
+        self.assertNotIn((1, 1), positions)
+        for x, y in positions:
+            self.assertTrue(self.game_map.can_place_bomb(x, y))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.game.actions import Action
+from src.game.game_engine import GameEngine
+from src.game.game_map import TILE_FLOOR, TILE_WALL
+from src.game.level import LevelPregenerator, LevelSpec, generate_level, reachable_mask
+from src.utils.constants import GAME_CONFIG
+
+
+class TestLevelGeneration(unittest.TestCase):
+    def test_same_seed_same_level(self):
+        a, b = generate_level(42, 5, 20, 15), generate_level(42, 5, 20, 15)
+        np.testing.assert_array_equal(a.tiles, b.tiles)
+        self.assertEqual(a.enemy_spawns, b.enemy_spawns)
+
+    def test_difficulty_grows_with_level(self):
+        first, last = LevelSpec(1, 20, 15), LevelSpec(GAME_CONFIG['LEVEL_COUNT'], 20, 15)
+        self.assertEqual(first.enemies, GAME_CONFIG['ENEMY_COUNT'])
+        self.assertEqual(first.solid_density, 0)
+        self.assertGreater(last.enemies, first.enemies)
+        self.assertGreater(last.density, first.density)
+        self.assertLessEqual(last.density, GAME_CONFIG['LEVEL_MAX_DENSITY'])
+
+    def test_enemy_count_is_capped_on_large_maps(self):
+        self.assertEqual(LevelSpec(1, 101, 101).enemies, GAME_CONFIG['LEVEL_MAX_ENEMIES'])
+        self.assertEqual(LevelSpec(1, 40, 30).enemies, 4 * GAME_CONFIG['ENEMY_COUNT'])
+
+    def test_reachable_mask_separates_pockets(self):
+        tiles = np.full((7, 9), TILE_FLOOR, dtype=np.uint8)
+        tiles[0, :] = tiles[-1, :] = tiles[:, 0] = tiles[:, -1] = TILE_WALL
+        # coluna sólida em x = 4 isola a metade direita; um bolsão em (2, 4)
+        tiles[:, 4] = TILE_WALL
+        tiles[3:6, 1:4] = TILE_WALL
+        tiles[4, 2] = TILE_FLOOR
+        expected = np.zeros_like(tiles, dtype=bool)
+        expected[1:6, 1:4] = True
+        expected[3:6, 1:4] = False
+        np.testing.assert_array_equal(reachable_mask(tiles), expected)
+        self.assertFalse(reachable_mask(tiles, (0, 0)).any())
+
+    def test_spawns_and_open_tiles_are_reachable(self):
+        for seed in range(20):
+            level = 1 + seed % GAME_CONFIG['LEVEL_COUNT']
+            plan = generate_level(seed, level, 20, 15)
+            reachable = reachable_mask(plan.tiles)
+            # nada aberto fora da componente do jogador
+            np.testing.assert_array_equal(reachable, plan.tiles != TILE_WALL)
+            self.assertEqual(len(plan.enemy_spawns), LevelSpec(level, 20, 15).enemies)
+            for gx, gy in plan.enemy_spawns:
+                self.assertEqual(plan.tiles[gy, gx], TILE_FLOOR)
+                self.assertGreaterEqual(abs(gx - 1) + abs(gy - 1), 4)
+            self.assertEqual(plan.tiles[1, 1], TILE_FLOOR)
+
+    def test_pregenerated_level_matches_inline(self):
+        levels = LevelPregenerator()
+        levels.prefetch(7, 3, 20, 15)
+        background = levels.take(7, 3, 20, 15)
+        inline = levels.take(7, 3, 20, 15)
+        self.assertEqual(levels.ready + levels.waited, 1)
+        self.assertEqual(levels.inline, 1)
+        np.testing.assert_array_equal(background.tiles, inline.tiles)
+        self.assertEqual(background.enemy_spawns, inline.enemy_spawns)
+
+
+class TestLevelProgression(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(GAME_CONFIG, {'LEVEL_COUNT': 3})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'],
+                                 headless=True, seed=11)
+
+    def clear_enemies(self):
+        for enemy in list(self.engine.enemies):
+            self.engine._remove_enemy(enemy)
+        self.engine.update(Action.NONE)
+
+    def test_clearing_enemies_advances_level(self):
+        engine = self.engine
+        engine.player.bomb_capacity = 3
+        engine.player.lives = 2
+        first_map = engine.game_map.tiles.copy()
+        self.clear_enemies()
+
+        self.assertEqual(engine.level, 2)
+        self.assertFalse(engine.victory)
+        self.assertEqual(engine.score, GAME_CONFIG['LEVEL_COMPLETE_BONUS'])
+        self.assertEqual(len(engine.enemies), LevelSpec(2, engine.game_map.width, engine.game_map.height).enemies)
+        self.assertFalse(np.array_equal(engine.game_map.tiles, first_map))
+        self.assertEqual((engine.player.bomb_capacity, engine.player.lives), (3, 2))
+        self.assertEqual(engine.player.get_position(), engine.game_map.grid_to_world(1, 1))
+        # o nível 2 foi gerado em segundo plano durante o nível 1
+        self.assertEqual(engine.levels.inline, 1)
+
+    def test_victory_after_last_level(self):
+        for _ in range(3):
+            self.assertFalse(self.engine.victory)
+            self.clear_enemies()
+        self.assertTrue(self.engine.victory)
+        self.assertEqual(self.engine.level, 3)
+
+    def test_same_seed_same_campaign(self):
+        self.clear_enemies()
+        other = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=11)
+        for enemy in list(other.enemies):
+            other._remove_enemy(enemy)
+        other.update(Action.NONE)
+        np.testing.assert_array_equal(other.game_map.tiles, self.engine.game_map.tiles)
+        self.assertEqual([e.get_position() for e in other.enemies],
+                         [e.get_position() for e in self.engine.enemies])
+
+
+if __name__ == "__main__":
+    unittest.main()
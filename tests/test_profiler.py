@@ -0,0 +1,141 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from src.game.actions import Action
+from src.game.game_engine import GameEngine
+from src.utils.profiler import PHASES, FrameProfiler, percentile
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.profiler = FrameProfiler(enabled=True, window=100, timer=self.timer)
+
+    def _frame(self, player_ms: float, map_ms: float):
+        self.profiler.begin()
+        self.timer.now += player_ms / 1000
+        self.profiler.lap("player")
+        self.timer.now += 5  # tempo fora das fases (ex.: espera do clock) não conta
+        self.profiler.begin()
+        self.timer.now += map_ms / 1000
+        self.profiler.lap("map")
+        self.profiler.end_frame()
+
+    def test_percentiles_per_phase(self):
+        for i in range(1, 101):
+            self._frame(player_ms=i, map_ms=2)
+        stats = self.profiler.percentiles("player")
+        self.assertAlmostEqual(stats["p50"], 51, places=3)
+        self.assertAlmostEqual(stats["p99"], 99, places=3)
+        self.assertAlmostEqual(self.profiler.percentiles("map")["p95"], 2, places=3)
+        self.assertAlmostEqual(self.profiler.percentiles("total")["p50"], 53, places=3)
+        self.assertEqual(self.profiler.frames, 100)
+
+    def test_disabled_records_nothing(self):
+        self.profiler.disable()
+        self._frame(player_ms=3, map_ms=1)
+        self.assertEqual(self.profiler.frames, 0)
+        self.assertEqual(self.profiler.percentiles("player")["p50"], 0.0)
+
+    def test_csv_stream(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.csv")
+            self.profiler.start_csv(path)
+            self._frame(player_ms=3, map_ms=1)
+            self._frame(player_ms=4, map_ms=1)
+            self.profiler.close()
+            with open(path) as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(set(f"{name}_ms" for name in PHASES) - set(rows[0]), set())
+        self.assertAlmostEqual(float(rows[1]["player_ms"]), 4.0)
+        self.assertAlmostEqual(float(rows[1]["total_ms"]), 5.0)
+
+    def test_percentile_nearest_rank(self):
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0], 50), 2.0)
+
+
+class TestEngineProfiling(unittest.TestCase):
+    def test_engine_phases_are_timed(self):
+        engine = GameEngine(800, 600, headless=True, seed=1234, profiler=FrameProfiler(enabled=True))
+        engine.toggle_profiler_overlay()
+        for _ in range(5):
+            engine.update(Action.RIGHT)
+            engine.render()
+        summary = engine.profiler.summary()
+        self.assertEqual(engine.profiler.frames, 5)
+        self.assertGreater(summary["enemies"]["p50"], 0.0)
+        self.assertGreater(summary["map"]["p50"], 0.0)
+        # 1º frame é completo; os seguintes enviam só as regiões alteradas
+        self.assertEqual(summary["pixels"]["p99"], 800 * 600)
+        self.assertLess(summary["pixels"]["p50"], 800 * 600)
+
+    def test_render_phases_get_their_own_time(self):
+        # cada etapa do render "custa" um valor distinto no relógio falso
+        timer = FakeTimer()
+        engine = GameEngine(800, 600, headless=True, seed=1234,
+                            profiler=FrameProfiler(enabled=True, timer=timer))
+        map_calls = []
+
+        def costing(method, seconds, calls=None):
+            def wrapper(*args, **kwargs):
+                timer.now += seconds
+                if calls is not None:
+                    calls.append(1)
+                return method(*args, **kwargs)
+            return wrapper
+
+        engine.game_map.blit_region = costing(engine.game_map.blit_region, 1.0, map_calls)
+        engine._overlay_items = costing(engine._overlay_items, 10.0)
+        engine._frame_layers = costing(engine._frame_layers, 100.0)
+        for mode in ("full", "dirty"):
+            engine.update(Action.RIGHT)
+            map_calls.clear()
+            engine.render()
+            self.assertEqual(engine.pixels_pushed == 800 * 600, mode == "full")
+            self.assertTrue(map_calls)
+            stats = {name: engine.profiler.percentiles(name)["p50"] / 1000.0
+                     for name in ("map", "hud", "entities", "flip")}
+            engine.profiler.reset()
+            self.assertEqual(stats, {"map": float(len(map_calls)), "hud": 10.0, "entities": 100.0, "flip": 0.0})
+
+    def test_overlay_toggle_keeps_profiler_running(self):
+        # --profile-csv: esconder o overlay (F3) não pode interromper a captura
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.csv")
+            profiler = FrameProfiler(enabled=True)
+            profiler.start_csv(path)
+            engine = GameEngine(800, 600, headless=True, seed=1234, profiler=profiler)
+            engine.toggle_profiler_overlay()
+            engine.toggle_profiler_overlay()
+            self.assertFalse(engine.show_profiler)
+            for _ in range(3):
+                engine.update(Action.RIGHT)
+                engine.render()
+            profiler.close()
+            with open(path, newline="") as file:
+                self.assertEqual(len(list(csv.reader(file))), 1 + 3)
+        self.assertTrue(profiler.enabled)
+
+    def test_overlay_does_not_enable_profiler(self):
+        engine = GameEngine(800, 600, headless=True, seed=1234)
+        engine.toggle_profiler_overlay()
+        engine.update(Action.RIGHT)
+        engine.render()
+        self.assertFalse(engine.profiler.enabled)
+        self.assertEqual(engine.profiler.frames, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
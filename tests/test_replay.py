@@ -0,0 +1,98 @@
+import random
+import struct
+import unittest
+import zlib
+from unittest import mock
+
+from src.game.actions import Action
+from src.game.game_engine import GameEngine
+from src.sim.replay import (_HEADER, MAGIC, Replay, ReplayDesyncError, ReplayError, ReplayPlayer,
+                            ReplayRecorder, state_checksum)
+from src.utils.constants import GAME_CONFIG
+
+
+def record_game(seed: int = 21, ticks: int = 900) -> tuple:
+    engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=seed)
+    recorder = ReplayRecorder(engine, checksum_interval=30)
+    policy = random.Random(seed)
+    move = Action.NONE
+    for tick in range(ticks):
+        if tick % 20 == 0:
+            move = policy.choice((Action.NONE, Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN))
+        engine.update(move | (Action.BOMB if policy.random() < 0.01 else 0))
+    return engine, recorder.replay
+
+
+class TestReplay(unittest.TestCase):
+    def test_round_trip_and_playback(self):
+        engine, replay = record_game()
+        data = replay.to_bytes()
+        loaded = Replay.from_bytes(data)
+        self.assertEqual(list(loaded.actions()), list(replay.actions()))
+        self.assertEqual(loaded.checksums, replay.checksums)
+        # ações repetidas viram poucas runs: bem menos que 1 byte por tick
+        self.assertLess(len(data), replay.ticks // 2)
+
+        played = ReplayPlayer(loaded).run()
+        self.assertEqual(state_checksum(played), state_checksum(engine))
+        self.assertEqual(played.score, engine.score)
+
+    def test_desync_is_detected(self):
+        _, replay = record_game()
+        # uma bomba a mais no 1º tick: o estado diverge já no 1º checksum
+        replay.runs[0][1] -= 1
+        replay.runs.insert(0, [replay.runs[0][0] | Action.BOMB, 1])
+        with self.assertRaises(ReplayDesyncError) as context:
+            ReplayPlayer(replay).run()
+        self.assertEqual(context.exception.tick, replay.checksum_interval)
+
+    def test_recording_stops_on_reset(self):
+        engine, replay = record_game(ticks=100)
+        engine.reset()
+        engine.update(Action.RIGHT)
+        self.assertLessEqual(replay.ticks, 100)
+
+    def test_config_overrides_travel_with_the_replay(self):
+        # ex.: python -m src.main --record ... --map-size 31x25
+        with mock.patch.dict(GAME_CONFIG, {'MAP_WIDTH': 31, 'MAP_HEIGHT': 25}):
+            engine, replay = record_game(ticks=300)
+        loaded = Replay.from_bytes(replay.to_bytes())
+        self.assertEqual(loaded.config, {'MAP_WIDTH': 31, 'MAP_HEIGHT': 25})
+
+        played = ReplayPlayer(loaded).run()
+        self.assertEqual(played.game_map.tiles.shape, (25, 31))
+        self.assertEqual(state_checksum(played), state_checksum(engine))
+        self.assertEqual(GAME_CONFIG['MAP_WIDTH'], 20)
+
+    def test_chasing_enemies_replay_without_flags(self):
+        # python -m src.main --record ... --enemy-ai chase
+        with mock.patch.dict(GAME_CONFIG, {'ENEMY_AI': 'chase'}):
+            engine, replay = record_game(ticks=300)
+        self.assertEqual(replay.config, {'ENEMY_AI': 'chase'})
+        played = ReplayPlayer(Replay.from_bytes(replay.to_bytes())).run()
+        self.assertEqual(state_checksum(played), state_checksum(engine))
+        self.assertEqual(GAME_CONFIG['ENEMY_AI'], 'wander')
+
+    def test_reads_version_1_files(self):
+        _, replay = record_game(ticks=100)
+        data = replay.to_bytes()
+        # v1: mesmo formato, sem o bloco de config (vazio aqui: varint 2 + "{}")
+        body = zlib.decompress(data[_HEADER.size:])[:-3]
+        header = _HEADER.pack(MAGIC, 1, replay.seed, replay.tick_rate, replay.checksum_interval,
+                              replay.ticks, replay.fingerprint)
+        loaded = Replay.from_bytes(header + zlib.compress(body))
+        self.assertEqual(loaded.config, {})
+        self.assertEqual(loaded.checksums, replay.checksums)
+        ReplayPlayer(loaded).run()
+
+    def test_rejects_invalid_files(self):
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(b"not a replay at all, definitely")
+        _, replay = record_game(ticks=30)
+        replay.fingerprint = b"\0" * 8
+        with self.assertRaises(ReplayError):
+            ReplayPlayer(replay)
+
+
+if __name__ == '__main__':
+    unittest.main()
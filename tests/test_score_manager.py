@@ -1,6 +1,8 @@
+import json
 import unittest
 import tempfile
 import os
+from unittest import mock
 from src.database.score_manager import ScoreManager
 
 
@@ -12,6 +14,7 @@ class TestScoreManager(unittest.TestCase):
     
     def tearDown(self):
         import shutil
+        self.score_manager.close()
         shutil.rmtree(self.temp_dir)
     
     def test_add_score(self):
@@ -66,6 +69,113 @@ class TestScoreManager(unittest.TestCase):
         self.assertEqual(stats["average_score"], 1000.0)
         self.assertEqual(stats["total_score"], 3000)
 
+    def test_reads_served_from_memory(self):
+        self.score_manager.add_score("Player1", 1000)
+        with mock.patch("src.database.score_manager.json.load") as load:
+            for _ in range(60):
+                self.score_manager.get_high_scores()
+            self.score_manager.is_high_score(10)
+            self.score_manager.get_player_stats("player1")
+            self.score_manager.get_database_stats()
+        load.assert_not_called()
+    
+    def test_external_change_invalidates_index(self):
+        self.score_manager.add_score("Player1", 1000)
+        self.score_manager.flush()
+        with open(self.db_path, "w") as file:
+            json.dump({"scores": [{"player_name": "Other", "score": 50, "date": ""},
+                                  {"player_name": "Edited", "score": 3000, "date": ""}]}, file)
+        stat = os.stat(self.db_path)
+        os.utime(self.db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        self.assertEqual(self.score_manager.get_high_scores(), [("Edited", 3000), ("Other", 50)])
+        self.assertEqual(self.score_manager.get_player_stats("Player1")["games_played"], 0)
+    
+    def test_close_flushes_background_writes(self):
+        for i in range(20):
+            self.score_manager.add_score(f"Player{i}", i * 10)
+        self.score_manager.close()
+        
+        reopened = ScoreManager(self.db_path, backend=self.score_manager.backend)
+        self.assertEqual(reopened.get_high_scores()[0], ("Player19", 190))
+        self.assertEqual(len(reopened.get_high_scores()), 10)
+        reopened.close()
+    
+    def test_corrupt_file_does_not_wipe_scores(self):
+        self.score_manager.add_score("Player1", 1000)
+        self.score_manager.flush()
+        with open(self.db_path, "w") as file:
+            file.write('{"scores": [{"player_na')   # escrita interrompida
+        
+        self.assertEqual(self.score_manager.get_high_scores(), [("Player1", 1000)])
+        self.assertTrue(os.path.exists(self.db_path + ".corrupt"))
+        self.score_manager.flush()
+        with open(self.db_path) as file:
+            self.assertEqual(json.load(file)["scores"][0]["score"], 1000)
+
+
+class TestSqliteScoreManager(TestScoreManager):
+    """Mesmo contrato do backend JSON, mais histórico completo e migração."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "test_scores.db")
+        self.score_manager = ScoreManager(self.db_path, backend="sqlite")
+    
+    def test_external_change_invalidates_index(self):
+        self.skipTest("o índice em memória é só do backend JSON")
+    
+    def test_corrupt_file_does_not_wipe_scores(self):
+        self.skipTest("escrita atômica em thread é só do backend JSON")
+    
+    def test_full_history_stats(self):
+        for i in range(15):
+            self.score_manager.add_score("Player1", i * 100)
+        self.score_manager.add_score("player1", 5000)
+        
+        stats = self.score_manager.get_player_stats("PLAYER1")
+        self.assertEqual(stats["games_played"], 16)
+        self.assertEqual(stats["total_score"], 15500)
+        self.assertEqual(stats["highest_score"], 5000)
+        
+        db_stats = self.score_manager.get_database_stats()
+        self.assertEqual(db_stats["total_games"], 16)
+        self.assertEqual(db_stats["unique_players"], 2)
+        self.assertEqual(db_stats["highest_score"], 5000)
+        
+        self.assertEqual(self.score_manager.get_rank(5001), 1)
+        self.assertEqual(self.score_manager.get_rank(1250), 4)  # 5000, 1400, 1300
+    
+    def test_history_survives_reopen_and_clear(self):
+        self.score_manager.add_score("Player1", 700)
+        self.score_manager.close()
+        self.score_manager = ScoreManager(self.db_path, backend="sqlite")
+        self.assertEqual(self.score_manager.get_high_scores(), [("Player1", 700)])
+        
+        self.score_manager.clear_all_scores()
+        self.assertEqual(self.score_manager.get_high_scores(), [])
+        self.assertEqual(self.score_manager.get_database_stats()["total_games"], 0)
+    
+    def test_migrates_sibling_json(self):
+        json_manager = ScoreManager(os.path.join(self.temp_dir, "legacy.json"))
+        json_manager.add_score("Old", 300)
+        json_manager.add_score("Older", 900)
+        json_manager.close()
+        
+        db_path = os.path.join(self.temp_dir, "legacy.db")
+        migrated = ScoreManager(db_path, backend="sqlite")
+        self.assertEqual(migrated.get_high_scores(), [("Older", 900), ("Old", 300)])
+        migrated.close()
+        
+        # reabrir não importa de novo
+        migrated = ScoreManager(db_path, backend="sqlite")
+        self.assertEqual(migrated.get_database_stats()["total_games"], 2)
+        migrated.close()
+    
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            ScoreManager(self.db_path, backend="csv")
+
 
 if __name__ == "__main__":
     unittest.main()
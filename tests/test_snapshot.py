@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from src.game.actions import Action
+from src.game.game_engine import GameEngine
+from src.game.powerup import PowerUp, PowerUpType
+from src.game.snapshot import SnapshotError
+from src.sim.replay import ReplayRecorder, state_checksum
+from src.utils.constants import GAME_CONFIG
+
+
+def scripted_actions(seed: int, ticks: int) -> list:
+    policy = random.Random(seed)
+    actions = []
+    move = Action.NONE
+    for tick in range(ticks):
+        if tick % 20 == 0:
+            move = policy.choice((Action.NONE, Action.LEFT, Action.RIGHT, Action.UP, Action.DOWN))
+        actions.append(move | (Action.BOMB if policy.random() < 0.05 else 0))
+    return actions
+
+
+def make_engine(seed: int = 5) -> GameEngine:
+    return GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=seed)
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_restore_then_same_actions_matches_uninterrupted_game(self):
+        actions = scripted_actions(5, 400)
+        reference = make_engine()
+        for action in actions:
+            reference.update(action)
+
+        # snapshots a cada 7 ticks pegam bombas e chamas no meio do caminho
+        for split in range(0, 120, 7):
+            engine = make_engine()
+            for action in actions[:split]:
+                engine.update(action)
+            data = engine.snapshot()
+            other = make_engine(seed=99)
+            other.restore(data)
+            self.assertEqual(other.snapshot(), data)
+            for action in actions[split:]:
+                other.update(action)
+            self.assertEqual(state_checksum(other), state_checksum(reference))
+            self.assertEqual(other.snapshot(), reference.snapshot())
+
+    def test_clone_is_independent(self):
+        engine = make_engine()
+        for action in scripted_actions(6, 90):
+            engine.update(action)
+        before = engine.snapshot()
+        clone = engine.clone()
+        self.assertTrue(clone.headless)
+        for _ in range(30):
+            clone.update(Action.RIGHT | Action.BOMB)
+        self.assertEqual(engine.snapshot(), before)
+        self.assertNotEqual(clone.snapshot(), before)
+
+    def test_powerups_and_player_state_round_trip(self):
+        engine = make_engine()
+        powerup = PowerUp(3, 1, PowerUpType.SPEED)
+        engine.powerups.append(powerup)
+        engine.powerup_index.add(powerup, (3, 1))
+        engine.player.soft_bomb_tile = (1, 1)
+        engine.player.flame_radius = 4
+        engine.death_cause = "flame"
+
+        clone = engine.clone()
+        self.assertEqual([(p.grid_x, p.grid_y, p.ptype) for p in clone.powerups], [(3, 1, PowerUpType.SPEED)])
+        self.assertEqual(list(clone.powerup_index.at(3, 1)), clone.powerups)
+        self.assertEqual(clone.player.soft_bomb_tile, (1, 1))
+        self.assertEqual(clone.player.flame_radius, 4)
+        self.assertEqual(clone.death_cause, "flame")
+
+    def test_restore_stops_recording(self):
+        engine = make_engine()
+        recorder = ReplayRecorder(engine)
+        engine.update(Action.RIGHT)
+        engine.restore(make_engine().snapshot())
+        engine.update(Action.RIGHT)
+        self.assertEqual(recorder.replay.ticks, 1)
+
+    def test_rejects_invalid_data(self):
+        engine = make_engine()
+        data = engine.snapshot()
+        with self.assertRaises(SnapshotError):
+            engine.restore(b"BMSS")
+        with self.assertRaises(SnapshotError):
+            engine.restore(b"XXXX" + data[4:])
+        with self.assertRaises(SnapshotError):
+            engine.restore(data[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
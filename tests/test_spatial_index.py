@@ -0,0 +1,33 @@
+import unittest
+from src.game.spatial_index import SpatialIndex
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SpatialIndex(40)
+        self.a = object()
+        self.b = object()
+
+    def test_add_move_remove(self):
+        self.index.add(self.a, (1, 1))
+        self.index.add(self.b, (1, 1))
+        self.assertEqual(list(self.index.at(1, 1)), [self.a, self.b])
+
+        self.index.move(self.a, (2, 1))
+        self.assertEqual(list(self.index.at(1, 1)), [self.b])
+        self.assertEqual(self.index.tile_of(self.a), (2, 1))
+
+        self.index.remove(self.b)
+        self.assertEqual(list(self.index.at(1, 1)), [])
+        self.assertEqual(len(self.index), 1)
+
+    def test_query_rect(self):
+        self.index.add(self.a, (1, 1))
+        self.index.add(self.b, (3, 3))
+        # retângulo 34x34 em (70, 70) toca os tiles (1..2, 1..2)
+        self.assertEqual(list(self.index.query_rect(70, 70, 34, 34)), [self.a])
+        self.assertEqual(set(self.index.query_rect(40, 40, 100, 100)), {self.a, self.b})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import pygame
+
+from src.game.player import Player
+from src.game.powerup import PowerUp, PowerUpType
+from src.utils.constants import COLORS, GAME_CONFIG
+from src.utils.sprite_atlas import TILE_SPRITES, SpriteAtlas, atlas
+
+
+class TestSpriteAtlas(unittest.TestCase):
+    def test_builds_once_with_every_sprite(self):
+        sprites = SpriteAtlas()
+        first = sprites.sprites()
+        self.assertIs(sprites.sprites(), first)
+        self.assertEqual(sprites.builds, 1)
+        ts = GAME_CONFIG['TILE_SIZE']
+        for name in TILE_SPRITES + ("flame",):
+            self.assertEqual(first[name].get_size(), (ts, ts))
+        for ptype in (PowerUpType.BOMB, PowerUpType.FIRE, PowerUpType.SPEED, PowerUpType.HEART):
+            self.assertIn(PowerUp(1, 1, ptype).sprite_name, first)
+        for name in ("bomb", "enemy", "player", "player_invincible"):
+            self.assertEqual(first[name].get_size(), (ts - 6, ts - 6))
+
+    def test_invincible_variant_is_cyan(self):
+        player = Player(2, 2, GAME_CONFIG['PLAYER_SPEED'])
+        self.assertEqual(player.sprite_name, "player")
+        player.invincible_until = float("inf")
+        self.assertEqual(player.sprite_name, "player_invincible")
+        screen = pygame.Surface((200, 200))
+        player.render(screen)
+        self.assertEqual(tuple(screen.get_at(player.rect.center))[:3], COLORS['CYAN'])
+
+    def test_flame_overlay_merges_overlapping_tiles(self):
+        ts = GAME_CONFIG['TILE_SIZE']
+        cross = [(3, 2), (2, 3), (3, 3), (4, 3), (3, 4)]
+        surface, pos = atlas.flame_overlay(cross + [(3, 3), (4, 3)])
+        self.assertEqual(pos, (2 * ts, 2 * ts))
+        self.assertEqual(surface.get_size(), (3 * ts, 3 * ts))
+        self.assertEqual(surface.get_alpha(), 180)
+
+        screen = pygame.Surface((6 * ts, 6 * ts))
+        screen.blit(surface, pos)
+        centre = screen.get_at((3 * ts + 5, 3 * ts + 5))
+        # tile repetido é misturado uma vez, igual aos demais
+        self.assertEqual(centre, screen.get_at((4 * ts + 5, 3 * ts + 5)))
+        self.assertNotEqual(tuple(centre)[:3], (0, 0, 0))
+        # cantos fora da cruz ficam transparentes
+        self.assertEqual(tuple(screen.get_at((2 * ts + 5, 2 * ts + 5)))[:3], (0, 0, 0))
+
+if __name__ == "__main__":
+    unittest.main()
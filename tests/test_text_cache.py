@@ -0,0 +1,35 @@
+import unittest
+from src.utils.text_cache import FontRegistry, TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        self.fonts = FontRegistry()
+        self.cache = TextCache(self.fonts, max_entries=2)
+
+    def test_hits_and_misses(self):
+        first = self.cache.render("Score: 0", 36, (255, 255, 255))
+        second = self.cache.render("Score: 0", 36, (255, 255, 255))
+        self.assertIs(first, second)
+        self.cache.render("Score: 0", 36, (255, 0, 0))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertAlmostEqual(self.cache.hit_rate, 1 / 3)
+
+    def test_lru_eviction(self):
+        white = (255, 255, 255)
+        a = self.cache.render("a", 24, white)
+        self.cache.render("b", 24, white)
+        self.cache.render("a", 24, white)   # "a" passa a ser o mais recente
+        self.cache.render("c", 24, white)   # expulsa "b"
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertIs(self.cache.render("a", 24, white), a)
+        self.assertEqual(self.cache.stats()["entries"], 2)
+
+    def test_font_registry_shares_fonts(self):
+        self.assertIs(self.fonts.get(24), self.fonts.get(24))
+        self.assertIsNot(self.fonts.get(24), self.fonts.get(36))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest import mock
+import numpy as np
+from src.game.actions import Action
+from src.game.game_engine import GameEngine
+from src.sim.vec_env import VecBombermanEnv, OBS_CHANNELS
+from src.utils.constants import GAME_CONFIG
+
+
+class TestVecBombermanEnv(unittest.TestCase):
+    def setUp(self):
+        self.env = VecBombermanEnv(3)
+        self.obs = self.env.reset([1, 2, 3])
+
+    @mock.patch.dict(GAME_CONFIG, {'ENEMY_AI': 'chase'})
+    def test_refuses_chasing_enemies(self):
+        with self.assertRaises(ValueError):
+            VecBombermanEnv(3)
+
+    def test_reset_matches_engine_generation(self):
+        engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=2)
+        self.assertTrue(np.array_equal(self.env.tiles[1], engine.game_map.tiles))
+        self.assertEqual(sorted(zip(self.env.enemy_x[1], self.env.enemy_y[1])),
+                         sorted(e.get_position() for e in engine.enemies))
+        self.assertEqual(self.obs.shape, (3, len(OBS_CHANNELS), self.env.height, self.env.width))
+
+    def test_player_and_bombs_follow_engine_rules(self):
+        engine = GameEngine(GAME_CONFIG['SCREEN_WIDTH'], GAME_CONFIG['SCREEN_HEIGHT'], headless=True, seed=1)
+        actions = [Action.RIGHT] * 10 + [Action.DOWN] * 10 + [Action.BOMB] + [Action.UP] * 30 \
+            + [Action.LEFT] * 30 + [Action.NONE] * 130
+        for action in actions:
+            engine.update(action)
+            self.env.step([action] * 3)
+            self.assertEqual((self.env.player_x[0], self.env.player_y[0]), engine.player.get_position())
+            self.assertEqual(int(self.env.bomb_active[0].sum()), len(engine.bombs))
+            self.assertEqual(int(self.env.score[0]), engine.score)
+
+    def test_finished_games_auto_reset(self):
+        self.env.step([Action.NONE] * 3)
+        self.env.enemy_alive[2] = False
+        obs, rewards, dones, info = self.env.step([Action.NONE] * 3)
+        self.assertEqual(dones.tolist(), [False, False, True])
+        self.assertEqual(rewards[2], GAME_CONFIG['LEVEL_COMPLETE_BONUS'])
+        self.assertEqual(info["final_score"][2], GAME_CONFIG['LEVEL_COMPLETE_BONUS'])
+        self.assertEqual(self.env.ticks[2], 0)
+        self.assertTrue(self.env.enemy_alive[2].any())
+
+
+if __name__ == "__main__":
+    unittest.main()